@@ -1,4 +1,45 @@
-from .inputobjecttype import PydanticInputObjectType
-from .objecttype import PydanticObjectType
+# Not `typing.TYPE_CHECKING`, so as not to import `typing` either
+TYPE_CHECKING = False
+if TYPE_CHECKING:  # pragma: no cover
+    from .bulk import register_models
+    from .columnar import ColumnarResult
+    from .inputobjecttype import PydanticInputObjectType
+    from .interface import PydanticInterface
+    from .mutation import PydanticMutation
+    from .objecttype import PydanticObjectType
 
-__all__ = ["PydanticObjectType", "PydanticInputObjectType"]
+# The modules our public names live in: they (and Graphene and Pydantic with
+# them) are only imported when first used, so importing the package is cheap
+_LAZY_ATTRIBUTES = {
+    "ColumnarResult": "columnar",
+    "PydanticInputObjectType": "inputobjecttype",
+    "PydanticInterface": "interface",
+    "PydanticMutation": "mutation",
+    "PydanticObjectType": "objecttype",
+    "register_models": "bulk",
+}
+
+__all__ = [
+    "PydanticObjectType",
+    "PydanticInputObjectType",
+    "PydanticInterface",
+    "PydanticMutation",
+    "ColumnarResult",
+    "register_models",
+]
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # `__import__` rather than `importlib`, so `-X importtime` can see it
+    module = __import__(module_name, globals(), None, (name,), 1)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,114 @@
+"""
+Complete lists of `Int` or `Float` values in bulk when they're resolved as
+numeric arrays: `array.array`, `memoryview`, NumPy arrays, or anything else
+supporting the buffer protocol.
+
+graphql-core completes lists one item at a time, calling the item type's
+`serialize()` on each, which dominates the time spent on fields with thousands
+of points. A one-dimensional numeric buffer can only hold numbers, so all that
+needs checking is the range of the values (for `Int`) or that they're finite
+(for `Float`), which we do in one pass over a list made by the buffer itself.
+Buffers that don't pass are left to graphql-core, which reports the errors.
+"""
+import math
+import typing as T
+
+from graphql import (
+    GraphQLFloat,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLOutputType,
+)
+from graphql.execution import ExecutionContext
+from graphql.type.scalars import GRAPHQL_MAX_INT, GRAPHQL_MIN_INT
+
+# The `struct` formats of the buffers we complete in bulk
+FLOAT_FORMATS = frozenset("fd")
+INT_FORMATS = frozenset("bBhHiIlLqQnN")
+NUMERIC_FORMATS = FLOAT_FORMATS | INT_FORMATS
+
+
+def _to_list(value: T.Any) -> T.Optional[T.Tuple[str, T.List[T.Any]]]:
+    """Return the format and the items of `value`, if it's a 1-d numeric buffer."""
+    if isinstance(value, (list, tuple)):
+        return None
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return None
+    # (Non-native formats are prefixed with their byte order, and can't be
+    # converted to lists anyway)
+    format = view.format.lstrip("@")
+    if view.ndim != 1 or format not in NUMERIC_FORMATS:
+        return None
+    return format, view.tolist()
+
+
+def serialize_float_array(value: T.Any) -> T.Optional[T.List[float]]:
+    """
+    Serialize a numeric buffer as a list of `Float` values, as
+    `GraphQLFloat.serialize()` would serialize each item. Returns None if
+    `value` isn't a buffer, or if any of its values can't be represented.
+    """
+    converted = _to_list(value)
+    if converted is None:
+        return None
+    format, values = converted
+    if format in INT_FORMATS:
+        return list(map(float, values))
+    # The sum is only infinite or NaN if some value is (or if it overflows)
+    if not math.isfinite(sum(values)) and not all(map(math.isfinite, values)):
+        return None
+    return values
+
+
+def serialize_int_array(value: T.Any) -> T.Optional[T.List[int]]:
+    """
+    Serialize a numeric buffer of integers as a list of `Int` values, as
+    `GraphQLInt.serialize()` would serialize each item. Returns None if `value`
+    isn't such a buffer, or if any of its values is out of range.
+    """
+    converted = _to_list(value)
+    if converted is None:
+        return None
+    format, values = converted
+    if format not in INT_FORMATS:
+        return None
+    if values and (min(values) < GRAPHQL_MIN_INT or max(values) > GRAPHQL_MAX_INT):
+        return None
+    return values
+
+
+def get_array_serializer(
+    item_type: GraphQLOutputType,
+) -> T.Optional[T.Callable[[T.Any], T.Optional[T.List[T.Any]]]]:
+    """Return the bulk serializer for lists of `item_type`, if there's one."""
+    if isinstance(item_type, GraphQLNonNull):
+        item_type = item_type.of_type
+    if item_type is GraphQLFloat:
+        return serialize_float_array
+    if item_type is GraphQLInt:
+        return serialize_int_array
+    return None
+
+
+class ArrayExecutionContext(ExecutionContext):
+    """
+    An execution context that completes lists of `Int` or `Float` values
+    resolved as numeric buffers in bulk (see `serialize_float_array()` and
+    `serialize_int_array()`). Use it with e.g.
+    `schema.execute(query, execution_context_class=ArrayExecutionContext)`.
+
+    `CompiledExecutionContext` and `JSONExecutionContext` do the same.
+    """
+
+    def complete_list_value(
+        self, return_type: GraphQLList, field_nodes, info, path, result
+    ):
+        serialize = get_array_serializer(return_type.of_type)
+        if serialize is not None:
+            serialized = serialize(result)
+            if serialized is not None:
+                return serialized
+        return super().complete_list_value(return_type, field_nodes, info, path, result)
@@ -0,0 +1,231 @@
+"""
+Register many Pydantic models at once.
+
+Declaring a `PydanticObjectType` for each model one at a time, in whatever
+order the modules happen to be imported in, leaves placeholders for every model
+that's referred to before its type exists, and each of those fields has to be
+converted again by `resolve_placeholders()`. `register_models()` instead looks
+at which models refer to which, and creates their types in dependency order, so
+that only the fields that are part of a reference cycle ever see a placeholder.
+"""
+import inspect
+import sys
+import threading
+import types
+import typing as T
+
+import pydantic
+
+from .converters import is_parametrized_generic_model
+from .inputobjecttype import PydanticInputObjectType
+from .objecttype import PydanticObjectType
+from .registry import Placeholder, Registry, get_global_registry
+from .util import evaluate_forward_ref
+
+ModelType = T.Type[pydantic.BaseModel]
+BaseType = T.Type[T.Union[PydanticObjectType, PydanticInputObjectType]]
+
+# The models whose nested input types are being created (see
+# `create_nested_input_types()`) in its `models` attribute, by the current
+# thread, which mustn't get a type of their own while they're at it
+_nested_creation = threading.local()
+
+
+def _is_model(type_: T.Any) -> bool:
+    return inspect.isclass(type_) and issubclass(type_, pydantic.BaseModel)
+
+
+def _module_models(module: types.ModuleType) -> T.List[ModelType]:
+    """The (non-generic) models defined in `module`, in the order they're defined in."""
+    return [
+        value
+        for value in vars(module).values()
+        if _is_model(value)
+        and value.__module__ == module.__name__
+        and not value.__pydantic_generic_metadata__["parameters"]
+    ]
+
+
+def _annotations(model: ModelType, computed_fields: bool) -> T.List[T.Any]:
+    annotations = [field.annotation for field in model.model_fields.values()]
+    if computed_fields:
+        annotations.extend(
+            field.return_type for field in model.model_computed_fields.values()
+        )
+    return annotations
+
+
+def get_model_dependencies(
+    model: ModelType, computed_fields: bool = True
+) -> T.List[ModelType]:
+    """
+    Return the models the fields of `model` refer to (in the order they're
+    referred to), looking through containers, unions, forward references and
+    parametrized generic models.
+    """
+    namespace = sys.modules[model.__module__].__dict__
+    found: T.Dict[ModelType, None] = {}
+    seen_generics = set()
+    stack = list(reversed(_annotations(model, computed_fields)))
+    while stack:
+        type_ = stack.pop()
+        if isinstance(type_, str):
+            type_ = T.ForwardRef(type_)
+        if isinstance(type_, T.ForwardRef):
+            try:
+                type_ = evaluate_forward_ref(type_, namespace, None)
+            except Exception:
+                # Leave it for the conversion to report
+                continue
+        if _is_model(type_):
+            if not is_parametrized_generic_model(type_):
+                found.setdefault(type_)
+            elif type_ not in seen_generics:
+                # Its type is created when it's first converted, from the models
+                # it's parametrized with
+                seen_generics.add(type_)
+                stack.extend(reversed(_annotations(type_, computed_fields)))
+        elif T.get_origin(type_) is not T.Literal:
+            stack.extend(reversed(T.get_args(type_)))
+    found.pop(model, None)
+    return list(found)
+
+
+def sort_models(
+    models: T.Iterable[ModelType],
+    registry: T.Optional[Registry] = None,
+    computed_fields: bool = True,
+    exclude: T.Iterable[ModelType] = (),
+) -> T.List[ModelType]:
+    """
+    Return `models`, and the models they refer to that have no type in
+    `registry` yet, in dependency order: each model comes after the ones it
+    refers to, except where they refer to each other. The models in `exclude`
+    (and the models only they refer to) are left out.
+    """
+
+    def dependencies(model: ModelType) -> T.Iterator[ModelType]:
+        for dependency in get_model_dependencies(model, computed_fields):
+            existing = registry.get_type_for_model(dependency) if registry else None
+            if existing is None or isinstance(existing, Placeholder):
+                yield dependency
+
+    order: T.List[ModelType] = []
+    visited: T.Set[ModelType] = set(exclude)
+    for root in models:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, dependencies(root))]
+        while stack:
+            model, remaining = stack[-1]
+            for dependency in remaining:
+                if dependency not in visited:
+                    visited.add(dependency)
+                    stack.append((dependency, dependencies(dependency)))
+                    break
+            else:
+                stack.pop()
+                order.append(model)
+    return order
+
+
+def register_models(
+    models: T.Union[types.ModuleType, T.Iterable[ModelType]],
+    base: BaseType = PydanticObjectType,
+    registry: T.Optional[Registry] = None,
+    **options,
+) -> T.Dict[ModelType, BaseType]:
+    """
+    Create a subclass of `base` for each of `models` (or each model defined in a
+    module) that doesn't have a type in the registry yet, and for each of the
+    models they refer to. The types are named after their models (with an
+    `Input` suffix for input object types) and any extra keyword arguments are
+    used as their `Meta` options.
+
+    The types are created in dependency order (see `sort_models()`), so each
+    field is converted once; the fields that are part of a reference cycle get
+    a placeholder, which is resolved in a single pass at the end. Returns the
+    types of `models` and of any other models types were created for.
+    """
+    if isinstance(models, types.ModuleType):
+        models = _module_models(models)
+    models = list(models)
+    if registry is None:
+        registry = get_global_registry(
+            PydanticInputObjectType
+            if issubclass(base, PydanticInputObjectType)
+            else PydanticObjectType
+        )
+
+    created = _create_types(
+        sort_models(
+            models,
+            registry,
+            computed_fields=issubclass(base, PydanticObjectType)
+            and options.get("computed_fields", False),
+        ),
+        base,
+        registry,
+        options,
+    )
+    result = {model: registry.get_type_for_model(model) for model in models}
+    result.update(created)
+    return result
+
+
+def create_nested_input_types(
+    model: ModelType, registry: Registry, **options
+) -> T.Dict[ModelType, BaseType]:
+    """
+    Create a `PydanticInputObjectType` for each model that `model` refers to
+    (and so on) that doesn't have a type in `registry` yet, as
+    `register_models()` does, leaving out `model` itself. Returns the new types.
+    """
+    creating = getattr(_nested_creation, "models", None)
+    if creating is None:
+        creating = _nested_creation.models = set()
+    order = sort_models(
+        get_model_dependencies(model, computed_fields=False),
+        registry,
+        computed_fields=False,
+        exclude=(model, *creating),
+    )
+    creating.add(model)
+    try:
+        return _create_types(order, PydanticInputObjectType, registry, options)
+    finally:
+        creating.discard(model)
+
+
+def _create_types(
+    models: T.Iterable[ModelType],
+    base: BaseType,
+    registry: Registry,
+    options: T.Dict[str, T.Any],
+) -> T.Dict[ModelType, BaseType]:
+    created = {}
+    for model in models:
+        existing = registry.get_type_for_model(model)
+        if existing is not None and not isinstance(existing, Placeholder):
+            continue
+        name = model.__name__
+        if issubclass(base, PydanticInputObjectType):
+            name += "Input"
+        meta = type(
+            "Meta", (), {"model": model, "registry": registry, "name": name, **options}
+        )
+        created[model] = type(
+            name,
+            (base,),
+            {"Meta": meta, "__doc__": model.__doc__, "__module__": model.__module__},
+        )
+
+    # The one pass over the placeholders left by cycles (or by types declared
+    # before these)
+    to_resolve = dict.fromkeys(created.values())
+    for model in created:
+        to_resolve.update(dict.fromkeys(registry.get_dependents(model)))
+    for obj_type in to_resolve:
+        obj_type.resolve_placeholders()
+    return created
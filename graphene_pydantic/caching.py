@@ -0,0 +1,278 @@
+"""
+Caching of the resolved sub-results of frozen Pydantic models across requests.
+
+Frozen models are immutable and hashable, so for a given selection of their
+fields they always resolve to the same result (as long as their resolvers only
+depend on the model). Types opt in by setting `fragment_cache` in their `Meta`,
+and the cache is used when executing with `CachingExecutionContext`.
+"""
+import collections
+import threading
+import typing as T
+
+import pydantic
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    ListValueNode,
+    ObjectValueNode,
+    SelectionSetNode,
+    ValueNode,
+    VariableNode,
+    print_ast,
+)
+from graphql.execution import ExecutionContext
+
+_MISSING = object()
+
+
+class FragmentCacheInfo(T.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    oversized: int
+    maxsize: int
+    currsize: int
+
+
+def result_size(result: T.Any) -> int:
+    """Count the values in a (JSON-like) result, however deeply nested."""
+    if isinstance(result, dict):
+        return 1 + sum(result_size(v) for v in result.values())
+    if isinstance(result, list):
+        return 1 + sum(result_size(v) for v in result)
+    return 1
+
+
+class FragmentCache:
+    """
+    A thread-safe LRU cache of the resolved sub-results of frozen models, with
+    hit and miss counts (see `info()`).
+
+    At most `maxsize` results are kept, and results with more than
+    `max_result_size` values (see `result_size()`) aren't kept at all.
+    """
+
+    def __init__(self, maxsize: int = 1024, max_result_size: int = 1000):
+        self.maxsize = maxsize
+        self.max_result_size = max_result_size
+        self._results: T.OrderedDict[T.Hashable, T.Any] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.oversized = 0
+
+    def get(self, key: T.Hashable, default: T.Any = None) -> T.Any:
+        with self._lock:
+            try:
+                result = self._results[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._results.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: T.Hashable, result: T.Any):
+        if result_size(result) > self.max_result_size:
+            with self._lock:
+                self.oversized += 1
+            return
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = self.evictions = self.oversized = 0
+
+    def info(self) -> FragmentCacheInfo:
+        with self._lock:
+            return FragmentCacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.oversized,
+                self.maxsize,
+                len(self._results),
+            )
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+def _collect_variables(value: ValueNode, names: T.Set[str]):
+    if isinstance(value, VariableNode):
+        names.add(value.name.value)
+    elif isinstance(value, ListValueNode):
+        for v in value.values:
+            _collect_variables(v, names)
+    elif isinstance(value, ObjectValueNode):
+        for f in value.fields:
+            _collect_variables(f.value, names)
+
+
+def normalize_selection_set(
+    selection_set: SelectionSetNode,
+    fragments: T.Mapping[str, FragmentDefinitionNode],
+    variables: T.Set[str],
+) -> tuple:
+    """
+    Return a hashable key for a selection set that's the same for equivalent
+    selections in any document, expanding fragment spreads, and adding the
+    names of any variables it uses to `variables`.
+    """
+    key = []
+    for selection in selection_set.selections:
+        for directive in selection.directives or ():
+            for arg in directive.arguments:
+                _collect_variables(arg.value, variables)
+        directives = tuple(print_ast(d) for d in selection.directives or ())
+        if isinstance(selection, FieldNode):
+            for arg in selection.arguments:
+                _collect_variables(arg.value, variables)
+            key.append(
+                (
+                    selection.alias.value if selection.alias else None,
+                    selection.name.value,
+                    tuple(print_ast(arg) for arg in selection.arguments),
+                    directives,
+                    normalize_selection_set(
+                        selection.selection_set, fragments, variables
+                    )
+                    if selection.selection_set
+                    else None,
+                )
+            )
+        elif isinstance(selection, InlineFragmentNode):
+            key.append(
+                (
+                    "...",
+                    selection.type_condition.name.value
+                    if selection.type_condition
+                    else None,
+                    directives,
+                    normalize_selection_set(
+                        selection.selection_set, fragments, variables
+                    ),
+                )
+            )
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = fragments[selection.name.value]
+            key.append(
+                (
+                    "...",
+                    fragment.type_condition.name.value,
+                    directives,
+                    normalize_selection_set(
+                        fragment.selection_set, fragments, variables
+                    ),
+                )
+            )
+    return tuple(key)
+
+
+class CachingExecutionContext(ExecutionContext):
+    """
+    An execution context that reuses the cached results of the frozen models
+    whose types have a `fragment_cache`, and caches the results it completes
+    for them (unless they had errors). Use it with e.g.
+    `schema.execute(query, execution_context_class=CachingExecutionContext)`.
+
+    Results are cached by type, model instance, and sub-selection (with any
+    fragments expanded, along with the values of any variables it uses), and
+    are shared between responses, so they mustn't be modified.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._fragment_caches: T.Dict[GraphQLObjectType, T.Optional[FragmentCache]] = {}
+        self._selection_keys: T.Dict[T.Hashable, T.Hashable] = {}
+
+    def _get_fragment_cache(
+        self, return_type: GraphQLObjectType
+    ) -> T.Optional[FragmentCache]:
+        try:
+            return self._fragment_caches[return_type]
+        except KeyError:
+            graphene_type = getattr(return_type, "graphene_type", None)
+            meta = getattr(graphene_type, "_meta", None)
+            cache = self._fragment_caches[return_type] = getattr(
+                meta, "fragment_cache", None
+            )
+            return cache
+
+    def _error_count(self) -> int:
+        # Newer versions of graphql-core collect the errors separately
+        collected_errors = getattr(self, "collected_errors", None)
+        if collected_errors is not None:
+            return len(collected_errors.errors)
+        return len(self.errors)
+
+    def _selection_key(
+        self, return_type: GraphQLObjectType, field_nodes: T.List[FieldNode]
+    ) -> T.Hashable:
+        # Only worked out once per execution for each set of field nodes (see
+        # `collect_subfields()`)
+        ids = (return_type, *map(id, field_nodes))
+        try:
+            return self._selection_keys[ids]
+        except KeyError:
+            pass
+        variables: T.Set[str] = set()
+        selections = tuple(
+            normalize_selection_set(node.selection_set, self.fragments, variables)
+            for node in field_nodes
+            if node.selection_set
+        )
+        key = self._selection_keys[ids] = (
+            return_type.name,
+            selections,
+            tuple(
+                (name, repr(self.variable_values.get(name)))
+                for name in sorted(variables)
+            ),
+        )
+        return key
+
+    def complete_object_value(
+        self,
+        return_type: GraphQLObjectType,
+        field_nodes: T.List[FieldNode],
+        info,
+        path,
+        result: T.Any,
+    ):
+        cache = self._get_fragment_cache(return_type)
+        if (
+            cache is None
+            or not isinstance(result, pydantic.BaseModel)
+            or not result.model_config.get("frozen")
+        ):
+            return super().complete_object_value(
+                return_type, field_nodes, info, path, result
+            )
+
+        key = (self._selection_key(return_type, field_nodes), result)
+        try:
+            completed = cache.get(key, _MISSING)
+        except TypeError:
+            # a frozen model can still hold unhashable values
+            return super().complete_object_value(
+                return_type, field_nodes, info, path, result
+            )
+        if completed is not _MISSING:
+            return completed
+
+        error_count = self._error_count()
+        completed = super().complete_object_value(
+            return_type, field_nodes, info, path, result
+        )
+        if not self.is_awaitable(completed) and self._error_count() == error_count:
+            cache.put(key, completed)
+        return completed
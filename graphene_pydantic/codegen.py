@@ -0,0 +1,547 @@
+"""
+Ahead-of-time generation of plain Graphene type modules.
+
+Building `PydanticObjectType`s means converting every field of every model at
+import time. This module walks the registries populated by those types and
+writes out a Python module declaring the equivalent plain Graphene types, so
+that production code can import the generated module instead:
+
+    python -m graphene_pydantic.codegen myapp.types -o myapp/graphql_types.py
+
+The generated module records a fingerprint of each model it was generated from
+and checks them when imported, raising `GeneratedCodeOutOfDateError` if any of
+the models have changed since. Pass `--check` to compare an existing generated
+module against what would be generated now (e.g. in CI).
+"""
+import argparse
+import ast
+import builtins
+import collections.abc
+import enum
+import functools
+import importlib
+import inspect
+import sys
+import typing as T
+
+import graphene
+import pydantic
+from graphene.types.structures import Structure
+
+from .columnar import ColumnarRow
+from .converters import (
+    PYTHON10,
+    Annotated,
+    ConversionError,
+    get_args,
+    get_origin,
+    is_parametrized_generic_model,
+)
+from .inputobjecttype import PydanticInputObjectType
+from .interface import PydanticInterface
+from .objecttype import PydanticObjectType, has_required_keys
+from .registry import Placeholder, Registry, get_global_registry
+from .util import model_fingerprint
+
+if PYTHON10:
+    from types import UnionType
+
+HEADER = """\
+# This module was generated by graphene_pydantic.codegen; do not edit it by hand.
+# Regenerate it whenever the Pydantic models it was generated from change.
+"""
+
+
+# The `typing` names of the generic classes, which (unlike the classes
+# themselves) can be subscripted on any Python version we support
+_TYPING_ALIASES = {
+    get_origin(getattr(T, name)): name
+    for name in (
+        "AbstractSet",
+        "Collection",
+        "Counter",
+        "DefaultDict",
+        "Deque",
+        "Dict",
+        "FrozenSet",
+        "Iterable",
+        "Iterator",
+        "List",
+        "Mapping",
+        "MutableMapping",
+        "MutableSequence",
+        "MutableSet",
+        "OrderedDict",
+        "Sequence",
+        "Set",
+        "Tuple",
+        "Type",
+    )
+}
+
+
+class GeneratedCodeOutOfDateError(RuntimeError):
+    pass
+
+
+def check_fingerprints(fingerprints: T.Mapping[T.Type[pydantic.BaseModel], str]):
+    """
+    Raise a `GeneratedCodeOutOfDateError` if any of the given models no longer
+    match the fingerprint they had when the code was generated.
+    """
+    stale = [
+        model.__qualname__
+        for model, fingerprint in fingerprints.items()
+        if model_fingerprint(model) != fingerprint
+    ]
+    if stale:
+        raise GeneratedCodeOutOfDateError(
+            f"The generated Graphene types are out of date for: {', '.join(stale)}. "
+            "Regenerate them with `python -m graphene_pydantic.codegen`."
+        )
+
+
+def model_is_type_of(
+    model: T.Type[pydantic.BaseModel],
+    name: str,
+    mapping_roots: bool = False,
+    discriminator: T.Optional[str] = None,
+    discriminator_values: T.Iterable[T.Any] = (),
+    required_keys: T.Tuple[T.Tuple[str, ...], ...] = (),
+) -> classmethod:
+    """
+    Build an `is_type_of` classmethod for a generated type, equivalent to
+    `PydanticObjectType.is_type_of` for the given model.
+    """
+    discriminator_values = frozenset(discriminator_values)
+
+    def is_type_of(cls, root, info) -> bool:
+        if isinstance(root, ColumnarRow):
+            return issubclass(root._batch.model, model)
+        if mapping_roots and isinstance(root, collections.abc.Mapping):
+            if "__typename" in root:
+                return root["__typename"] == name
+            if discriminator:
+                return root.get(discriminator) in discriminator_values
+            return has_required_keys(root, required_keys)
+        return isinstance(root, model)
+
+    return classmethod(is_type_of)
+
+
+def model_resolve_type(
+    implementations: T.Callable[[], T.Mapping[T.Type[pydantic.BaseModel], T.Type]]
+) -> classmethod:
+    """
+    Build a `resolve_type` classmethod for a generated interface, equivalent to
+    `PydanticInterface.resolve_type`. `implementations` returns the generated
+    type implementing it for each model (once they've all been declared).
+    """
+    resolved_types: T.Dict[T.Type[pydantic.BaseModel], T.Type] = {}
+
+    def resolve_type(cls, instance, info):
+        model = (
+            instance._batch.model
+            if isinstance(instance, ColumnarRow)
+            else type(instance)
+        )
+        try:
+            return resolved_types[model]
+        except KeyError:
+            pass
+        types = implementations()
+        obj_type = next((types[b] for b in model.__mro__ if b in types), None)
+        if obj_type is not None:
+            resolved_types[model] = obj_type
+        return obj_type
+
+    return classmethod(resolve_type)
+
+
+def _is_literal(value: T.Any) -> bool:
+    try:
+        return ast.literal_eval(repr(value)) == value
+    except (ValueError, SyntaxError):
+        return False
+
+
+class ModuleWriter:
+    """Accumulate the source of a generated module, one registry at a time."""
+
+    def __init__(self):
+        self._imports: T.Dict[T.Tuple[str, str], str] = {}
+        self._names: T.Dict[T.Any, str] = {}
+        self._enums: T.List[str] = []
+        self._interfaces: T.List[str] = []
+        self._types: T.List[str] = []
+        self._unions: T.List[str] = []
+        self._union_names: T.Set[str] = set()
+        self._entry_types: T.Dict[str, str] = {}
+        self._fingerprints: T.Dict[str, str] = {}
+
+    def add_registry(self, registry: Registry):
+        obj_types = [
+            obj_type
+            for obj_type in registry._registry.values()
+            if not isinstance(obj_type, Placeholder)
+        ]
+        interfaces = list(registry._interfaces.values())
+        entry_types = list(registry._mapping_entry_types.values())
+        # Claim all the names up front, so fields can refer to types that are
+        # declared further down the module
+        for obj_type in interfaces + obj_types + entry_types:
+            self._names[obj_type] = obj_type._meta.name
+        for entry_type in entry_types:
+            # Registries can share entry types by name, like unions
+            name = entry_type._meta.name
+            if name not in self._entry_types:
+                fields = self._fields_source(entry_type)
+                self._entry_types[
+                    name
+                ] = f"class {name}(graphene.ObjectType):\n{fields}"
+        for iface in interfaces:
+            self._interfaces.append(self._interface_source(iface))
+        for obj_type in obj_types:
+            if issubclass(obj_type, PydanticObjectType):
+                self._types.append(self._object_type_source(obj_type))
+            else:
+                self._types.append(self._input_object_type_source(obj_type))
+
+    def _import(self, obj: T.Any) -> str:
+        qualname = obj.__qualname__
+        if "<locals>" in qualname:
+            raise ConversionError(
+                f"Can't generate code referring to {obj!r}, which isn't importable."
+            )
+        return self._import_name(obj.__module__, qualname)
+
+    def _import_name(self, module: str, qualname: str) -> str:
+        top, _, rest = qualname.partition(".")
+        key = (module, top)
+        if key not in self._imports:
+            self._imports[key] = f"_i{len(self._imports)}"
+        return ".".join(x for x in (self._imports[key], rest) if x)
+
+    def _annotation(self, type_: T.Any) -> str:
+        """Return an expression evaluating to the type (annotation) `type_`."""
+        if type_ is None or type_ is type(None):
+            return "None"
+        if type_ is Ellipsis:
+            return "..."
+        if is_parametrized_generic_model(type_):
+            # Parametrizations are cached, so this is the same class again
+            metadata = type_.__pydantic_generic_metadata__
+            return self._subscript(
+                self._annotation(metadata["origin"]), metadata["args"]
+            )
+        origin = get_origin(type_)
+        if origin is None:
+            name = getattr(type_, "__name__", None)
+            if name and getattr(builtins, name, None) is type_:
+                return name
+            return self._import(type_)
+        if origin is T.Literal:
+            values = ", ".join(
+                self._value(repr(type_), value) for value in get_args(type_)
+            )
+            return f"{self._import_name('typing', 'Literal')}[{values}]"
+        if origin is T.Union or (PYTHON10 and origin is UnionType):
+            return self._subscript(
+                self._import_name("typing", "Union"), get_args(type_)
+            )
+        if origin is Annotated:
+            raise ConversionError(f"Can't generate code for the annotation {type_!r}.")
+        if origin in _TYPING_ALIASES:
+            alias = self._import_name("typing", _TYPING_ALIASES[origin])
+            return self._subscript(alias, get_args(type_))
+        return self._subscript(self._annotation(origin), get_args(type_))
+
+    def _subscript(self, origin: str, args: T.Sequence[T.Any]) -> str:
+        if not args:
+            return f"{origin}[()]"
+        return f"{origin}[{', '.join(self._annotation(arg) for arg in args)}]"
+
+    def _callable(self, func: T.Callable) -> str:
+        if inspect.ismethod(func):
+            return f"{self._import(func.__self__)}.{func.__func__.__name__}"
+        return self._import(func)
+
+    def _type(self, type_: T.Any) -> str:
+        if isinstance(type_, Structure):
+            return f"graphene.{type_.__class__.__name__}({self._type(type_.of_type)})"
+        if isinstance(type_, Placeholder):
+            raise ConversionError(
+                f"Can't generate code for an unresolved placeholder for {type_.model}. "
+                "Did you call `resolve_placeholders()`?"
+            )
+        if inspect.isfunction(type_) or isinstance(type_, functools.partial):
+            type_ = type_()
+            return self._type(type_)
+        if type_ in self._names:
+            return self._names[type_]
+        if issubclass(type_, PydanticInterface):
+            raise ConversionError(
+                f"Can't generate code referring to {type_._meta.name}, which isn't "
+                "in the registries being generated from."
+            )
+        if getattr(graphene, type_.__name__, None) is type_:
+            return f"graphene.{type_.__name__}"
+        if (
+            issubclass(type_, graphene.Enum)
+            and type_.__module__ == "graphene.types.enum"
+        ):
+            return self._add_enum(type_)
+        if (
+            issubclass(type_, graphene.Union)
+            and type_.__module__ == "graphene_pydantic.converters"
+        ):
+            return self._add_union(type_)
+        return self._import(type_)
+
+    def _add_enum(self, enum_type: T.Type[graphene.Enum]) -> str:
+        # Each conversion creates a new Graphene Enum, but we only want one per
+        # Python enum
+        python_enum = enum_type._meta.enum
+        if python_enum not in self._names:
+            name = self._names[python_enum] = f"_e{len(self._enums)}"
+            self._enums.append(
+                f"{name} = graphene.Enum.from_enum({self._import(python_enum)})"
+            )
+        return self._names[python_enum]
+
+    def _add_union(self, union_type: T.Type[graphene.Union]) -> str:
+        # Likewise, there's only one generated Union per set of member types
+        name = union_type._meta.name
+        if name in self._union_names:
+            return name
+        self._union_names.add(name)
+        members = ", ".join(self._type(t) for t in union_type._meta.types)
+        self._unions.append(
+            f"class {name}(graphene.Union):\n"
+            f"    class Meta:\n"
+            f"        types = ({members},)\n"
+        )
+        return name
+
+    def _value(self, name: str, value: T.Any) -> str:
+        if isinstance(value, enum.Enum):
+            return f"{self._import(type(value))}.{value.name}"
+        if not _is_literal(value):
+            raise ConversionError(
+                f"Can't generate code for the default value of field {name!r}."
+            )
+        return repr(value)
+
+    def _field_kwargs(self, name: str, field: T.Any) -> T.List[str]:
+        if getattr(field, "args", None):
+            raise ConversionError(
+                f"Can't generate code for the arguments of field {name!r}."
+            )
+        kwargs = [f"lambda: {self._type(field.type)}"]
+        if field.name:
+            kwargs.append(f"name={field.name!r}")
+        if field.description:
+            kwargs.append(f"description={field.description!r}")
+        if field.default_value is not None:
+            kwargs.append(f"default_value={self._value(name, field.default_value)}")
+        return kwargs
+
+    def _resolver(self, resolver: T.Optional[T.Callable]) -> T.Optional[str]:
+        if resolver is None:
+            return None
+        qualname = getattr(resolver, "__qualname__", "")
+        if qualname == "get_mapping_entries_resolver.<locals>._resolve_entries":
+            inner = self._resolver(resolver.resolver)
+            mapping_type = self._annotation(resolver.mapping_type)
+            return f"get_mapping_entries_resolver({inner}, {mapping_type})"
+        if qualname == "memoize_resolver.<locals>.resolve_memoized":
+            closure = inspect.getclosurevars(resolver).nonlocals
+            inner = self._resolver(closure["resolver"])
+            return f"memoize_resolver({inner}, {closure['field_name']!r})"
+        if qualname == "get_attr_resolver.<locals>._get_field":
+            attr_name = inspect.getclosurevars(resolver).nonlocals["attr_name"]
+            return f"get_attr_resolver({attr_name!r})"
+        if qualname == "get_mapping_resolver.<locals>._get_field":
+            closure = inspect.getclosurevars(resolver).nonlocals
+            return (
+                f"get_mapping_resolver({closure['attr_name']!r}, {closure['alias']!r})"
+            )
+        return self._callable(resolver)
+
+    def _meta_source(self, obj_type: T.Type) -> str:
+        lines = ["    class Meta:", f"        name = {obj_type._meta.name!r}"]
+        if obj_type._meta.description:
+            lines.append(f"        description = {obj_type._meta.description!r}")
+        interfaces = getattr(obj_type._meta, "interfaces", ())
+        if interfaces:
+            names = ", ".join(self._type(iface) for iface in interfaces)
+            lines.append(f"        interfaces = ({names},)")
+        return "\n".join(lines) + "\n\n"
+
+    def _fields_source(self, obj_type: T.Type) -> str:
+        source = ""
+        for name, field in obj_type._meta.fields.items():
+            kwargs = self._field_kwargs(name, field)
+            resolver = self._resolver(field.resolver)
+            if resolver is None and callable(
+                getattr(obj_type, f"resolve_{name}", None)
+            ):
+                resolver = self._callable(getattr(obj_type, f"resolve_{name}"))
+            if resolver:
+                kwargs.append(f"resolver={resolver}")
+            source += f"    {name} = graphene.Field({', '.join(kwargs)})\n"
+        return source
+
+    def _interface_source(self, iface: T.Type[PydanticInterface]) -> str:
+        meta = iface._meta
+        self._fingerprints[self._annotation(meta.model)] = model_fingerprint(meta.model)
+        source = f"class {meta.name}(graphene.Interface):\n{self._meta_source(iface)}"
+        source += self._fields_source(iface)
+        implementations = ", ".join(
+            f"{self._annotation(model)}: {self._type(obj_type)}"
+            for implementations in meta.implementations.values()
+            for model, obj_type in implementations.items()
+            if obj_type in self._names
+        )
+        source += (
+            "\n    resolve_type = model_resolve_type(\n"
+            f"        lambda: {{{implementations}}}\n"
+            "    )\n"
+        )
+        return source
+
+    def _object_type_source(self, obj_type: T.Type[PydanticObjectType]) -> str:
+        meta = obj_type._meta
+        self._fingerprints[self._annotation(meta.model)] = model_fingerprint(meta.model)
+        source = (
+            f"class {meta.name}(graphene.ObjectType):\n{self._meta_source(obj_type)}"
+        )
+        source += self._fields_source(obj_type)
+        is_type_of = [self._annotation(meta.model), repr(meta.name)]
+        if meta.mapping_roots:
+            is_type_of.append("mapping_roots=True")
+        if meta.discriminator:
+            is_type_of.append(f"discriminator={meta.discriminator!r}")
+            values = sorted(meta.discriminator_values, key=repr)
+            is_type_of.append(f"discriminator_values={values!r}")
+        elif meta.mapping_roots and meta.required_keys:
+            is_type_of.append(f"required_keys={meta.required_keys!r}")
+        source += f"\n    is_type_of = model_is_type_of({', '.join(is_type_of)})\n"
+        return source
+
+    def _input_object_type_source(
+        self, obj_type: T.Type[PydanticInputObjectType]
+    ) -> str:
+        meta = obj_type._meta
+        self._fingerprints[self._annotation(meta.model)] = model_fingerprint(meta.model)
+        source = f"class {meta.name}(graphene.InputObjectType):\n{self._meta_source(obj_type)}"
+        for name, field in meta.fields.items():
+            kwargs = ", ".join(self._field_kwargs(name, field))
+            source += f"    {name} = graphene.InputField({kwargs})\n"
+        return source
+
+    def source(self) -> str:
+        imports = "".join(
+            f"from {module} import {name} as {alias}\n"
+            for (module, name), alias in self._imports.items()
+        )
+        fingerprints = "".join(
+            f"        {model}: {fingerprint!r},\n"
+            for model, fingerprint in self._fingerprints.items()
+        )
+        sections = [
+            HEADER
+            + "import graphene\n\n"
+            + "from graphene_pydantic.codegen import (\n"
+            + "    check_fingerprints,\n"
+            + "    model_is_type_of,\n"
+            + "    model_resolve_type,\n"
+            + ")\n"
+            + "from graphene_pydantic.converters import (\n"
+            + "    get_attr_resolver,\n"
+            + "    get_mapping_entries_resolver,\n"
+            + "    get_mapping_resolver,\n"
+            + ")\n"
+            + "from graphene_pydantic.memoize import memoize_resolver\n"
+            + imports,
+            "check_fingerprints(\n    {\n" + fingerprints + "    }\n)\n",
+        ]
+        if self._enums:
+            sections.append("\n".join(self._enums) + "\n")
+        sections.extend(self._interfaces)
+        sections.extend(self._types)
+        sections.extend(self._unions)
+        sections.extend(self._entry_types.values())
+        return "\n\n".join(sections)
+
+
+def generate_module(*registries: Registry) -> str:
+    """
+    Return the source of a module declaring plain Graphene types equivalent to
+    every type in the given registries (by default, the global registries).
+    """
+    if not registries:
+        registries = (
+            get_global_registry(PydanticObjectType),
+            get_global_registry(PydanticInputObjectType),
+        )
+    writer = ModuleWriter()
+    for registry in registries:
+        writer.add_registry(registry)
+    return writer.source()
+
+
+def main(argv: T.Optional[T.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m graphene_pydantic.codegen",
+        description=__doc__.strip().split("\n")[0],
+    )
+    parser.add_argument(
+        "modules", nargs="+", help="modules declaring the PydanticObjectTypes"
+    )
+    parser.add_argument(
+        "-r",
+        "--registry",
+        action="append",
+        metavar="MODULE:NAME",
+        help="a Registry to generate types from (default: the global registries)",
+    )
+    parser.add_argument("-o", "--output", help="file to write (default: stdout)")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="fail if the output file isn't what would be generated now",
+    )
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        importlib.import_module(module)
+    registries = []
+    for path in args.registry or ():
+        module, _, name = path.partition(":")
+        registries.append(getattr(importlib.import_module(module), name))
+    source = generate_module(*registries)
+
+    if args.check:
+        if not args.output:
+            parser.error("--check requires --output")
+        try:
+            with open(args.output) as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != source:
+            print(f"{args.output} is out of date", file=sys.stderr)
+            return 1
+        return 0
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(source)
+    else:
+        sys.stdout.write(source)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,90 @@
+import typing as T
+
+import pydantic
+
+
+class ColumnarRow:
+    """
+    A lightweight, read-only view of a single row of a `ColumnarResult`.
+
+    Attribute access is forwarded to `columns[name][index]`, which is all the
+    default resolvers generated by `convert_pydantic_field` need, so no Pydantic
+    model has to be built for the row. (It has no public attributes of its own,
+    so that every column name is free; its model is `row._batch.model`.)
+    """
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "ColumnarResult", index: int):
+        self._batch = batch
+        self._index = index
+
+    def __getattr__(self, name: str) -> T.Any:
+        try:
+            column = self._batch.columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return column[self._index]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._batch.model.__name__}, {self._index})"
+
+
+class ColumnarResult(T.Sequence[ColumnarRow]):
+    """
+    A column-oriented batch of rows for a `List[Model]` field.
+
+    Rather than materializing one Pydantic model per row, a resolver can return
+    a mapping of field name to a sequence (a list, `array.array`, NumPy array,
+    etc.) of values for that field, and the rows will be read back by index.
+    """
+
+    def __init__(
+        self,
+        model: T.Type[pydantic.BaseModel],
+        columns: T.Mapping[str, T.Sequence[T.Any]],
+        length: T.Optional[int] = None,
+    ):
+        assert model and issubclass(
+            model, pydantic.BaseModel
+        ), f'You need to pass a valid Pydantic model to ColumnarResult, received "{model}"'
+
+        if length is None:
+            length = len(next(iter(columns.values()))) if columns else 0
+
+        for name, column in columns.items():
+            if len(column) != length:
+                raise ValueError(
+                    f"Column {name!r} has {len(column)} values, expected {length}."
+                )
+
+        self.model = model
+        self.columns = columns
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    @T.overload
+    def __getitem__(self, index: int) -> ColumnarRow:
+        ...  # pragma: no cover
+
+    @T.overload
+    def __getitem__(self, index: slice) -> T.List[ColumnarRow]:
+        ...  # pragma: no cover
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ColumnarRow(self, i) for i in range(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("ColumnarResult index out of range")
+        return ColumnarRow(self, index)
+
+    def __iter__(self) -> T.Iterator[ColumnarRow]:
+        for index in range(self.length):
+            yield ColumnarRow(self, index)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.model.__name__}, length={self.length})"
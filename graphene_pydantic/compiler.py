@@ -0,0 +1,312 @@
+"""
+An executor that compiles the parts of operations that only read attributes of
+Pydantic models into plain Python functions, in the spirit of graphql-jit.
+
+graphql-core resolves and completes every field of every object on its own,
+which is wasted work when all a field does is read an attribute. For each
+object type and sub-selection whose fields all use the default resolvers, we
+generate (and cache) a function that builds the result straight from the model,
+without any per-field resolver calls. Anything else -- custom resolvers,
+abstract types, arguments, variables -- is left to graphql-core.
+"""
+import typing as T
+import weakref
+
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    GraphQLEnumType,
+    GraphQLField,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLOutputType,
+    GraphQLScalarType,
+    GraphQLSchema,
+)
+from graphql.execution.collect_fields import collect_sub_fields
+
+from .arrays import ArrayExecutionContext, get_array_serializer
+from .caching import normalize_selection_set
+from .converters import get_resolver_attr_name
+from .objecttype import PydanticObjectType
+
+# How many compiled selections to keep for each type
+MAX_COMPILED_SELECTIONS = 256
+
+
+class NotCompilable(Exception):
+    """Raised while compiling a selection that must be left to graphql-core."""
+
+
+class SelectionCache:
+    """
+    What was built for the selections of each type (or None, where the
+    selection must be left to graphql-core), keeping up to `max_size` for each.
+
+    Selections are cached by type and normalized selection set (see
+    `normalize_selection_set()`), so the same selection in any operation reuses
+    the same thing.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def get(
+        self,
+        type_: GraphQLOutputType,
+        field_nodes: T.List[FieldNode],
+        fragments: T.Dict[str, FragmentDefinitionNode],
+        build: T.Callable[[], T.Any],
+        key: T.Hashable = None,
+    ) -> T.Any:
+        """
+        Return what `build()` returns for the sub-selection of `field_nodes` on
+        `type_` (and `key`), building it the first time it's selected. It's
+        None if `build()` raises `NotCompilable`.
+        """
+        variables: T.Set[str] = set()
+        selection_key = (
+            key,
+            tuple(
+                normalize_selection_set(node.selection_set, fragments, variables)
+                for node in field_nodes
+                if node.selection_set
+            ),
+        )
+        built_selections = self._cache.setdefault(type_, {})
+        try:
+            return built_selections[selection_key]
+        except KeyError:
+            pass
+
+        built = None
+        # Which fields are selected may depend on the variables
+        if not variables:
+            try:
+                built = build()
+            except NotCompilable:
+                pass
+        if len(built_selections) >= self.max_size:
+            built_selections.clear()
+        built_selections[selection_key] = built
+        return built
+
+
+def collect_attribute_fields(
+    schema: GraphQLSchema,
+    fragments: T.Dict[str, FragmentDefinitionNode],
+    type_: GraphQLObjectType,
+    field_nodes: T.List[FieldNode],
+) -> T.List[T.Tuple[str, T.Optional[str], T.Optional[GraphQLField], T.List[FieldNode]]]:
+    """
+    Return the fields the sub-selection of `field_nodes` selects on `type_`, as
+    (response key, attribute name, field, field nodes) tuples -- the attribute
+    name and field being None for `__typename`. Raises `NotCompilable` unless
+    every field just reads an attribute (see `get_resolver_attr_name()`).
+    """
+    fields = []
+    sub_field_nodes = collect_sub_fields(schema, fragments, {}, type_, field_nodes)
+    for response_key, nodes in sub_field_nodes.items():
+        field_name = nodes[0].name.value
+        if any(node.arguments for node in nodes):
+            raise NotCompilable(f"{type_}.{field_name} has arguments")
+        if field_name == "__typename":
+            fields.append((response_key, None, None, nodes))
+            continue
+        field = type_.fields.get(field_name)
+        if field is None or field.resolve is None:
+            raise NotCompilable(f"{type_}.{field_name} isn't a Pydantic field")
+        attr_name = get_resolver_attr_name(field.resolve)
+        if attr_name is None:
+            raise NotCompilable(f"{type_}.{field_name} has a custom resolver")
+        fields.append((response_key, attr_name, field, nodes))
+    return fields
+
+
+# The compiled functions for the selections of each type
+_compiled_cache = SelectionCache(MAX_COMPILED_SELECTIONS)
+
+
+class Fallback(Exception):
+    """
+    Raised by compiled functions for values they can't complete themselves
+    (e.g. a null in a non-null field), so graphql-core completes them instead,
+    reporting any errors as usual.
+    """
+
+
+class _Compiler:
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        fragments: T.Dict[str, FragmentDefinitionNode],
+    ):
+        self.schema = schema
+        self.fragments = fragments
+        self.lines: T.List[str] = []
+        self.namespace: T.Dict[str, T.Any] = {"Fallback": Fallback}
+        self.count = 0
+
+    def _name(self, prefix: str) -> str:
+        self.count += 1
+        return f"_{prefix}{self.count}"
+
+    def complete(
+        self,
+        type_: GraphQLOutputType,
+        field_nodes: T.List[FieldNode],
+        nullable: bool = True,
+    ) -> str:
+        """
+        Generate a function completing values of `type_`, returning its name.
+        """
+        if isinstance(type_, GraphQLNonNull):
+            return self.complete(type_.of_type, field_nodes, nullable=False)
+
+        on_null = "return None" if nullable else "raise Fallback"
+        name = self._name("c")
+        if isinstance(type_, GraphQLList):
+            inner = self.complete(type_.of_type, field_nodes)
+            body = []
+            serialize_array = get_array_serializer(type_.of_type)
+            if serialize_array is not None:
+                # Numeric buffers are serialized in bulk
+                serialize = self._name("a")
+                self.namespace[serialize] = serialize_array
+                body += [
+                    f"items = {serialize}(value)",
+                    "if items is not None:",
+                    "    return items",
+                ]
+            body.append(f"return [{inner}(item) for item in value]")
+        elif isinstance(type_, (GraphQLScalarType, GraphQLEnumType)):
+            serialize = self._name("s")
+            self.namespace[serialize] = type_.serialize
+            body = [
+                f"value = {serialize}(value)",
+                "if value is None:",
+                "    raise Fallback",
+                "return value",
+            ]
+        elif isinstance(type_, GraphQLObjectType):
+            body = self.complete_object(type_, field_nodes)
+        else:
+            raise NotCompilable(f"Can't compile values of {type_}")
+
+        self.lines += [
+            f"def {name}(value):",
+            "    if value is None:",
+            f"        {on_null}",
+        ]
+        self.lines += [f"    {line}" for line in body]
+        return name
+
+    def complete_object(
+        self, type_: GraphQLObjectType, field_nodes: T.List[FieldNode]
+    ) -> T.List[str]:
+        body = []
+        if type_.is_type_of:
+            graphene_type = getattr(type_, "graphene_type", None)
+            # Our `is_type_of()` doesn't need the resolve info, but others might
+            if not (
+                isinstance(graphene_type, type)
+                and issubclass(graphene_type, PydanticObjectType)
+            ):
+                raise NotCompilable(f"{type_} has a custom is_type_of")
+            is_type_of = self._name("t")
+            self.namespace[is_type_of] = type_.is_type_of
+            body += [f"if not {is_type_of}(value, None):", "    raise Fallback"]
+
+        items = []
+        for response_key, attr_name, field, nodes in collect_attribute_fields(
+            self.schema, self.fragments, type_, field_nodes
+        ):
+            if field is None:
+                items.append(f"{response_key!r}: {type_.name!r}")
+                continue
+            complete = self.complete(field.type, nodes)
+            items.append(
+                f"{response_key!r}: {complete}(getattr(value, {attr_name!r}, None))"
+            )
+        body.append("return {" + ", ".join(items) + "}")
+        return body
+
+    def compile(
+        self, return_type: GraphQLObjectType, field_nodes: T.List[FieldNode]
+    ) -> T.Callable[[T.Any], T.Dict[str, T.Any]]:
+        name = self.complete(GraphQLNonNull(return_type), field_nodes)
+        source = "\n".join(self.lines)
+        exec(
+            compile(source, f"<compiled {return_type.name} selection>", "exec"),
+            self.namespace,
+        )
+        compiled = self.namespace[name]
+        compiled.__source__ = source
+        return compiled
+
+
+def compile_selection(
+    schema: GraphQLSchema,
+    return_type: GraphQLObjectType,
+    field_nodes: T.List[FieldNode],
+    fragments: T.Dict[str, FragmentDefinitionNode],
+) -> T.Optional[T.Callable[[T.Any], T.Dict[str, T.Any]]]:
+    """
+    Return a function that completes an object of `return_type` with the
+    sub-selection of `field_nodes`, or None if the selection can't be compiled.
+
+    The functions are cached by type and (normalized) selection, so the same
+    selection in any operation reuses the same function.
+    """
+    return _compiled_cache.get(
+        return_type,
+        field_nodes,
+        fragments,
+        lambda: _Compiler(schema, fragments).compile(return_type, field_nodes),
+    )
+
+
+class CompiledExecutionContext(ArrayExecutionContext):
+    """
+    An execution context that completes objects with compiled functions (see
+    `compile_selection()`) where it can. Use it with e.g.
+    `schema.execute(query, execution_context_class=CompiledExecutionContext)`.
+
+    Middleware is only applied to resolvers that are actually called, so
+    nothing is compiled when there is any. Numeric arrays are completed in bulk,
+    as `ArrayExecutionContext` does.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._compiled: T.Dict[T.Hashable, T.Optional[T.Callable]] = {}
+
+    def complete_object_value(
+        self,
+        return_type: GraphQLObjectType,
+        field_nodes: T.List[FieldNode],
+        info,
+        path,
+        result: T.Any,
+    ):
+        if self.middleware_manager is None:
+            # Only looked up once per execution for each set of field nodes
+            # (see `collect_subfields()`)
+            ids = (return_type, *map(id, field_nodes))
+            try:
+                compiled = self._compiled[ids]
+            except KeyError:
+                compiled = self._compiled[ids] = compile_selection(
+                    self.schema, return_type, field_nodes, self.fragments
+                )
+            if compiled is not None:
+                try:
+                    return compiled(result)
+                except Exception:
+                    # Let graphql-core complete it (and report any errors)
+                    pass
+        return super().complete_object_value(
+            return_type, field_nodes, info, path, result
+        )
@@ -5,9 +5,12 @@ import decimal
 import enum
 import inspect
 import sys
+import threading
 import typing as T
 import uuid
-from typing import Type, get_origin
+import weakref
+from functools import partial
+from typing import Type
 
 import graphene
 from graphene import (
@@ -27,24 +30,30 @@ from graphene import (
 from graphene.types.base import BaseType
 from graphene.types.datetime import Date, DateTime, Time
 from pydantic import BaseModel
-from pydantic.fields import FieldInfo
+from pydantic.fields import ComputedFieldInfo, FieldInfo
 from pydantic_core import PydanticUndefined
 
 from .registry import Placeholder, Registry
-from .util import construct_union_class_name, evaluate_forward_ref
+from .util import (
+    construct_generic_class_name,
+    construct_mapping_entry_class_name,
+    construct_union_class_name,
+    evaluate_forward_ref,
+)
 
 PYTHON10 = sys.version_info >= (3, 10)
 if PYTHON10:
     from types import UnionType
 
-GRAPHENE2 = graphene.VERSION[0] < 3
-
-try:
-    from bson import ObjectId
+# `typing.Annotated` is new in Python 3.9; before that, Pydantic's constrained
+# types (e.g. `conlist()`) use the backport from typing_extensions (which
+# Pydantic depends on), whose `get_origin()` and `get_args()` understand it
+if sys.version_info >= (3, 9):
+    from typing import Annotated, get_args, get_origin
+else:  # pragma: no cover
+    from typing_extensions import Annotated, get_args, get_origin
 
-    BSON_OBJECT_ID_SUPPORTED = True
-except ImportError:
-    BSON_OBJECT_ID_SUPPORTED = False
+GRAPHENE2 = graphene.VERSION[0] < 3
 
 try:
     from graphene.types.decimal import Decimal as GrapheneDecimal
@@ -61,6 +70,24 @@ class ConversionError(TypeError):
     pass
 
 
+# The parametrized generic models whose types are waiting to be created (see
+# `convert_generic_model()`) in its `worklist` attribute, while there's one
+# being created in the current thread
+_generic_conversion = threading.local()
+
+# The serializers of the Graphene enums converted from Python enums
+_enum_serializers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def is_bson_object_id(type_: T.Any) -> bool:
+    """
+    Check whether `type_` is BSON's `ObjectId`. A model can only refer to it if
+    `bson` has been imported already, so we never import it ourselves.
+    """
+    bson = sys.modules.get("bson")
+    return bson is not None and type_ is getattr(bson, "ObjectId", None)
+
+
 def get_attr_resolver(attr_name: str) -> T.Callable:
     """
     Return a helper function that resolves a field with the given name by
@@ -73,6 +100,52 @@ def get_attr_resolver(attr_name: str) -> T.Callable:
     return _get_field
 
 
+_MISSING = object()
+
+
+def get_mapping_resolver(attr_name: str, alias: T.Optional[str] = None) -> T.Callable:
+    """
+    Return a helper function that resolves a field with the given name by
+    looking it up as a key of the root if it's a mapping (falling back to the
+    field's alias, if it has one), or as an attribute otherwise.
+    """
+
+    def _get_field(root, _info):
+        if isinstance(root, collections.abc.Mapping):
+            value = root.get(attr_name, _MISSING)
+            if value is _MISSING:
+                return root.get(alias) if alias else None
+            return value
+        return getattr(root, attr_name, None)
+
+    return _get_field
+
+
+def is_default_resolver(resolver: T.Optional[T.Callable]) -> bool:
+    """
+    Return whether `resolver` is one of the generic resolvers generated by
+    `get_attr_resolver()` or `get_mapping_resolver()`, which behave the same
+    for whichever type they're used on.
+    """
+    return getattr(resolver, "__qualname__", None) in (
+        "get_attr_resolver.<locals>._get_field",
+        "get_mapping_resolver.<locals>._get_field",
+    )
+
+
+def get_resolver_attr_name(resolver: T.Optional[T.Callable]) -> T.Optional[str]:
+    """
+    Return the name of the attribute a resolver generated by
+    `get_attr_resolver()` reads, or None for any other resolver.
+    """
+    if (
+        getattr(resolver, "__qualname__", None)
+        != "get_attr_resolver.<locals>._get_field"
+    ):
+        return None
+    return inspect.getclosurevars(resolver).nonlocals["attr_name"]
+
+
 def convert_pydantic_input_field(
     field: FieldInfo,
     registry: Registry,
@@ -104,17 +177,39 @@ def convert_pydantic_input_field(
     return InputField(**field_kwargs)
 
 
+def computed_field_info(field: ComputedFieldInfo) -> FieldInfo:
+    """
+    Describe a Pydantic computed field as a regular field, so it can be
+    converted (and compared) like one. It's optional only if its return type is.
+    """
+    return_type = field.return_type
+    is_optional = (
+        get_origin(return_type) is T.Union
+        or (PYTHON10 and get_origin(return_type) is UnionType)
+    ) and NONE_TYPE in get_args(return_type)
+    return FieldInfo(
+        annotation=return_type,
+        default=None if is_optional else PydanticUndefined,
+        alias=field.alias,
+        description=field.description,
+    )
+
+
 def convert_pydantic_field(
     name: str,
     field: FieldInfo,
     registry: Registry,
     parent_type: T.Type = None,
     model: T.Type[BaseModel] = None,
+    mapping_roots: bool = False,
     **field_kwargs,
 ) -> Field:
     """
     Convert a Pydantic model field into a Graphene type field that we can add
     to the generated Graphene data model type.
+
+    If `mapping_roots` is set, the default resolver will also accept mappings
+    (e.g. plain dicts) as the object being resolved, reading the field by key.
     """
     declared_type = getattr(field, "annotation", None)
 
@@ -164,10 +259,37 @@ def convert_pydantic_field(
     resolver_function = getattr(parent_type, "resolve_" + name, None)
     if resolver_function and callable(resolver_function):
         field_resolver = resolver_function
+    elif mapping_roots:
+        field_resolver = get_mapping_resolver(name, field.alias)
     else:
         field_resolver = get_attr_resolver(name)
 
-    return Field(field_type, resolver=field_resolver, **field_kwargs)
+    field_resolver = get_mapping_entries_resolver(field_resolver, declared_type)
+
+    graphene_field = Field(field_type, resolver=field_resolver, **field_kwargs)
+    # Kept for query cost analysis (see `graphene_pydantic.cost`)
+    graphene_field.list_bounds = get_list_bounds(field)
+    return graphene_field
+
+
+def get_mapping_entries_resolver(resolver: T.Callable, type_: T.Any) -> T.Callable:
+    """
+    Wrap `resolver` to turn the mappings in the values it returns, of the
+    annotated type `type_`, into the (key, value) pairs the entry types expect
+    (see `get_mapping_entries_adapter()`). Returns `resolver` as it is if the
+    type doesn't hold any mappings.
+    """
+    adapter = get_mapping_entries_adapter(type_)
+    if adapter is None:
+        return resolver
+
+    def _resolve_entries(root, info, **kwargs):
+        return adapter(resolver(root, info, **kwargs))
+
+    # Kept for generating code that wraps the resolver again (see `codegen`)
+    _resolve_entries.resolver = resolver
+    _resolve_entries.mapping_type = type_
+    return _resolve_entries
 
 
 def convert_pydantic_type(
@@ -192,18 +314,104 @@ def convert_pydantic_type(
     return graphene_type
 
 
+class _Nested(T.NamedTuple):
+    """
+    What a conversion step returns for a type that's made of other types: the
+    types to convert first, and how to combine their Graphene types into its own.
+    """
+
+    types: T.Tuple[T.Any, ...]
+    combine: T.Callable[[T.List[T.Any]], T.Any]
+
+
+def _first(converted: T.List[T.Any]) -> T.Any:
+    return converted[0]
+
+
+def _memo_key(type_: T.Any) -> T.Hashable:
+    try:
+        hash(type_)
+    except TypeError:
+        # e.g. `Annotated` with unhashable metadata
+        return ("id", id(type_))
+    return type_
+
+
+def _convert(
+    type_: T.Any,
+    step: T.Callable,
+    field: FieldInfo,
+    registry: Registry,
+    parent_type: T.Type,
+    model: T.Type[BaseModel],
+) -> T.Any:
+    """
+    Convert `type_` with the conversion `step`, and the types it's made of with
+    `_find_graphene_type()`, working through them with an explicit stack rather
+    than recursively, so that however deeply nested a type is, it can't hit the
+    recursion limit. Each distinct type is only converted once. A type that
+    contains itself (e.g. a recursive alias that isn't a model) can't be
+    expressed in GraphQL, so that's a `ConversionError`.
+    """
+    results: T.Dict[T.Hashable, T.Any] = {}
+    # The types whose inner types are being converted
+    in_progress: T.Set[T.Hashable] = set()
+    root = _memo_key(type_)
+    stack: T.List[T.Tuple[T.Hashable, T.Any, T.Callable, T.Optional[_Nested]]] = [
+        (root, type_, step, None)
+    ]
+    while stack:
+        key, node, node_step, nested = stack[-1]
+        if nested is None:
+            if key in results:
+                stack.pop()
+                continue
+            converted = node_step(node, field, registry, parent_type, model)
+            if isinstance(converted, _Nested):
+                stack[-1] = (key, node, node_step, converted)
+                in_progress.add(key)
+                # Pushed in reverse, so they're converted in order
+                for inner in reversed(converted.types):
+                    inner_key = _memo_key(inner)
+                    if inner_key in in_progress:
+                        raise ConversionError(
+                            f"Don't know how to convert the Pydantic field {field!r} "
+                            f"({field.annotation}): {inner!r} contains itself."
+                        )
+                    if inner_key not in results:
+                        stack.append((inner_key, inner, _find_graphene_type, None))
+                continue
+        else:
+            converted = nested.combine(
+                [results[_memo_key(inner)] for inner in nested.types]
+            )
+            in_progress.discard(key)
+        stack.pop()
+        results[key] = converted
+    return results[root]
+
+
 def find_graphene_type(
     type_: T.Type,
     field: FieldInfo,
     registry: Registry,
     parent_type: T.Type = None,
     model: T.Type[BaseModel] = None,
-) -> T.Union[Type[T.Union[BaseType, List]], Placeholder]:  # noqa: C901
+) -> T.Union[Type[T.Union[BaseType, List]], Placeholder]:
     """
     Map a native Python type to a Graphene-supported Field type, where possible,
     throwing an error if we don't know what to map it to.
     """
+    return _convert(type_, _find_graphene_type, field, registry, parent_type, model)
 
+
+def _find_graphene_type(  # noqa: C901
+    type_: T.Type,
+    field: FieldInfo,
+    registry: Registry,
+    parent_type: T.Type,
+    model: T.Type[BaseModel],
+) -> T.Union[Type[T.Union[BaseType, List]], Placeholder, _Nested]:
     # Convert Python 10 UnionType to T.Union
     if PYTHON10:
         if isinstance(type_, UnionType):
@@ -223,7 +431,7 @@ def find_graphene_type(
         return Boolean
     elif type_ == float:
         return Float
-    elif BSON_OBJECT_ID_SUPPORTED and type_ == ObjectId:
+    elif is_bson_object_id(type_):
         return ID
     elif type_ == dict:
         return JSONString
@@ -235,7 +443,14 @@ def find_graphene_type(
         # TODO: do Sets really belong here?
         return List
     elif registry and registry.get_type_for_model(type_):
+        if parent_type:
+            registry.add_dependency(type_, parent_type)
         return registry.get_type_for_model(type_)
+    elif registry and is_parametrized_generic_model(type_):
+        obj_type = convert_generic_model(type_, registry)
+        if parent_type:
+            registry.add_dependency(type_, parent_type)
+        return obj_type
     elif registry and (
         isinstance(type_, BaseModel)
         or (inspect.isclass(type_) and issubclass(type_, BaseModel))
@@ -244,13 +459,13 @@ def find_graphene_type(
         # we can put a placeholder in and request that `resolve_placeholders()`
         # be called to update it.
         registry.add_placeholder_for_model(type_)
+        if parent_type:
+            registry.add_dependency(type_, parent_type)
         return registry.get_type_for_model(type_)
     # NOTE: this has to come before any `issubclass()` checks, because annotated
     # generic types aren't valid arguments to `issubclass`
     elif hasattr(type_, "__origin__"):
-        return convert_generic_python_type(
-            type_, field, registry, parent_type=parent_type, model=model
-        )
+        return _convert_generic_python_type(type_, field, registry, parent_type, model)
     elif isinstance(type_, T.ForwardRef):
         # A special case! We have to do a little hackery to try and resolve
         # the type that this points to, by trying to reference a "sibling" type
@@ -269,11 +484,9 @@ def find_graphene_type(
         # TODO: make this behavior optional. maybe this is a place for the TypeOptions to play a role?
         if registry:
             registry.add_placeholder_for_model(resolved)
-        return find_graphene_type(
-            resolved, field, registry, parent_type=parent_type, model=model
-        )
+        return _Nested((resolved,), _first)
     elif issubclass(type_, enum.Enum):
-        return Enum.from_enum(type_)
+        return convert_enum(type_, registry)
     elif issubclass(type_, (str, bytes)):
         return String
     elif issubclass(type_, datetime.datetime):
@@ -298,28 +511,190 @@ def find_graphene_type(
         )
 
 
+def convert_enum(type_: T.Type[enum.Enum], registry: Registry) -> T.Type[Enum]:
+    """
+    Convert a Python enum into a Graphene Enum, reusing the one already created
+    for it in the registry (or its parents), if any.
+    """
+    graphene_enum = registry.get_enum(type_) if registry else None
+    if graphene_enum is None:
+        graphene_enum = Enum.from_enum(type_)
+        _enum_serializers[graphene_enum] = EnumSerializer(type_)
+        if registry:
+            registry.register_enum(type_, graphene_enum)
+    return graphene_enum
+
+
+class EnumSerializer:
+    """
+    The GraphQL names of the members of a Python enum, precomputed by member
+    identity and by value (or name), as Graphene serializes them.
+
+    Graphene looks members up in a dict keyed by the members themselves, whose
+    `__hash__` is implemented in Python, and converts raw values with the
+    enum's constructor first; looking members up by `id()` skips all that.
+    """
+
+    def __init__(self, type_: T.Type[enum.Enum]):
+        self.by_identity: T.Dict[int, str] = {}
+        for name, member in type_.__members__.items():
+            # (Aliases come after their members, whose names win, as they do
+            # in graphql-core)
+            self.by_identity.setdefault(id(member), name)
+        # Raw values are looked up by value first, then by name
+        self.by_value: T.Dict[T.Any, str] = {
+            name: self.by_identity[id(member)]
+            for name, member in type_.__members__.items()
+        }
+        for member in type_:
+            try:
+                self.by_value[member.value] = self.by_identity[id(member)]
+            except TypeError:
+                # Unhashable values are left to Graphene
+                pass
+
+    def bind(self, fallback: T.Callable[[T.Any], T.Any]) -> T.Callable[[T.Any], T.Any]:
+        """
+        Return a function serializing values with these maps, or with
+        `fallback` (the enum type's own `serialize()`) if they aren't in them.
+        """
+        by_identity = self.by_identity
+        by_value = self.by_value
+
+        def serialize(value):
+            name = by_identity.get(id(value))
+            if name is None and not isinstance(value, enum.Enum):
+                try:
+                    name = by_value.get(value)
+                except TypeError:
+                    pass
+            return fallback(value) if name is None else name
+
+        return serialize
+
+
+def get_enum_serializer(graphene_enum: T.Type[Enum]) -> T.Optional[EnumSerializer]:
+    """Return the serializer of a Graphene enum converted from a Python enum, if any."""
+    return _enum_serializers.get(graphene_enum)
+
+
+def _get_union(
+    name: str, types: T.Sequence[T.Any], registry: Registry
+) -> T.Type[Union]:
+    """
+    Return a Graphene Union of `types`, reusing the one already created for
+    them in the registry (or its parents), if any.
+    """
+    types = tuple(types)
+    # Only unions of named types are shared (placeholders, say, are resolved
+    # in place)
+    cacheable = registry is not None and all(isinstance(t, type) for t in types)
+    union_cls = registry.get_union(name, types) if cacheable else None
+    if union_cls is None:
+        internal_meta_cls = type("Meta", (), {"types": types})
+        union_cls = type(name, (Union,), {"Meta": internal_meta_cls})
+        if cacheable:
+            registry.register_union(name, types, union_cls)
+    return union_cls
+
+
+def is_parametrized_generic_model(type_: T.Any) -> bool:
+    """Return whether `type_` is a generic Pydantic model with all its parameters filled in, e.g. `Page[Foo]`."""
+    metadata = getattr(type_, "__pydantic_generic_metadata__", None)
+    return bool(metadata and metadata["origin"] and not metadata["parameters"])
+
+
+def convert_generic_model(
+    type_: T.Type[BaseModel], registry: Registry
+) -> T.Union[Type[BaseType], Placeholder]:
+    """
+    Create a type of the registry's kind for a parametrized generic Pydantic
+    model, named after its generic origin and type arguments -- or return the
+    one already created for the same parametrization.
+
+    The generic models met while these types are being created (e.g. `Page[T]`
+    in `Page[Page[T]]`) get a placeholder and are worked through afterwards,
+    rather than recursively, and their placeholders are resolved at the end.
+    """
+    metadata = type_.__pydantic_generic_metadata__
+    obj_type = registry.get_type_for_generic_model(metadata["origin"], metadata["args"])
+    if obj_type:
+        return obj_type
+
+    # Put a placeholder in while the type is built, in case the model refers to
+    # itself (we'll resolve that below)
+    registry.add_placeholder_for_model(type_)
+    pending = getattr(_generic_conversion, "worklist", None)
+    if pending is not None:
+        pending.append((type_, registry))
+        return registry.get_type_for_model(type_)
+
+    _generic_conversion.worklist = worklist = [(type_, registry)]
+    created = []
+    try:
+        for generic_model, generic_registry in worklist:
+            metadata = generic_model.__pydantic_generic_metadata__
+            origin, args = metadata["origin"], metadata["args"]
+            if generic_registry.get_type_for_generic_model(origin, args):
+                continue
+            base_type = generic_registry._required_obj_type
+            name = construct_generic_class_name(origin, args)
+            if issubclass(base_type, graphene.InputObjectType):
+                name += "Input"
+            meta = type(
+                "Meta",
+                (),
+                {"model": generic_model, "registry": generic_registry, "name": name},
+            )
+            generic_type = type(
+                name, (base_type,), {"Meta": meta, "__doc__": origin.__doc__}
+            )
+            generic_registry.register_generic_model(origin, args, generic_type)
+            created.append(generic_type)
+    finally:
+        _generic_conversion.worklist = None
+    for generic_type in created:
+        generic_type.resolve_placeholders()
+    return created[0]
+
+
 def convert_generic_python_type(
     type_: T.Type,
     field: FieldInfo,
     registry: Registry,
     parent_type: T.Type = None,
     model: T.Type[BaseModel] = None,
-) -> T.Union[Type[T.Union[BaseType, List]], Placeholder]:  # noqa: C901
+) -> T.Union[Type[T.Union[BaseType, List]], Placeholder]:
     """
     Convert annotated Python generic types into the most appropriate Graphene
     Field type -- e.g., turn `typing.Union` into a Graphene Union.
     """
+    return _convert(
+        type_, _convert_generic_python_type, field, registry, parent_type, model
+    )
+
+
+def _convert_generic_python_type(  # noqa: C901
+    type_: T.Type,
+    field: FieldInfo,
+    registry: Registry,
+    parent_type: T.Type,
+    model: T.Type[BaseModel],
+) -> T.Union[Type[T.Union[BaseType, List]], Placeholder, _Nested]:
     origin = type_.__origin__
     if not origin:  # pragma: no cover  # this really should be impossible
         raise ConversionError(f"Don't know how to convert type {type_!r} ({field})")
 
+    if get_origin(type_) is Annotated:
+        # e.g. the `conlist()` inside another list; only the wrapped type matters
+        # here (see `get_list_bounds()`)
+        return _Nested((origin,), _first)
+
     # NOTE: This is a little clumsy, but working with generic types is; it's hard to
     # decide whether the origin type is a subtype of, say, T.Iterable since typical
     # Python functions like `isinstance()` don't work
     if origin == T.Union:
-        return convert_union_type(
-            type_, field, registry, parent_type=parent_type, model=model
-        )
+        return _convert_union_type(type_, field, registry, parent_type, model)
     elif hasattr(T, "Literal") and origin == T.Literal:
         return convert_literal_type(
             type_, field, registry, parent_type=parent_type, model=model
@@ -341,20 +716,213 @@ def convert_generic_python_type(
             )
         # Of course, we can only return a homogeneous type here, so we pick the
         # first of the wrapped types
-        inner_type = inner_types[0]
-        return List(
-            find_graphene_type(
-                inner_type, field, registry, parent_type=parent_type, model=model
-            )
-        )
-    elif origin in (T.Dict, T.Mapping, collections.OrderedDict, dict) or issubclass(
-        origin, collections.abc.Mapping
-    ):
-        raise ConversionError("Don't know how to handle mappings in Graphene.")
+        return _Nested((inner_types[0],), _list_of)
+    elif is_mapping_origin(origin):
+        return _convert_mapping_type(type_, field, registry, parent_type, model)
     else:
         raise ConversionError(f"Don't know how to handle {type_} (generic: {origin})")
 
 
+def _list_of(converted: T.List[T.Any]) -> List:
+    return List(converted[0])
+
+
+def is_mapping_origin(origin: T.Any) -> bool:
+    return origin in (T.Dict, T.Mapping, collections.OrderedDict, dict) or (
+        inspect.isclass(origin) and issubclass(origin, collections.abc.Mapping)
+    )
+
+
+def _resolve_entry_key(root, _info):
+    return root[0]
+
+
+def _resolve_entry_value(root, _info):
+    return root[1]
+
+
+def convert_mapping_type(
+    type_: T.Type,
+    field: FieldInfo,
+    registry: Registry,
+    parent_type: T.Type = None,
+    model: T.Type[BaseModel] = None,
+) -> List:
+    """
+    Convert an annotated Python mapping type, e.g. `Dict[str, Foo]`, into a
+    list of "entry" types with a `key` and a `value` field, so that clients can
+    select just what they need from the values. The entry types are shared by
+    every field with the same key and value types.
+
+    The resolvers of fields holding mappings have to turn them into (key,
+    value) pairs -- see `get_mapping_entries_adapter()`.
+    """
+    return _convert(type_, _convert_mapping_type, field, registry, parent_type, model)
+
+
+def _convert_mapping_type(
+    type_: T.Type,
+    field: FieldInfo,
+    registry: Registry,
+    parent_type: T.Type,
+    model: T.Type[BaseModel],
+) -> T.Union[List, _Nested]:
+    if registry and issubclass(registry._required_obj_type, graphene.InputObjectType):
+        raise ConversionError(
+            "Don't know how to handle mappings in Graphene input types."
+        )
+    # (On Python 3.8, a bare `Dict` has type variables for arguments)
+    args = get_args(type_)
+    if len(args) != 2:
+        raise ConversionError("Don't know how to handle mappings in Graphene.")
+    key_type, value_type = args
+
+    name = construct_mapping_entry_class_name(key_type, value_type)
+    entry_type = registry.get_mapping_entry_type(name) if registry else None
+    if entry_type:
+        return List(graphene.NonNull(entry_type))
+
+    def create_entry_type(converted: T.List[T.Any]) -> List:
+        key_graphene_type, value_graphene_type = converted
+        if isinstance(value_graphene_type, Placeholder):
+            # The entry type is shared, so rather than leaving the placeholder for
+            # `resolve_placeholders()`, look the type up when the schema is built
+            value_graphene_type = partial(
+                registry.get_type_for_model, value_graphene_type.model
+            )
+
+        if NONE_TYPE not in getattr(value_type, "__args__", ()):
+            value_graphene_type = graphene.NonNull(value_graphene_type)
+
+        entry_type = type(
+            name,
+            (graphene.ObjectType,),
+            {
+                "key": Field(
+                    graphene.NonNull(key_graphene_type), resolver=_resolve_entry_key
+                ),
+                "value": Field(value_graphene_type, resolver=_resolve_entry_value),
+            },
+        )
+        if registry:
+            registry.register_mapping_entry_type(name, entry_type)
+        return List(graphene.NonNull(entry_type))
+
+    return _Nested((key_type, value_type), create_entry_type)
+
+
+def get_mapping_entries_adapter(
+    type_: T.Any,
+) -> T.Optional[T.Callable[[T.Any], T.Any]]:
+    """
+    Return a function that lazily turns the mappings found in a value of the
+    annotated type `type_` (however deeply nested in lists or other mappings)
+    into iterables of (key, value) pairs, to be resolved by the entry types
+    generated by `convert_mapping_type()`. Returns None if there aren't any.
+    """
+    # Whether each level of nesting is a mapping (or else an iterable)
+    levels: T.List[bool] = []
+    while True:
+        origin = get_origin(type_)
+        args = get_args(type_)
+        if origin is None or not args:
+            break
+        if origin is Annotated:
+            type_ = args[0]
+        elif origin is T.Union or (PYTHON10 and origin is UnionType):
+            inner_types = [x for x in args if x is not NONE_TYPE]
+            if len(inner_types) != 1:
+                break
+            type_ = inner_types[0]
+        elif is_mapping_origin(origin):
+            levels.append(True)
+            if len(args) != 2:
+                break
+            type_ = args[1]
+        else:
+            levels.append(False)
+            type_ = args[0]
+
+    # Only the levels down to the innermost mapping need adapting
+    while levels and not levels[-1]:
+        levels.pop()
+    adapter = None
+    for is_mapping in reversed(levels):
+        adapter = (_adapt_mapping if is_mapping else _adapt_iterable)(adapter)
+    return adapter
+
+
+def _adapt_mapping(
+    value_adapter: T.Optional[T.Callable[[T.Any], T.Any]]
+) -> T.Callable[[T.Any], T.Any]:
+    def adapt_mapping(value):
+        if value is None:
+            return None
+        if value_adapter is None:
+            return value.items()
+        return ((k, value_adapter(v)) for k, v in value.items())
+
+    return adapt_mapping
+
+
+def _adapt_iterable(
+    inner_adapter: T.Callable[[T.Any], T.Any]
+) -> T.Callable[[T.Any], T.Any]:
+    def adapt_iterable(value):
+        if value is None:
+            return None
+        return (inner_adapter(v) for v in value)
+
+    return adapt_iterable
+
+
+def get_list_bounds(field: FieldInfo) -> T.Tuple[T.Optional[int], ...]:
+    """
+    Return the most items each level of list nesting in a Pydantic field can
+    hold, outermost first, as given by `max_length` constraints (None where a
+    level is unbounded). A mapping counts as the list of its entries.
+    """
+    bounds: T.List[T.Optional[int]] = []
+    type_ = field.annotation
+    metadata = list(field.metadata)
+    while True:
+        origin = get_origin(type_)
+        args = get_args(type_)
+        if origin is Annotated:
+            type_ = args[0]
+            metadata.extend(args[1:])
+            continue
+        if origin is T.Union or (PYTHON10 and origin is UnionType):
+            inner_types = [x for x in args if x is not NONE_TYPE]
+            if len(inner_types) != 1:
+                break
+            type_ = inner_types[0]
+            continue
+        if origin is None or not args:
+            break
+        if is_mapping_origin(origin):
+            bounds.append(_get_max_length(metadata))
+            break
+        if not (
+            origin in (T.Collection, T.Iterable, list, set, tuple)
+            or (
+                inspect.isclass(origin) and issubclass(origin, collections.abc.Sequence)
+            )
+        ):
+            break
+        bounds.append(_get_max_length(metadata))
+        type_ = args[0]
+        metadata = []
+    return tuple(bounds)
+
+
+def _get_max_length(metadata: T.Iterable[T.Any]) -> T.Optional[int]:
+    max_lengths = [
+        m.max_length for m in metadata if getattr(m, "max_length", None) is not None
+    ]
+    return min(max_lengths) if max_lengths else None
+
+
 def convert_union_type(
     type_: T.Type,
     field: FieldInfo,
@@ -365,27 +933,31 @@ def convert_union_type(
     """
     Convert an annotated Python Union type into a Graphene Union.
     """
-    inner_types = type_.__args__
-    # We use a little metaprogramming -- create our own unique
-    # subclass of graphene.Union that knows its constituent Graphene types
-    parent_types = tuple(
-        find_graphene_type(x, field, registry, parent_type=parent_type, model=model)
-        for x in inner_types
-        if x != NONE_TYPE
-    )
+    return _convert(type_, _convert_union_type, field, registry, parent_type, model)
 
-    # This is effectively a typing.Optional[T], which decomposes into a
-    # typing.Union[None, T] -- we can return the Graphene type for T directly
-    # since Pydantic will have already parsed it as optional
-    if len(parent_types) == 1:
-        return parent_types[0]
 
-    internal_meta_cls = type("Meta", (), {"types": parent_types})
+def _convert_union_type(
+    type_: T.Type,
+    field: FieldInfo,
+    registry: Registry,
+    parent_type: T.Type,
+    model: T.Type[BaseModel],
+) -> _Nested:
+    inner_types = type_.__args__
 
-    union_cls = type(
-        construct_union_class_name(inner_types), (Union,), {"Meta": internal_meta_cls}
-    )
-    return union_cls
+    def create_union(parent_types: T.List[T.Any]):
+        # This is effectively a typing.Optional[T], which decomposes into a
+        # typing.Union[None, T] -- we can return the Graphene type for T directly
+        # since Pydantic will have already parsed it as optional
+        if len(parent_types) == 1:
+            return parent_types[0]
+        # We use a little metaprogramming -- create our own unique
+        # subclass of graphene.Union that knows its constituent Graphene types
+        return _get_union(
+            construct_union_class_name(inner_types), parent_types, registry
+        )
+
+    return _Nested(tuple(x for x in inner_types if x != NONE_TYPE), create_union)
 
 
 def convert_literal_type(
@@ -411,13 +983,10 @@ def convert_literal_type(
     if len(graphene_scalar_types) == 1:
         return graphene_scalar_types[0]
 
-    internal_meta_cls = type("Meta", (), {"types": graphene_scalar_types})
-
-    union_cls = type(
+    return _get_union(
         construct_union_class_name(
             sorted(scalar_types, key=lambda x: x.__class__.__name__)
         ),
-        (Union,),
-        {"Meta": internal_meta_cls},
+        graphene_scalar_types,
+        registry,
     )
-    return union_cls
@@ -0,0 +1,219 @@
+"""
+Estimate the worst-case cost of GraphQL operations from the bounds Pydantic
+constraints (like `max_length`) put on the size of lists, and reject
+operations over a budget before they're executed.
+"""
+import typing as T
+import weakref
+
+import graphene
+from graphene.utils.str_converters import to_camel_case
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLNamedType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    get_named_type,
+    is_list_type,
+    is_non_null_type,
+    parse,
+)
+from graphql.validation import ValidationContext, ValidationRule
+
+# How many items a list without a known bound is assumed to hold
+DEFAULT_LIST_SIZE = 100
+
+# The list bounds of the fields of each GraphQL type, by field name
+_list_bounds_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_list_bounds(
+    parent_type: GraphQLNamedType, field_name: str
+) -> T.Tuple[T.Optional[int], ...]:
+    """
+    Return the bounds on each level of list nesting (outermost first) recorded
+    when the Graphene field `field_name` of `parent_type` was converted from a
+    Pydantic field, or an empty tuple if none were.
+    """
+    try:
+        bounds = _list_bounds_cache[parent_type]
+    except KeyError:
+        bounds = {}
+        graphene_type = getattr(parent_type, "graphene_type", None)
+        fields = getattr(getattr(graphene_type, "_meta", None), "fields", None) or {}
+        for attr_name, field in fields.items():
+            field_bounds = getattr(field, "list_bounds", None)
+            if not field_bounds:
+                continue
+            # The schema may or may not have camel-cased the name
+            names = (
+                (field.name,) if field.name else (attr_name, to_camel_case(attr_name))
+            )
+            for name in names:
+                bounds[name] = field_bounds
+        _list_bounds_cache[parent_type] = bounds
+    return bounds.get(field_name, ())
+
+
+class CostEstimator:
+    """
+    Estimate the worst-case cost of operations against a schema: every field
+    selected costs 1, plus the cost of its own selections, times the most
+    items any lists it returns can hold.
+
+    Fragments on different types are all counted, so the estimate is an upper
+    bound for selections on interfaces and unions.
+    """
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        fragments: T.Mapping[str, FragmentDefinitionNode],
+        default_list_size: int = DEFAULT_LIST_SIZE,
+    ):
+        self.schema = schema
+        self.fragments = fragments
+        self.default_list_size = default_list_size
+
+    def operation_cost(self, operation: OperationDefinitionNode) -> int:
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            return 0
+        return self.selection_set_cost(root_type, operation.selection_set, ())
+
+    def selection_set_cost(
+        self,
+        parent_type: GraphQLNamedType,
+        selection_set: SelectionSetNode,
+        spreads: T.Tuple[str, ...],
+    ) -> int:
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                cost += self.field_cost(parent_type, selection, spreads)
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent_type
+                if selection.type_condition:
+                    fragment_type = self.schema.get_type(
+                        selection.type_condition.name.value
+                    )
+                if fragment_type is not None:
+                    cost += self.selection_set_cost(
+                        fragment_type, selection.selection_set, spreads
+                    )
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                # Cycles are reported by another rule; just don't follow them
+                if fragment is None or name in spreads:
+                    continue
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+                if fragment_type is not None:
+                    cost += self.selection_set_cost(
+                        fragment_type, fragment.selection_set, spreads + (name,)
+                    )
+        return cost
+
+    def field_cost(
+        self,
+        parent_type: GraphQLNamedType,
+        node: FieldNode,
+        spreads: T.Tuple[str, ...],
+    ) -> int:
+        name = node.name.value
+        field_def = getattr(parent_type, "fields", {}).get(name)
+        # Introspection is free, and unknown fields are reported by another rule
+        if field_def is None or name.startswith("__"):
+            return 0
+
+        cost = 1
+        if node.selection_set:
+            cost += self.selection_set_cost(
+                get_named_type(field_def.type), node.selection_set, spreads
+            )
+
+        bounds = get_list_bounds(parent_type, name)
+        type_ = field_def.type
+        depth = 0
+        while True:
+            if is_non_null_type(type_):
+                type_ = type_.of_type
+            elif is_list_type(type_):
+                bound = bounds[depth] if depth < len(bounds) else None
+                cost *= self.default_list_size if bound is None else bound
+                type_ = type_.of_type
+                depth += 1
+            else:
+                return cost
+
+
+def _get_definitions(document: DocumentNode):
+    operations = {}
+    fragments = {}
+    for definition in document.definitions:
+        if isinstance(definition, OperationDefinitionNode):
+            name = definition.name.value if definition.name else "anonymous"
+            operations[name] = definition
+        elif isinstance(definition, FragmentDefinitionNode):
+            fragments[definition.name.value] = definition
+    return operations, fragments
+
+
+def estimate_query_cost(
+    schema: T.Union[graphene.Schema, GraphQLSchema],
+    query: T.Union[str, DocumentNode],
+    default_list_size: int = DEFAULT_LIST_SIZE,
+) -> T.Dict[str, int]:
+    """Return the estimated worst-case cost of each operation in `query`, by name."""
+    if isinstance(schema, graphene.Schema):
+        schema = schema.graphql_schema
+    if isinstance(query, str):
+        query = parse(query)
+    operations, fragments = _get_definitions(query)
+    estimator = CostEstimator(schema, fragments, default_list_size)
+    return {
+        name: estimator.operation_cost(operation)
+        for name, operation in operations.items()
+    }
+
+
+def cost_limit_validator(
+    max_cost: int,
+    default_list_size: int = DEFAULT_LIST_SIZE,
+    callback: T.Optional[T.Callable[[T.Dict[str, int]], None]] = None,
+) -> T.Type[ValidationRule]:
+    """
+    Return a validation rule that rejects operations whose estimated worst-case
+    cost (see `CostEstimator`) is over `max_cost`. Lists whose size isn't
+    bounded by a Pydantic constraint are assumed to hold `default_list_size`
+    items. If given, `callback` is called with the cost of each operation.
+    """
+
+    class CostLimitValidator(ValidationRule):
+        def __init__(self, validation_context: ValidationContext):
+            super().__init__(validation_context)
+            operations, fragments = _get_definitions(validation_context.document)
+            estimator = CostEstimator(
+                validation_context.schema, fragments, default_list_size
+            )
+            costs = {}
+            for name, operation in operations.items():
+                cost = costs[name] = estimator.operation_cost(operation)
+                if cost > max_cost:
+                    validation_context.report_error(
+                        GraphQLError(
+                            f"'{name}' exceeds maximum operation cost of {max_cost}"
+                            f" (estimated: {cost}).",
+                            [operation],
+                        )
+                    )
+            if callable(callback):
+                callback(costs)
+
+    return CostLimitValidator
@@ -5,9 +5,12 @@ import pydantic
 from graphene import InputField
 from graphene.types.inputobjecttype import InputObjectTypeOptions
 from graphene.types.utils import yank_fields_from_attrs
+from graphql import Undefined
 
 from .converters import convert_pydantic_input_field
 from .registry import Placeholder, Registry, get_global_registry
+from .tracing import traced
+from .validation import validate_sent_fields
 
 
 class PydanticInputObjectTypeOptions(InputObjectTypeOptions):
@@ -15,15 +18,20 @@ class PydanticInputObjectTypeOptions(InputObjectTypeOptions):
     # It's not clear what purpose this serves within Graphene, or whether
     # it'd be meaningful to construct this from the pydantic.Config associated
     # with a given model, so skipping it for now.
-    pass
 
+    def set_model(self, model: T.Type[pydantic.BaseModel]):
+        """Point these (frozen) options at a new version of their model."""
+        object.__setattr__(self, "model", model)
 
+
+@traced("graphene_pydantic.construct_fields", type="obj_type", model="model")
 def construct_fields(
     obj_type: T.Type["PydanticInputObjectType"],
     model: T.Type[pydantic.BaseModel],
     registry: Registry,
     only_fields: T.Tuple[str, ...],
     exclude_fields: T.Tuple[str, ...],
+    exclude_unset: bool = False,
 ) -> T.Dict[str, InputField]:
     """
     Construct all the fields for a PydanticInputObjectType.
@@ -31,7 +39,11 @@ def construct_fields(
     NOTE: Currently simply fetches all the attributes from the Pydantic model
     `__fields__`. In the future we hope to implement field-level overrides that
     we'll have to merge in.
+
+    With `exclude_unset`, the fields get no default values, so that the input
+    only has the fields the client sent.
     """
+    field_kwargs = {"default_value": Undefined} if exclude_unset else {}
     excluded: T.Tuple[str, ...] = ()
     if exclude_fields:
         excluded = exclude_fields
@@ -55,7 +67,7 @@ def construct_fields(
             field.annotation = T.Optional[base_type]
 
         converted = convert_pydantic_input_field(
-            field, registry, parent_type=obj_type, model=model
+            field, registry, parent_type=obj_type, model=model, **field_kwargs
         )
         registry.register_object_field(obj_type, name, field)
         fields[name] = converted
@@ -76,6 +88,8 @@ class PydanticInputObjectType(graphene.InputObjectType):
         skip_registry: bool = False,
         only_fields: T.Tuple[str, ...] = (),
         exclude_fields: T.Tuple[str, ...] = (),
+        exclude_unset: bool = False,
+        create_nested: bool = False,
         id=None,
         _meta=None,
         **options,
@@ -96,6 +110,14 @@ class PydanticInputObjectType(graphene.InputObjectType):
         if not registry:
             registry = get_global_registry(PydanticInputObjectType)
 
+        if create_nested:
+            # (Imported here, as it depends on this module)
+            from .bulk import create_nested_input_types
+
+            create_nested_input_types(
+                model, registry, create_nested=True, exclude_unset=exclude_unset
+            )
+
         pydantic_fields = yank_fields_from_attrs(
             construct_fields(
                 obj_type=cls,
@@ -103,6 +125,7 @@ class PydanticInputObjectType(graphene.InputObjectType):
                 registry=registry,
                 only_fields=only_fields,
                 exclude_fields=exclude_fields,
+                exclude_unset=exclude_unset,
             ),
             _as=InputField,
             sort=False,
@@ -113,6 +136,10 @@ class PydanticInputObjectType(graphene.InputObjectType):
 
         _meta.model = model
         _meta.registry = registry
+        _meta.only_fields = only_fields
+        _meta.exclude_fields = exclude_fields
+        _meta.exclude_unset = exclude_unset
+        _meta.create_nested = create_nested
 
         if _meta.fields:
             _meta.fields.update(pydantic_fields)
@@ -125,8 +152,53 @@ class PydanticInputObjectType(graphene.InputObjectType):
 
         if not skip_registry:
             registry.register(cls)
+            if create_nested:
+                # Nested types referring back to this one
+                for dependent in registry.get_dependents(model):
+                    dependent.resolve_placeholders()
+
+    @classmethod
+    def to_model(cls, value: T.Mapping[str, T.Any]) -> pydantic.BaseModel:
+        """
+        Validate an input value of this type (as passed to a resolver) into an
+        instance of its model. Only the fields in the input are validated, and
+        only they end up in the instance's `model_fields_set`; see
+        `validate_sent_fields()`.
+        """
+        return validate_sent_fields(cls._meta.model, value)
+
+    @classmethod
+    def rebuild(cls, model: T.Optional[T.Type[pydantic.BaseModel]] = None):
+        """
+        Reconvert all the fields of this class from its Pydantic model, in place,
+        e.g. after the model has changed. If given, `model` replaces the model
+        (say, a new version of it from a reloaded module).
+        """
+        meta = cls._meta
+        registered = meta.registry.get_type_for_model(meta.model) is cls
+        if model is not None:
+            meta.set_model(model)
+        old_names = set(meta.registry._registry_object_fields.pop(cls, {}))
+        fields = yank_fields_from_attrs(
+            construct_fields(
+                obj_type=cls,
+                model=meta.model,
+                registry=meta.registry,
+                only_fields=meta.only_fields,
+                exclude_fields=meta.exclude_fields,
+                exclude_unset=meta.exclude_unset,
+            ),
+            _as=InputField,
+            sort=False,
+        )
+        fields.update((k, v) for k, v in meta.fields.items() if k not in old_names)
+        meta.fields.clear()
+        meta.fields.update(fields)
+        if registered:
+            meta.registry.register(cls)
 
     @classmethod
+    @traced("graphene_pydantic.resolve_placeholders", type="cls")
     def resolve_placeholders(cls):
         """
         If this class has any placeholders in the registry (e.g. classes that
@@ -141,16 +213,17 @@ class PydanticInputObjectType(graphene.InputObjectType):
             while hasattr(target_type, "of_type"):
                 target_type = target_type.of_type
             if isinstance(target_type, Placeholder):
-                pydantic_field = meta.model.model_fields[name]
+                pydantic_field = meta.registry.get_object_field_for_graphene_field(
+                    cls, name
+                )
                 graphene_field = convert_pydantic_input_field(
                     pydantic_field,
                     meta.registry,
                     parent_type=cls,
                     model=target_type.model,
+                    **({"default_value": Undefined} if meta.exclude_unset else {}),
                 )
                 fields_to_update[name] = graphene_field
-                meta.registry.register_object_field(
-                    cls, name, pydantic_field, model=target_type.model
-                )
+                meta.registry.register_object_field(cls, name, pydantic_field)
         # update the graphene side of things
         meta.fields.update(fields_to_update)
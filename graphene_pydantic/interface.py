@@ -0,0 +1,282 @@
+import typing as T
+import weakref
+
+import graphene
+import pydantic
+from graphene.types.interface import InterfaceOptions
+from graphene.types.utils import yank_fields_from_attrs
+from pydantic.fields import FieldInfo
+
+from .columnar import ColumnarRow
+from .converters import convert_pydantic_field
+from .registry import Placeholder, Registry, get_global_registry
+from .tracing import traced
+
+
+class PydanticInterfaceOptions(InterfaceOptions):
+    def set_model(self, model: T.Type[pydantic.BaseModel]):
+        """Point these (frozen) options at a new version of their model."""
+        object.__setattr__(self, "model", model)
+
+
+@traced("graphene_pydantic.construct_fields", type="iface", model="model")
+def construct_fields(
+    iface: T.Type["PydanticInterface"],
+    model: T.Type[pydantic.BaseModel],
+    registry: Registry,
+    only_fields: T.Tuple[str, ...],
+    exclude_fields: T.Tuple[str, ...],
+) -> T.Tuple[T.Dict[str, graphene.Field], T.Dict[str, FieldInfo]]:
+    """
+    Construct all the fields for a PydanticInterface, returning both the
+    Graphene fields and the Pydantic fields they were converted from.
+    """
+    excluded: T.Tuple[str, ...] = ()
+    if exclude_fields:
+        excluded = exclude_fields
+    elif only_fields:
+        excluded = tuple(k for k in model.model_fields if k not in only_fields)
+
+    model_fields = {k: v for k, v in model.model_fields.items() if k not in excluded}
+    fields = {
+        name: convert_pydantic_field(
+            name, field, registry, parent_type=iface, model=model
+        )
+        for name, field in model_fields.items()
+    }
+    return fields, model_fields
+
+
+def get_model_interfaces(
+    model: T.Type[pydantic.BaseModel], registry: Registry
+) -> T.List[T.Type["PydanticInterface"]]:
+    """
+    Return the interfaces a type for `model` should implement: one for each of
+    its Pydantic base classes (created on demand if one hasn't been declared
+    yet), plus the model's own if one has been declared.
+    """
+    interfaces = []
+    for base in model.__mro__:
+        if (
+            not isinstance(base, type)
+            or not issubclass(base, pydantic.BaseModel)
+            or base is pydantic.BaseModel
+        ):
+            continue
+        iface = registry.get_interface_for_model(base)
+        if iface is None and base is not model:
+            meta = type("Meta", (), {"model": base, "registry": registry})
+            iface = type(
+                f"{base.__name__}Interface", (PydanticInterface,), {"Meta": meta}
+            )
+        if iface is not None:
+            interfaces.append(iface)
+    return interfaces
+
+
+# The attributes of a field that decide how it's converted
+_FIELD_ATTRIBUTES = (
+    "annotation",
+    "default",
+    "default_factory",
+    "alias",
+    "description",
+    "metadata",
+)
+
+
+def is_same_field(field: FieldInfo, other: FieldInfo) -> bool:
+    """
+    Pydantic copies the fields a model inherits from its bases, so compare
+    them by their attributes rather than identity (their reprs aren't enough:
+    distinct models can share a name, e.g. from `create_model()`).
+    """
+    if field is other:
+        return True
+    return all(
+        _is_same_value(getattr(field, attr), getattr(other, attr))
+        for attr in _FIELD_ATTRIBUTES
+    )
+
+
+def _is_same_value(value: T.Any, other: T.Any) -> bool:
+    if value is other:
+        return True
+    try:
+        return bool(value == other)
+    except Exception:
+        return False
+
+
+def _is_in_schema(obj_type: T.Type, schema) -> bool:
+    if schema is None:
+        return True
+    named_type = schema.get_type(obj_type._meta.name)
+    return getattr(named_type, "graphene_type", None) is obj_type
+
+
+class PydanticInterface(graphene.Interface):
+    """Graphene Interface that knows how to map itself to a Pydantic model defined in its nested `Meta` class."""
+
+    @classmethod
+    def __init_subclass_with_meta__(
+        cls,
+        model: type = None,
+        registry: Registry = None,
+        skip_registry: bool = False,
+        only_fields: T.Tuple[str, ...] = (),
+        exclude_fields: T.Tuple[str, ...] = (),
+        _meta=None,
+        **options,
+    ):
+        assert model and issubclass(
+            model, pydantic.BaseModel
+        ), f'You need to pass a valid Pydantic model in {cls.__name__}.Meta, received "{model}"'
+
+        assert isinstance(
+            registry, (Registry, None.__class__)
+        ), f'The attribute registry in {cls.__name__} needs to be an instance of Registry, received "{registry}".'
+
+        if only_fields and exclude_fields:
+            raise ValueError(
+                "The options 'only_fields' and 'exclude_fields' cannot be both set on the same type."
+            )
+
+        # Interfaces share the registry of the object types, since that's where
+        # the types of their fields are found
+        if not registry:
+            from .objecttype import PydanticObjectType
+
+            registry = get_global_registry(PydanticObjectType)
+
+        if not cls.__doc__:
+            cls.__doc__ = model.__doc__
+
+        fields, model_fields = construct_fields(
+            iface=cls,
+            model=model,
+            registry=registry,
+            only_fields=only_fields,
+            exclude_fields=exclude_fields,
+        )
+        pydantic_fields = yank_fields_from_attrs(fields, _as=graphene.Field, sort=False)
+
+        if not _meta:
+            _meta = PydanticInterfaceOptions(cls)
+
+        _meta.model = model
+        _meta.registry = registry
+        _meta.only_fields = only_fields
+        _meta.exclude_fields = exclude_fields
+        _meta.model_fields = model_fields
+        # The types implementing this interface, by registry and model, so
+        # `resolve_type` doesn't have to try each of them in turn (and the
+        # overlays of a registry don't replace its own types)
+        _meta.implementations = {}
+        # What `resolve_type` found for each model, by schema
+        _meta.resolved_types = weakref.WeakKeyDictionary()
+
+        if _meta.fields:
+            _meta.fields.update(pydantic_fields)
+        else:
+            _meta.fields = pydantic_fields
+
+        super().__init_subclass_with_meta__(_meta=_meta, **options)
+
+        if not skip_registry:
+            registry.register_interface(cls)
+
+    @classmethod
+    def add_implementation(
+        cls, model: T.Type[pydantic.BaseModel], obj_type: T.Type[graphene.ObjectType]
+    ):
+        registry = getattr(obj_type._meta, "registry", None) or cls._meta.registry
+        cls._meta.implementations.setdefault(registry, {})[model] = obj_type
+        cls._meta.resolved_types.clear()
+
+    @classmethod
+    def resolve_type(cls, instance, info):
+        model = (
+            instance._batch.model
+            if isinstance(instance, ColumnarRow)
+            else type(instance)
+        )
+        schema = info.schema if info is not None else None
+        resolved_types = (
+            cls._meta.resolved_types.setdefault(schema, {})
+            if schema is not None
+            else {}
+        )
+        try:
+            return resolved_types[model]
+        except KeyError:
+            pass
+        # Use the implementation for the nearest class in the model's hierarchy,
+        # from whichever registry's types are in the schema, and remember the
+        # answer for next time
+        candidates = []
+        for implementations in cls._meta.implementations.values():
+            obj_type = next(
+                (implementations[b] for b in model.__mro__ if b in implementations),
+                None,
+            )
+            if obj_type is not None:
+                candidates.append(obj_type)
+        obj_type = next(
+            (t for t in candidates if _is_in_schema(t, schema)),
+            candidates[0] if candidates else None,
+        )
+        if obj_type is not None:
+            resolved_types[model] = obj_type
+        return obj_type
+
+    @classmethod
+    def rebuild(cls, model: T.Optional[T.Type[pydantic.BaseModel]] = None):
+        """
+        Reconvert all the fields of this interface from its Pydantic model, in
+        place. If given, `model` replaces the model.
+        """
+        meta = cls._meta
+        registered = meta.registry.get_interface_for_model(meta.model) is cls
+        if model is not None:
+            meta.set_model(model)
+        fields, model_fields = construct_fields(
+            iface=cls,
+            model=meta.model,
+            registry=meta.registry,
+            only_fields=meta.only_fields,
+            exclude_fields=meta.exclude_fields,
+        )
+        fields = yank_fields_from_attrs(fields, _as=graphene.Field, sort=False)
+        fields.update(
+            (k, v) for k, v in meta.fields.items() if k not in meta.model_fields
+        )
+        meta.fields.clear()
+        meta.fields.update(fields)
+        meta.model_fields.clear()
+        meta.model_fields.update(model_fields)
+        if registered:
+            meta.registry.register_interface(cls)
+
+    @classmethod
+    @traced("graphene_pydantic.resolve_placeholders", type="cls")
+    def resolve_placeholders(cls):
+        """
+        Resolve any placeholders in the fields of this interface as far as
+        possible (see `PydanticObjectType.resolve_placeholders()`).
+        """
+        meta = cls._meta
+        fields_to_update = {}
+        for name, field in meta.fields.items():
+            target_type = field.type
+            while hasattr(target_type, "of_type"):
+                target_type = target_type.of_type
+            if isinstance(target_type, Placeholder):
+                fields_to_update[name] = convert_pydantic_field(
+                    name,
+                    meta.model_fields[name],
+                    meta.registry,
+                    parent_type=cls,
+                    model=target_type.model,
+                )
+        meta.fields.update(fields_to_update)
@@ -0,0 +1,63 @@
+"""
+Per-request memoization of resolvers, so fields that are costly to compute
+(like Pydantic computed fields) run once per object in each request, however
+many times the object shows up in the response.
+"""
+import collections.abc
+import inspect
+import typing as T
+
+# Where the cache is kept on the context of each request
+REQUEST_CACHE_KEY = "graphene_pydantic_cache"
+
+
+def get_request_cache(context: T.Any) -> T.Optional[T.Dict[T.Hashable, T.Any]]:
+    """
+    Return the memoization cache of the request `context` belongs to. It's kept
+    on the context itself: under `REQUEST_CACHE_KEY` if the context is a
+    mutable mapping, or else as an attribute. Returns None if the context can't
+    hold one, in which case nothing is memoized.
+    """
+    if context is None:
+        return None
+    if isinstance(context, collections.abc.MutableMapping):
+        return context.setdefault(REQUEST_CACHE_KEY, {})
+    try:
+        return vars(context).setdefault(REQUEST_CACHE_KEY, {})
+    except TypeError:
+        return None
+
+
+def memoize_resolver(resolver: T.Callable, field_name: str) -> T.Callable:
+    """
+    Wrap `resolver` so that, within a request, it's only called once for each
+    object it resolves `field_name` on (and each set of arguments).
+    """
+
+    def resolve_memoized(root, info, **args):
+        cache = get_request_cache(info.context)
+        if cache is None:
+            return resolver(root, info, **args)
+        key = (id(root), field_name, tuple(sorted(args.items())))
+        try:
+            return cache[key][1]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable arguments
+            return resolver(root, info, **args)
+
+        value = resolver(root, info, **args)
+        if inspect.isawaitable(value):
+            import asyncio
+
+            # a future can be awaited again, unlike a coroutine
+            value = asyncio.ensure_future(value)
+        elif isinstance(value, collections.abc.Iterator):
+            value = list(value)
+        # Keep the object alive along with the value, so its id can't be reused
+        # by another object during the request
+        cache[key] = (root, value)
+        return value
+
+    return resolve_memoized
@@ -0,0 +1,150 @@
+import typing as T
+
+import graphene
+import pydantic
+from graphene.types.mutation import MutationOptions
+from graphene.utils.get_unbound_function import get_unbound_function
+from graphql import GraphQLError, Undefined
+
+from .bulk import register_models
+from .inputobjecttype import PydanticInputObjectType
+from .objecttype import PydanticObjectType
+from .registry import Placeholder, Registry, get_global_registry
+from .validation import validate_sent_fields
+
+
+class PydanticMutationOptions(MutationOptions):
+    input_model: T.Optional[T.Type[pydantic.BaseModel]] = None
+    output_model: T.Optional[T.Type[pydantic.BaseModel]] = None
+
+
+def _get_type(
+    model: T.Type[pydantic.BaseModel],
+    base: T.Type[T.Union[PydanticObjectType, PydanticInputObjectType]],
+    registry: Registry,
+    **options,
+):
+    """Return the type of `model` in `registry`, creating it if there's none."""
+    type_ = registry.get_type_for_model(model)
+    if type_ is None or isinstance(type_, Placeholder):
+        type_ = register_models([model], base, registry, **options)[model]
+    return type_
+
+
+def validation_error(
+    exc: pydantic.ValidationError, model: T.Type[pydantic.BaseModel]
+) -> GraphQLError:
+    """
+    Return the GraphQL error to report a failed validation of mutation
+    arguments with: its `validationErrors` extension lists the location (by
+    field name), message and type of each of the errors.
+    """
+    errors = exc.errors(include_url=False, include_context=False, include_input=False)
+    count = len(errors)
+    return GraphQLError(
+        f"{count} validation error{'s' if count > 1 else ''} for {model.__name__}",
+        extensions={"validationErrors": errors},
+    )
+
+
+class PydanticMutation(graphene.Mutation):
+    """
+    A Graphene Mutation whose arguments are the fields of a Pydantic model
+    (`input_model` in its `Meta`), and whose payload is the type of another one
+    (`output_model`). Both types are taken from their registries, or created if
+    there isn't one yet. `mutate()` receives the arguments validated into an
+    instance of the input model, and returns the payload, usually as an
+    instance of the output model:
+
+        class CreateUser(PydanticMutation):
+            class Meta:
+                input_model = UserCreateModel
+                output_model = UserModel
+
+            @staticmethod
+            def mutate(root, info, data: UserCreateModel) -> UserModel:
+                ...
+
+    The arguments are validated as they're passed to the resolver, without
+    going through an input object: only the arguments that were sent are
+    validated, with a validator cached for each set of them (see
+    `validate_sent_fields()`), and only they end up in the model's
+    `model_fields_set`. Validation errors are reported as a GraphQL error (see
+    `validation_error()`).
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def __init_subclass_with_meta__(
+        cls,
+        input_model: T.Optional[T.Type[pydantic.BaseModel]] = None,
+        output_model: T.Optional[T.Type[pydantic.BaseModel]] = None,
+        input_registry: T.Optional[Registry] = None,
+        output_registry: T.Optional[Registry] = None,
+        output=None,
+        arguments=None,
+        resolver=None,
+        _meta=None,
+        **options,
+    ):
+        assert input_model and issubclass(
+            input_model, pydantic.BaseModel
+        ), f'You need to pass a valid Pydantic model as input_model in {cls.__name__}.Meta, received "{input_model}"'
+
+        if output_model is not None and output is not None:
+            raise ValueError(
+                "The options 'output_model' and 'output' cannot be both set on the same mutation."
+            )
+
+        if not input_registry:
+            input_registry = get_global_registry(PydanticInputObjectType)
+        if not output_registry:
+            output_registry = get_global_registry(PydanticObjectType)
+
+        if arguments is None:
+            input_type = _get_type(
+                input_model, PydanticInputObjectType, input_registry, exclude_unset=True
+            )
+            # Without default values, so that only the arguments that were sent
+            # are validated, and set in the model
+            arguments = {
+                name: graphene.Argument(
+                    field.type,
+                    default_value=Undefined,
+                    description=field.description,
+                    name=field.name,
+                    deprecation_reason=field.deprecation_reason,
+                )
+                for name, field in input_type._meta.fields.items()
+            }
+
+        if output_model is not None:
+            output = _get_type(output_model, PydanticObjectType, output_registry)
+
+        if not resolver:
+            mutate = getattr(cls, "mutate", None)
+            assert mutate, "All mutations must define a mutate method in it"
+            mutate = get_unbound_function(mutate)
+
+            def resolver(root, info, **args):
+                try:
+                    data = validate_sent_fields(input_model, args)
+                except pydantic.ValidationError as exc:
+                    raise validation_error(exc, input_model) from exc
+                return mutate(root, info, data)
+
+        if not _meta:
+            _meta = PydanticMutationOptions(cls)
+
+        _meta.input_model = input_model
+        _meta.output_model = output_model
+
+        super().__init_subclass_with_meta__(
+            output=output,
+            arguments=arguments,
+            resolver=resolver,
+            _meta=_meta,
+            **options,
+        )
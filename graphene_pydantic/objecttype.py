@@ -1,13 +1,26 @@
+import collections.abc
 import typing as T
 
 import graphene
 import pydantic
 from graphene.types.objecttype import ObjectTypeOptions
 from graphene.types.utils import yank_fields_from_attrs
+from pydantic.fields import FieldInfo
 
-from .converters import convert_pydantic_field
+from .columnar import ColumnarRow
+from .converters import (
+    computed_field_info,
+    convert_pydantic_field,
+    is_default_resolver,
+)
 from .inputobjecttype import PydanticInputObjectType
+from .interface import PydanticInterface, get_model_interfaces, is_same_field
+from .memoize import memoize_resolver
 from .registry import Placeholder, Registry, get_global_registry
+from .tracing import traced
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .caching import FragmentCache
 
 
 class PydanticObjectTypeOptions(ObjectTypeOptions):
@@ -15,15 +28,29 @@ class PydanticObjectTypeOptions(ObjectTypeOptions):
     # It's not clear what purpose this serves within Graphene, or whether
     # it'd be meaningful to construct this from the pydantic.Config associated
     # with a given model, so skipping it for now.
-    pass
+
+    def set_model(self, model: T.Type[pydantic.BaseModel]):
+        """
+        Point these (frozen) options at a new version of their model, which the
+        type's interfaces then resolve to it too.
+        """
+        object.__setattr__(self, "model", model)
+        for iface in self.interfaces:
+            if issubclass(iface, PydanticInterface):
+                iface.add_implementation(model, self.class_type)
 
 
+@traced("graphene_pydantic.construct_fields", type="obj_type", model="model")
 def construct_fields(
     obj_type: T.Type["PydanticObjectType"],
     model: T.Type[pydantic.BaseModel],
     registry: Registry,
     only_fields: T.Tuple[str, ...],
     exclude_fields: T.Tuple[str, ...],
+    mapping_roots: bool = False,
+    interfaces: T.Sequence[T.Type[PydanticInterface]] = (),
+    memoized_fields: T.Tuple[str, ...] = (),
+    computed_fields: bool = False,
 ) -> T.Dict[str, graphene.Field]:
     """
     Construct all the fields for a PydanticObjectType.
@@ -31,27 +58,134 @@ def construct_fields(
     NOTE: Currently simply fetches all the attributes from the Pydantic model
     `__fields__`. In the future we hope to implement field-level overrides that
     we'll have to merge in.
+
+    Fields inherited unchanged from the model of one of `interfaces`, or from
+    a base class of `model` that has a type registered, are shared with that
+    type rather than converted again (see `find_shared_field()`).
+
+    If `computed_fields` is set, the model's computed fields are converted
+    along with its regular fields. The resolvers of the fields in
+    `memoized_fields` are memoized for each request (see `memoize_resolver()`).
     """
+    model_fields = dict(model.model_fields)
+    if computed_fields:
+        model_fields.update(
+            (k, computed_field_info(v)) for k, v in model.model_computed_fields.items()
+        )
+
     excluded: T.Tuple[str, ...] = ()
     if exclude_fields:
         excluded = exclude_fields
     elif only_fields:
-        excluded = tuple(k for k in model.model_fields if k not in only_fields)
+        excluded = tuple(k for k in model_fields if k not in only_fields)
 
-    fields_to_convert = (
-        (k, v) for k, v in model.model_fields.items() if k not in excluded
-    )
+    fields_to_convert = ((k, v) for k, v in model_fields.items() if k not in excluded)
+
+    # Types whose fields we may be able to share: the interfaces, and the types
+    # registered for the model's base classes
+    sources = list(interfaces)
+    for base in model.__mro__[1:]:
+        base_type = registry.get_type_for_model(base)
+        if isinstance(base_type, type) and issubclass(base_type, PydanticObjectType):
+            sources.append(base_type)
 
     fields = {}
     for name, field in fields_to_convert:
-        converted = convert_pydantic_field(
-            name, field, registry, parent_type=obj_type, model=model
-        )
+        shared = None
+        if (
+            sources
+            and name not in memoized_fields
+            and not callable(getattr(obj_type, "resolve_" + name, None))
+        ):
+            shared = find_shared_field(name, field, registry, sources, mapping_roots)
+        if shared:
+            source, converted = shared
+            registry.add_dependency(source._meta.model, obj_type)
+        else:
+            converted = convert_pydantic_field(
+                name,
+                field,
+                registry,
+                parent_type=obj_type,
+                model=model,
+                mapping_roots=mapping_roots,
+            )
+            if name in memoized_fields:
+                converted.resolver = memoize_resolver(converted.resolver, name)
         registry.register_object_field(obj_type, name, field)
         fields[name] = converted
     return fields
 
 
+def find_shared_field(
+    name: str,
+    field: FieldInfo,
+    registry: Registry,
+    sources: T.Iterable[T.Type[T.Union[PydanticInterface, "PydanticObjectType"]]],
+    mapping_roots: bool = False,
+) -> T.Optional[T.Tuple[T.Type, graphene.Field]]:
+    """
+    Find an already converted field, among the fields of the `sources` types,
+    that was converted from the same Pydantic field and uses a default resolver
+    of the kind we'd use, returning it along with the type it belongs to.
+    """
+    for source in sources:
+        if issubclass(source, PydanticInterface):
+            source_field = source._meta.model_fields.get(name)
+            source_mapping_roots = False
+        else:
+            source_field = registry.get_object_field_for_graphene_field(source, name)
+            source_mapping_roots = source._meta.mapping_roots
+        converted = source._meta.fields.get(name)
+        if (
+            source_field is not None
+            and converted is not None
+            and source_mapping_roots == mapping_roots
+            and is_default_resolver(converted.resolver)
+            and is_same_field(field, source_field)
+        ):
+            return source, converted
+    return None
+
+
+def get_discriminator_values(
+    model: T.Type[pydantic.BaseModel], discriminator: str
+) -> T.FrozenSet[T.Any]:
+    """
+    Return the values a mapping's `discriminator` key may hold for it to be
+    treated as an instance of `model`, taken from the model's `Literal` field.
+    """
+    field = model.model_fields.get(discriminator)
+    if field is None or T.get_origin(field.annotation) is not T.Literal:
+        raise ValueError(
+            f"The discriminator {discriminator!r} must be a Literal field of {model.__name__}."
+        )
+    return frozenset(T.get_args(field.annotation))
+
+
+def get_required_keys(
+    model: T.Type[pydantic.BaseModel], field_names: T.Iterable[str]
+) -> T.Tuple[T.Tuple[str, ...], ...]:
+    """
+    Return the keys a mapping needs to have to hold the required fields of
+    `model` among `field_names`: for each field, its name or its alias (which
+    the mapping resolvers fall back to).
+    """
+    model_fields = model.model_fields
+    required = []
+    for name in field_names:
+        field = model_fields.get(name)
+        if field is not None and field.is_required():
+            required.append((name, field.alias) if field.alias else (name,))
+    return tuple(required)
+
+
+def has_required_keys(
+    root: T.Mapping[str, T.Any], required_keys: T.Tuple[T.Tuple[str, ...], ...]
+) -> bool:
+    return all(any(key in root for key in keys) for keys in required_keys)
+
+
 # TODO: implement an OverrideField of some kind
 
 
@@ -66,6 +200,12 @@ class PydanticObjectType(graphene.ObjectType):
         skip_registry: bool = False,
         only_fields: T.Tuple[str, ...] = (),
         exclude_fields: T.Tuple[str, ...] = (),
+        mapping_roots: T.Optional[bool] = None,
+        discriminator: T.Optional[str] = None,
+        model_interfaces: bool = False,
+        memoized_fields: T.Tuple[str, ...] = (),
+        computed_fields: bool = False,
+        fragment_cache: T.Optional["FragmentCache"] = None,
         interfaces=(),
         id=None,
         _meta=None,
@@ -84,12 +224,28 @@ class PydanticObjectType(graphene.ObjectType):
                 "The options 'only_fields' and 'exclude_fields' cannot be both set on the same type."
             )
 
+        if fragment_cache is not None and not model.model_config.get("frozen"):
+            raise ValueError(
+                f"Only types for frozen models can have a fragment cache, but {model.__name__} isn't frozen."
+            )
+
         if not registry:
             registry = get_global_registry(PydanticObjectType)
 
         if not cls.__doc__:
             cls.__doc__ = model.__doc__
 
+        if mapping_roots is None:
+            mapping_roots = registry.mapping_roots
+
+        if model_interfaces:
+            interfaces = tuple(interfaces) + tuple(
+                i for i in get_model_interfaces(model, registry) if i not in interfaces
+            )
+        pydantic_interfaces = tuple(
+            i for i in interfaces if issubclass(i, PydanticInterface)
+        )
+
         pydantic_fields = yank_fields_from_attrs(
             construct_fields(
                 obj_type=cls,
@@ -97,16 +253,33 @@ class PydanticObjectType(graphene.ObjectType):
                 registry=registry,
                 only_fields=only_fields,
                 exclude_fields=exclude_fields,
+                mapping_roots=mapping_roots,
+                interfaces=pydantic_interfaces,
+                memoized_fields=memoized_fields,
+                computed_fields=computed_fields,
             ),
             _as=graphene.Field,
             sort=False,
         )
 
+        converted_fields = dict(pydantic_fields)
+
         if not _meta:
             _meta = PydanticObjectTypeOptions(cls)
 
         _meta.model = model
         _meta.registry = registry
+        _meta.only_fields = only_fields
+        _meta.exclude_fields = exclude_fields
+        _meta.mapping_roots = mapping_roots
+        _meta.discriminator = discriminator
+        _meta.memoized_fields = memoized_fields
+        _meta.computed_fields = computed_fields
+        _meta.fragment_cache = fragment_cache
+        _meta.discriminator_values = (
+            get_discriminator_values(model, discriminator) if discriminator else None
+        )
+        _meta.required_keys = get_required_keys(model, pydantic_fields)
 
         if _meta.fields:
             _meta.fields.update(pydantic_fields)
@@ -115,21 +288,82 @@ class PydanticObjectType(graphene.ObjectType):
 
         _meta.id = id or "id"
 
-        # TODO: We don't currently do anything with interfaces, and it would
-        # be great to handle them as well. Some options include:
-        # - throwing an error if they're present, because we _can't_ handle them
-        # - finding a model class with that name and generating an interface
-        #   from it
-        # - using the nearest common ancestor of multiple types in a Union
-
         super().__init_subclass_with_meta__(
             _meta=_meta, interfaces=interfaces, **options
         )
 
+        # Graphene gives the fields of interfaces precedence over ours, but ours
+        # may use this type's own resolvers where they come from a model's
+        # interface (those of other interfaces, e.g. `relay.Node.id`, stay as
+        # they are)
+        model_interface_fields = {
+            name for iface in pydantic_interfaces for name in iface._meta.fields
+        }
+        for name, field in converted_fields.items():
+            if name in model_interface_fields and name not in cls.__dict__:
+                _meta.fields[name] = field
+
+        # Fields declared on the class itself are resolved by its own resolvers
+        for name in memoized_fields:
+            if name in converted_fields:
+                continue
+            field = _meta.fields.get(name) if name in cls.__dict__ else None
+            resolver = field and (
+                field.resolver or getattr(cls, "resolve_" + name, None)
+            )
+            if not callable(resolver):
+                raise ValueError(
+                    f"Can't memoize {cls.__name__}.{name}: it's neither a field of "
+                    "the model nor a field with a resolver declared on the class."
+                )
+            field.resolver = memoize_resolver(resolver, name)
+
+        for iface in pydantic_interfaces:
+            iface.add_implementation(model, cls)
+
         if not skip_registry:
             registry.register(cls)
 
     @classmethod
+    def rebuild(cls, model: T.Optional[T.Type[pydantic.BaseModel]] = None):
+        """
+        Reconvert all the fields of this class from its Pydantic model, in place,
+        e.g. after the model has changed. If given, `model` replaces the model
+        (say, a new version of it from a reloaded module).
+        """
+        meta = cls._meta
+        registered = meta.registry.get_type_for_model(meta.model) is cls
+        if model is not None:
+            meta.set_model(model)
+        old_names = set(meta.registry._registry_object_fields.pop(cls, {}))
+        fields = yank_fields_from_attrs(
+            construct_fields(
+                obj_type=cls,
+                model=meta.model,
+                registry=meta.registry,
+                only_fields=meta.only_fields,
+                exclude_fields=meta.exclude_fields,
+                mapping_roots=meta.mapping_roots,
+                interfaces=tuple(
+                    i for i in meta.interfaces if issubclass(i, PydanticInterface)
+                ),
+                memoized_fields=meta.memoized_fields,
+                computed_fields=meta.computed_fields,
+            ),
+            _as=graphene.Field,
+            sort=False,
+        )
+        fields.update((k, v) for k, v in meta.fields.items() if k not in old_names)
+        meta.fields.clear()
+        meta.fields.update(fields)
+        object.__setattr__(
+            meta, "required_keys", get_required_keys(meta.model, meta.fields)
+        )
+        if registered:
+            meta.registry.register(cls)
+
+    @classmethod
+    @traced("graphene_pydantic.resolve_placeholders", type="cls")
     def resolve_placeholders(cls):
         """
         If this class has any placeholders in the registry (e.g. classes that
@@ -144,14 +378,21 @@ class PydanticObjectType(graphene.ObjectType):
             while hasattr(target_type, "of_type"):
                 target_type = target_type.of_type
             if isinstance(target_type, Placeholder):
-                pydantic_field = meta.model.model_fields[name]
+                pydantic_field = meta.registry.get_object_field_for_graphene_field(
+                    cls, name
+                )
                 graphene_field = convert_pydantic_field(
                     name,
                     pydantic_field,
                     meta.registry,
                     parent_type=cls,
                     model=target_type.model,
+                    mapping_roots=meta.mapping_roots,
                 )
+                if name in meta.memoized_fields:
+                    graphene_field.resolver = memoize_resolver(
+                        graphene_field.resolver, name
+                    )
                 fields_to_update[name] = graphene_field
                 meta.registry.register_object_field(cls, name, pydantic_field)
         # update the graphene side of things
@@ -161,4 +402,24 @@ class PydanticObjectType(graphene.ObjectType):
     def is_type_of(cls, root, info) -> bool:
         if isinstance(root, PydanticInputObjectType):
             return type(root._meta.model) is type(cls._meta.model)  # noqa: E721
+        if isinstance(root, ColumnarRow):
+            return issubclass(root._batch.model, cls._meta.model)
+        if isinstance(root, collections.abc.Mapping):
+            return cls._is_mapping_type_of(root)
         return isinstance(root, cls._meta.model)
+
+    @classmethod
+    def _is_mapping_type_of(cls, root: T.Mapping[str, T.Any]) -> bool:
+        """
+        Decide whether a mapping root is an instance of this type, going by its
+        `__typename` key or the configured discriminator, if either is present,
+        or else by whether it has all the keys of the model's required fields.
+        """
+        meta = cls._meta
+        if not meta.mapping_roots:
+            return False
+        if "__typename" in root:
+            return root["__typename"] == meta.name
+        if meta.discriminator:
+            return root.get(meta.discriminator) in meta.discriminator_values
+        return has_required_keys(root, meta.required_keys)
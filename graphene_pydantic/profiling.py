@@ -0,0 +1,131 @@
+"""
+A low-overhead statistical profiler for resolvers.
+
+Timing every field of every request costs too much to leave on in production,
+so `SamplingProfiler` only profiles a random fraction of requests: the others
+run without it entirely, paying nothing but a call to `random()`. In the
+requests it does profile, it times each resolver and adds the time to the stack
+of fields (`Query.owners;Owner.pets;Pet.name`) it was resolved at. The
+aggregated stacks can be written out in the "folded" format that flame graph
+tools (`flamegraph.pl`, speedscope, ...) read.
+"""
+import inspect
+import random
+import threading
+import time
+import typing as T
+
+from graphql import GraphQLResolveInfo
+
+Stack = T.Tuple[str, ...]
+
+
+class SampleStats(T.NamedTuple):
+    """How many times the resolvers at a stack were sampled, and for how long."""
+
+    count: int
+    total_ns: int
+
+
+def get_stack(info: GraphQLResolveInfo) -> Stack:
+    """
+    Return the fields from the root of the operation down to the one being
+    resolved, as `Type.field` (using response keys, and leaving out list
+    indexes).
+    """
+    frames = []
+    path = info.path
+    while path is not None:
+        if not isinstance(path.key, int):
+            frames.append(f"{path.typename}.{path.key}")
+        path = path.prev
+    frames.reverse()
+    return tuple(frames)
+
+
+class SamplingProfiler:
+    """
+    A Graphene middleware that profiles a fraction `rate` of requests. Pass
+    `profiler.sample()` as the middleware of each request, which is either the
+    profiler itself or (most of the time) None:
+
+        schema.execute(query, middleware=profiler.sample())
+
+    Only the time spent in resolvers themselves is counted at each stack, as
+    flame graphs expect; for resolvers that return awaitables, that's until
+    they're done. As with any middleware, the execution contexts that skip
+    resolvers (see `graphene_pydantic.compiler` and
+    `graphene_pydantic.serialization`) run all of them in profiled requests.
+    """
+
+    def __init__(
+        self, rate: float = 0.01, random_source: T.Callable[[], float] = random.random
+    ):
+        if not 0 <= rate <= 1:
+            raise ValueError(f"The sampling rate must be between 0 and 1, not {rate}.")
+        self.rate = rate
+        self._random = random_source
+        self._lock = threading.Lock()
+        self._samples: T.Dict[Stack, T.List[int]] = {}
+
+    def sample(self) -> T.Optional[T.List["SamplingProfiler"]]:
+        """Return the middleware for a request: this profiler, if it's sampled."""
+        if self._random() < self.rate:
+            return [self]
+        return None
+
+    def resolve(self, next_, root, info: GraphQLResolveInfo, **args):
+        start = time.perf_counter_ns()
+        result = next_(root, info, **args)
+        if inspect.isawaitable(result):
+            return self._resolve_async(result, info, start)
+        self._record(info, time.perf_counter_ns() - start)
+        return result
+
+    async def _resolve_async(self, result, info: GraphQLResolveInfo, start: int):
+        try:
+            return await result
+        finally:
+            self._record(info, time.perf_counter_ns() - start)
+
+    def _record(self, info: GraphQLResolveInfo, elapsed_ns: int):
+        stack = get_stack(info)
+        with self._lock:
+            sample = self._samples.get(stack)
+            if sample is None:
+                self._samples[stack] = [1, elapsed_ns]
+            else:
+                sample[0] += 1
+                sample[1] += elapsed_ns
+
+    def stats(self) -> T.Dict[Stack, SampleStats]:
+        """Return the samples so far, by stack."""
+        with self._lock:
+            return {
+                stack: SampleStats(count, total_ns)
+                for stack, (count, total_ns) in self._samples.items()
+            }
+
+    def reset(self):
+        """Forget the samples so far."""
+        with self._lock:
+            self._samples.clear()
+
+    def folded(self, weight: str = "time") -> str:
+        """
+        Return the samples as folded stacks, one `frame;frame;frame value` line
+        per stack, weighted by the time spent at each (in microseconds) or, with
+        `weight="count"`, by how many times it was sampled.
+        """
+        if weight not in ("time", "count"):
+            raise ValueError(f"Can't weight stacks by {weight!r}.")
+        lines = []
+        for stack, sample in sorted(self.stats().items()):
+            value = sample.total_ns // 1000 if weight == "time" else sample.count
+            lines.append(f"{';'.join(stack)} {value}\n")
+        return "".join(lines)
+
+    def write_folded(self, path: str, weight: str = "time"):
+        """Write the samples as folded stacks (see `folded()`) to a file."""
+        with open(path, "w") as f:
+            f.write(self.folded(weight))
@@ -1,11 +1,14 @@
+import enum
 import typing
 from collections import defaultdict
-from typing import Dict, Generic, Optional, Type, TypeVar, Union
+from typing import Dict, Generic, Iterable, List, Optional, Set, Type, TypeVar, Union
 
 from graphene.types.base import BaseType
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
+from .util import model_fingerprint
+
 if typing.TYPE_CHECKING:  # pragma: no cover
     from graphene_pydantic import PydanticInputObjectType  # noqa: F401
     from graphene_pydantic import PydanticObjectType  # noqa: F401
@@ -35,15 +38,54 @@ class Placeholder:
 Output = Union[ObjectType, Placeholder]
 
 
+def _model_name(model: ModelType) -> str:
+    return f"{model.__module__}.{model.__qualname__}"
+
+
 class Registry(Generic[T]):
-    """Hold information about Pydantic models and how they (and their fields) map to Graphene types."""
+    """
+    Hold information about Pydantic models and how they (and their fields) map to Graphene types.
+
+    A registry with a `parent` is an overlay on it: lookups that find nothing
+    in the registry itself read through to the parent's types, enums and
+    unions, so several registries (say, one per API version) can share the
+    types of a common parent and only hold their own overrides and additions.
+    Change tracking (dependents, rebuilds) only covers a registry's own types.
+    """
 
-    def __init__(self, required_obj_type: ObjectType):
+    def __init__(
+        self,
+        required_obj_type: ObjectType,
+        mapping_roots: Optional[bool] = None,
+        parent: Optional["Registry"] = None,
+    ):
+        if parent is not None and parent._required_obj_type is not required_obj_type:
+            raise TypeError(
+                f"Can't overlay a registry of {required_obj_type!r} on one of "
+                f"{parent._required_obj_type!r}."
+            )
         self._required_obj_type: ObjectType = required_obj_type
+        self.parent = parent
+        # Default for types that don't set `mapping_roots` in their Meta
+        if mapping_roots is None:
+            mapping_roots = parent.mapping_roots if parent is not None else False
+        self.mapping_roots = mapping_roots
         self._registry: Dict[ModelType, Union[Type[BaseType], Placeholder]] = {}
         self._registry_object_fields: Dict[
             ObjectType, Dict[str, FieldInfo]
         ] = defaultdict(dict)
+        # Change tracking, so types can be rebuilt incrementally: what each
+        # model looked like when it was registered, which types refer to each
+        # model, and which models have been registered since the last rebuild
+        self._fingerprints: Dict[ModelType, str] = {}
+        self._dependents: Dict[ModelType, Set[ObjectType]] = defaultdict(set)
+        self._new_models: Set[ModelType] = set()
+        self._interfaces: Dict[ModelType, Type[BaseType]] = {}
+        self._interface_fingerprints: Dict[ModelType, str] = {}
+        self._generic_types: Dict[typing.Tuple[ModelType, tuple], Type[BaseType]] = {}
+        self._mapping_entry_types: Dict[str, Type[BaseType]] = {}
+        self._enums: Dict[Type[enum.Enum], Type[BaseType]] = {}
+        self._unions: Dict[typing.Tuple[str, tuple], Type[BaseType]] = {}
 
     def register(self, obj_type: ObjectType):
         assert_is_correct_type(obj_type, self._required_obj_type)
@@ -51,15 +93,78 @@ class Registry(Generic[T]):
         assert (
             obj_type._meta.registry == self
         ), "Can't register models linked to another Registry"
-        self._registry[obj_type._meta.model] = obj_type
+        model = obj_type._meta.model
+        self._registry[model] = obj_type
+        self._fingerprints[model] = model_fingerprint(model)
+        self._new_models.add(model)
 
     def get_type_for_model(
         self, model: ModelType
     ) -> Union[Type[BaseType], Placeholder]:
-        return self._registry.get(model)
+        obj_type = self._registry.get(model)
+        if obj_type is None and self.parent is not None:
+            return self.parent.get_type_for_model(model)
+        return obj_type
+
+    def register_interface(self, iface: Type[BaseType]):
+        assert (
+            iface._meta.registry == self
+        ), "Can't register interfaces linked to another Registry"
+        model = iface._meta.model
+        self._interfaces[model] = iface
+        self._interface_fingerprints[model] = model_fingerprint(model)
+
+    def get_interface_for_model(self, model: ModelType) -> Optional[Type[BaseType]]:
+        iface = self._interfaces.get(model)
+        if iface is None and self.parent is not None:
+            return self.parent.get_interface_for_model(model)
+        return iface
+
+    def get_type_for_generic_model(
+        self, origin: ModelType, args: tuple
+    ) -> Optional[Type[BaseType]]:
+        obj_type = self._generic_types.get((origin, args))
+        if obj_type is None and self.parent is not None:
+            return self.parent.get_type_for_generic_model(origin, args)
+        return obj_type
+
+    def register_generic_model(
+        self, origin: ModelType, args: tuple, obj_type: ObjectType
+    ):
+        assert_is_correct_type(obj_type, self._required_obj_type)
+        self._generic_types[(origin, args)] = obj_type
+
+    def get_mapping_entry_type(self, name: str) -> Optional[Type[BaseType]]:
+        entry_type = self._mapping_entry_types.get(name)
+        if entry_type is None and self.parent is not None:
+            return self.parent.get_mapping_entry_type(name)
+        return entry_type
+
+    def register_mapping_entry_type(self, name: str, entry_type: Type[BaseType]):
+        self._mapping_entry_types[name] = entry_type
+
+    def get_enum(self, python_enum: Type[enum.Enum]) -> Optional[Type[BaseType]]:
+        graphene_enum = self._enums.get(python_enum)
+        if graphene_enum is None and self.parent is not None:
+            return self.parent.get_enum(python_enum)
+        return graphene_enum
+
+    def register_enum(
+        self, python_enum: Type[enum.Enum], graphene_enum: Type[BaseType]
+    ):
+        self._enums[python_enum] = graphene_enum
+
+    def get_union(self, name: str, types: tuple) -> Optional[Type[BaseType]]:
+        union = self._unions.get((name, types))
+        if union is None and self.parent is not None:
+            return self.parent.get_union(name, types)
+        return union
+
+    def register_union(self, name: str, types: tuple, union: Type[BaseType]):
+        self._unions[(name, types)] = union
 
     def add_placeholder_for_model(self, model: ModelType):
-        if model in self._registry:
+        if self.get_type_for_model(model) is not None:
             return
         self._registry[model] = Placeholder(model)
 
@@ -75,7 +180,93 @@ class Registry(Generic[T]):
     def get_object_field_for_graphene_field(
         self, obj_type: ObjectType, field_name: str
     ) -> Optional[FieldInfo]:
-        return self._registry_object_fields.get(obj_type, {}).get(field_name)
+        obj_field = self._registry_object_fields.get(obj_type, {}).get(field_name)
+        if obj_field is None and self.parent is not None:
+            return self.parent.get_object_field_for_graphene_field(obj_type, field_name)
+        return obj_field
+
+    def add_dependency(self, model: ModelType, obj_type: ObjectType):
+        """Record that the fields of `obj_type` refer to `model`."""
+        self._dependents[model].add(obj_type)
+
+    def get_dependents(self, model: ModelType) -> Set[ObjectType]:
+        return self._dependents.get(model, set())
+
+    def get_changed_types(
+        self, models: Iterable[ModelType] = ()
+    ) -> Dict[ObjectType, ModelType]:
+        """
+        Return the registered types and interfaces whose models have changed
+        since they were last converted, mapped to their current model (the
+        interfaces first). `models` may hold new versions of registered models
+        (e.g. after their module was reloaded), which are matched to the old
+        ones by their qualified name.
+        """
+        replacements = {_model_name(m): m for m in models}
+        changed = {}
+        for types, fingerprints in (
+            (self._interfaces, self._interface_fingerprints),
+            (self._registry, self._fingerprints),
+        ):
+            for model, obj_type in list(types.items()):
+                if (
+                    isinstance(obj_type, Placeholder)
+                    or obj_type._meta.model is not model
+                ):
+                    continue
+                current = replacements.get(_model_name(model), model)
+                if model_fingerprint(current) != fingerprints.get(model):
+                    changed[obj_type] = current
+                elif current is not model:
+                    # Same fields, so there's nothing to reconvert, but new
+                    # instances will be of the new class
+                    obj_type._meta.set_model(current)
+                    types[current] = obj_type
+                    fingerprints[current] = fingerprints[model]
+        return changed
+
+    def rebuild(self, models: Iterable[ModelType] = ()) -> List[ObjectType]:
+        """
+        Reconvert, in place, the fields of every type (or interface) whose
+        model has changed (see `get_changed_types()`) and of every type
+        referring to one of those, leaving unchanged types alone. Interfaces
+        are rebuilt first, as the types implementing them may share their
+        fields. Types with placeholders for models that have been registered
+        since then have their placeholders resolved. Returns the types that
+        were rebuilt.
+        """
+        changed = self.get_changed_types(models)
+        rebuilt: Dict[ObjectType, Optional[ModelType]] = dict(changed)
+        for obj_type in changed:
+            for dependent in self.get_dependents(obj_type._meta.model):
+                rebuilt.setdefault(dependent, None)
+        interfaces = {
+            obj_type
+            for obj_type in rebuilt
+            if self._interfaces.get(obj_type._meta.model) is obj_type
+        }
+        rebuilt = dict(
+            sorted(rebuilt.items(), key=lambda item: item[0] not in interfaces)
+        )
+
+        new_models, self._new_models = self._new_models, set()
+        for model in new_models:
+            for dependent in self.get_dependents(model):
+                if dependent not in rebuilt:
+                    dependent.resolve_placeholders()
+
+        for obj_type, model in rebuilt.items():
+            old_model = obj_type._meta.model
+            obj_type.rebuild(model)
+            if model is not None and model is not old_model:
+                # Keep the old model pointing at the new type, for annotations
+                # in models that haven't been reloaded
+                if obj_type in interfaces:
+                    self._interfaces[old_model] = obj_type
+                else:
+                    self._registry[old_model] = obj_type
+        self._new_models.clear()
+        return list(rebuilt)
 
 
 registry: Dict[ObjectType, Registry] = {}
@@ -0,0 +1,172 @@
+import typing as T
+
+import graphene
+import pydantic
+from graphene.types.base import BaseType
+from graphene.types.structures import Structure
+from graphene.types.utils import get_type
+
+from .converters import get_enum_serializer
+from .inputobjecttype import PydanticInputObjectType
+from .objecttype import PydanticObjectType
+from .registry import Placeholder, Registry, get_global_registry
+
+
+def rebuild_schema(
+    schema: graphene.Schema,
+    models: T.Iterable[T.Type[pydantic.BaseModel]] = (),
+    registries: T.Optional[T.Iterable[Registry]] = None,
+    **schema_kwargs,
+) -> graphene.Schema:
+    """
+    Rebuild only the types in the given registries (by default, the global
+    ones) whose Pydantic models have changed, and their dependents (see
+    `Registry.rebuild()`), then return a new schema with the same root types.
+    Every other type object is reused as-is.
+
+    This is meant for development servers that hot-reload code: pass the new
+    versions of any models whose modules were reloaded in `models`. Any extra
+    keyword arguments (e.g. `types`) are passed on to `graphene.Schema`.
+    """
+    if registries is None:
+        registries = (
+            get_global_registry(PydanticObjectType),
+            get_global_registry(PydanticInputObjectType),
+        )
+    models = list(models)
+    for registry in registries:
+        registry.rebuild(models)
+    return graphene.Schema(
+        query=schema.query,
+        mutation=schema.mutation,
+        subscription=schema.subscription,
+        **schema_kwargs,
+    )
+
+
+def use_enum_serializers(schema: graphene.Schema) -> graphene.Schema:
+    """
+    Make the enums of `schema` that were converted from Python enums serialize
+    their values with precomputed maps (see `EnumSerializer`) rather than with
+    Graphene's generic lookup, which adds up in large lists of enum values.
+    Returns the schema, which is changed in place.
+    """
+    for type_ in schema.graphql_schema.type_map.values():
+        graphene_type = getattr(type_, "graphene_type", None)
+        serializer = get_enum_serializer(graphene_type) if graphene_type else None
+        if serializer is not None and "serialize" not in vars(type_):
+            type_.serialize = serializer.bind(type_.serialize)
+    return schema
+
+
+class PrunedSchema(T.NamedTuple):
+    """A schema built by `build_schema()`, and the registry entries it left out."""
+
+    schema: graphene.Schema
+    pruned: T.List[T.Union[T.Type[BaseType], Placeholder]]
+
+
+def _registry_entries(
+    registry: Registry,
+) -> T.List[T.Union[T.Type[BaseType], Placeholder]]:
+    entries = []
+    # Overlays read through to their parents' types, so those are in use too
+    while registry is not None:
+        entries.extend(registry._registry.values())
+        entries.extend(registry._interfaces.values())
+        entries.extend(registry._generic_types.values())
+        entries.extend(registry._mapping_entry_types.values())
+        registry = registry.parent
+    return list(dict.fromkeys(entries))
+
+
+def _referenced_types(type_: T.Type[BaseType]) -> T.Iterator[T.Any]:
+    meta = type_._meta
+    yield from getattr(meta, "interfaces", ())
+    yield from getattr(meta, "types", ())
+    for field in (getattr(meta, "fields", None) or {}).values():
+        yield field.type
+        for arg in (getattr(field, "args", None) or {}).values():
+            yield arg.type
+
+
+def get_reachable_types(
+    *root_types: T.Optional[T.Type[BaseType]],
+    candidates: T.Iterable[T.Type[BaseType]] = (),
+) -> T.Set[T.Type[BaseType]]:
+    """
+    Return the Graphene types reachable from the given root types, through their
+    fields, arguments, interfaces and union members. Types among `candidates`
+    that implement a reachable interface are reachable too, as the schema
+    needs them to resolve the interface.
+    """
+    candidates = [
+        t for t in candidates if isinstance(t, type) and issubclass(t, BaseType)
+    ]
+    reachable: T.Set[T.Type[BaseType]] = set()
+    worklist = [t for t in root_types if t is not None]
+    while worklist:
+        while worklist:
+            type_ = worklist.pop()
+            while isinstance(type_, Structure):
+                type_ = type_.of_type
+            type_ = get_type(type_)
+            if (
+                not isinstance(type_, type)
+                or not issubclass(type_, BaseType)
+                or type_ in reachable
+            ):
+                continue
+            reachable.add(type_)
+            worklist.extend(_referenced_types(type_))
+        worklist = [
+            t
+            for t in candidates
+            if t not in reachable
+            and any(i in reachable for i in getattr(t._meta, "interfaces", ()))
+        ]
+    return reachable
+
+
+def build_schema(
+    query: T.Optional[T.Type[graphene.ObjectType]] = None,
+    mutation: T.Optional[T.Type[graphene.ObjectType]] = None,
+    subscription: T.Optional[T.Type[graphene.ObjectType]] = None,
+    registries: T.Optional[T.Iterable[Registry]] = None,
+    types: T.Iterable[T.Type[BaseType]] = (),
+    **schema_kwargs,
+) -> PrunedSchema:
+    """
+    Build a schema with only the types in the given registries (by default,
+    the global ones) that can be reached from the root types (or `types`),
+    including the types that implement a reachable interface, which Graphene
+    wouldn't find by itself. Everything else in the registries, including any
+    placeholders, is left out, and returned as `pruned`.
+
+    This way several schemas (say, a public one and an admin one) can be built
+    from the same models, each with just the types its entry points need. Its
+    enums use precomputed serializers (see `use_enum_serializers()`). Any extra
+    keyword arguments are passed on to `graphene.Schema`.
+    """
+    if registries is None:
+        registries = (
+            get_global_registry(PydanticObjectType),
+            get_global_registry(PydanticInputObjectType),
+        )
+    entries = [
+        entry for registry in registries for entry in _registry_entries(registry)
+    ]
+    types = list(types)
+    reachable = get_reachable_types(
+        query, mutation, subscription, *types, candidates=entries
+    )
+    kept = [entry for entry in entries if entry in reachable]
+    pruned = [entry for entry in entries if entry not in reachable]
+    schema = graphene.Schema(
+        query=query,
+        mutation=mutation,
+        subscription=subscription,
+        types=list(dict.fromkeys([*types, *kept])),
+        **schema_kwargs,
+    )
+    return PrunedSchema(use_enum_serializers(schema), pruned)
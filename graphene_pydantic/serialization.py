@@ -0,0 +1,277 @@
+"""
+Serialize responses straight to JSON, letting pydantic-core write the parts of
+the response that come from Pydantic models.
+
+graphql-core completes every object into a dict, which then has to be
+serialized by `json.dumps`. For the objects and lists of objects whose fields
+all use the default resolvers, we instead build (and cache) a pydantic-core
+serializer for the selection, which writes the JSON for the whole subtree in
+one go; the rest of the response is serialized around it.
+"""
+import typing as T
+
+import pydantic_core
+from graphql import (
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    GraphQLBoolean,
+    GraphQLEnumType,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLOutputType,
+    GraphQLScalarType,
+    GraphQLSchema,
+    GraphQLString,
+)
+from pydantic_core import core_schema
+
+from .arrays import ArrayExecutionContext
+from .compiler import NotCompilable, SelectionCache, collect_attribute_fields
+from .objecttype import PydanticObjectType
+
+# How many serializers to keep for each type
+MAX_SERIALIZERS = 256
+
+# The serializers for the selections of each type
+_serializer_cache = SelectionCache(MAX_SERIALIZERS)
+
+# The scalars pydantic-core serializes exactly like graphql-core does; anything
+# else (e.g. the range checks on Int and Float) is left to their `serialize()`
+_LEAF_SCHEMAS = {
+    GraphQLString.name: core_schema.str_schema,
+    GraphQLBoolean.name: core_schema.bool_schema,
+}
+
+
+class RawJSON:
+    """A part of a response that has already been serialized to JSON."""
+
+    __slots__ = ("json",)
+
+    def __init__(self, json: bytes):
+        self.json = json
+
+    def __repr__(self):
+        return f"RawJSON({self.json!r})"
+
+
+def _leaf_schema(type_: T.Union[GraphQLScalarType, GraphQLEnumType]):
+    schema = _LEAF_SCHEMAS.get(type_.name)
+    if schema is not None:
+        return schema()
+
+    serialize = type_.serialize
+
+    def serialize_leaf(value):
+        serialized = serialize(value)
+        if serialized is None:
+            raise ValueError(f"{type_.name} cannot represent value: {value!r}")
+        return serialized
+
+    return core_schema.any_schema(
+        serialization=core_schema.plain_serializer_function_ser_schema(serialize_leaf)
+    )
+
+
+def _object_schema(
+    type_: GraphQLObjectType,
+    field_nodes: T.List[FieldNode],
+    fragments: T.Dict[str, FragmentDefinitionNode],
+    schema: GraphQLSchema,
+):
+    graphene_type = getattr(type_, "graphene_type", None)
+    if not (
+        isinstance(graphene_type, type)
+        and issubclass(graphene_type, PydanticObjectType)
+    ):
+        raise NotCompilable(f"{type_} isn't a PydanticObjectType")
+    meta = graphene_type._meta
+    model = meta.model
+
+    # (response key, attribute name or None for `__typename`, field schema)
+    fields = []
+    for response_key, attr_name, field, nodes in collect_attribute_fields(
+        schema, fragments, type_, field_nodes
+    ):
+        if field is None:
+            fields.append((response_key, None, core_schema.str_schema()))
+            continue
+        pydantic_field = meta.registry.get_object_field_for_graphene_field(
+            graphene_type, attr_name
+        )
+        # Pydantic doesn't validate defaults, so a non-null field could be null
+        if isinstance(field.type, GraphQLNonNull) and (
+            pydantic_field is None or pydantic_field.default is None
+        ):
+            raise NotCompilable(f"{type_}.{nodes[0].name.value} may be null")
+        fields.append(
+            (response_key, attr_name, _schema(field.type, nodes, fragments, schema))
+        )
+
+    name = type_.name
+
+    def to_dict(value):
+        if not isinstance(value, model):
+            raise TypeError(f"Expected {model.__name__}, got {value!r}")
+        # (in the order the fields were selected in, whatever the order of the
+        # model's own dict)
+        return {
+            response_key: name if attr_name is None else getattr(value, attr_name)
+            for response_key, attr_name, _ in fields
+        }
+
+    dict_fields = {
+        response_key: core_schema.typed_dict_field(field_schema)
+        for response_key, _, field_schema in fields
+    }
+
+    return core_schema.any_schema(
+        serialization=core_schema.plain_serializer_function_ser_schema(
+            to_dict, return_schema=core_schema.typed_dict_schema(dict_fields)
+        )
+    )
+
+
+def _schema(
+    type_: GraphQLOutputType,
+    field_nodes: T.List[FieldNode],
+    fragments: T.Dict[str, FragmentDefinitionNode],
+    schema: GraphQLSchema,
+    nullable: bool = True,
+):
+    if isinstance(type_, GraphQLNonNull):
+        return _schema(type_.of_type, field_nodes, fragments, schema, nullable=False)
+    if isinstance(type_, GraphQLList):
+        inner = core_schema.list_schema(
+            _schema(type_.of_type, field_nodes, fragments, schema)
+        )
+    elif isinstance(type_, (GraphQLScalarType, GraphQLEnumType)):
+        inner = _leaf_schema(type_)
+    elif isinstance(type_, GraphQLObjectType):
+        inner = _object_schema(type_, field_nodes, fragments, schema)
+    else:
+        raise NotCompilable(f"Can't serialize values of {type_} directly")
+    return core_schema.nullable_schema(inner) if nullable else inner
+
+
+def get_serializer(
+    schema: GraphQLSchema,
+    return_type: T.Union[GraphQLObjectType, GraphQLList],
+    field_nodes: T.List[FieldNode],
+    fragments: T.Dict[str, FragmentDefinitionNode],
+) -> T.Optional[pydantic_core.SchemaSerializer]:
+    """
+    Return a serializer that writes the JSON for an object (or non-null list)
+    of `return_type` with the sub-selection of `field_nodes`, or None if it
+    can't be serialized directly.
+
+    The serializers are cached by type and (normalized) selection, so the same
+    selection in any operation reuses the same serializer.
+    """
+    named_type = return_type
+    while hasattr(named_type, "of_type"):
+        named_type = named_type.of_type
+    return _serializer_cache.get(
+        named_type,
+        field_nodes,
+        fragments,
+        lambda: pydantic_core.SchemaSerializer(
+            _schema(GraphQLNonNull(return_type), field_nodes, fragments, schema)
+        ),
+        key=str(return_type),
+    )
+
+
+class JSONExecutionContext(ArrayExecutionContext):
+    """
+    An execution context that serializes the objects and lists of objects it
+    can (see `get_serializer()`) to JSON as soon as they're resolved, leaving
+    `RawJSON` in their place in the result. Use `execute_to_json()` to run
+    queries with it, or `dumps_result()` to serialize its results.
+
+    As with `CompiledExecutionContext`, nothing is serialized directly when
+    there's middleware, and numeric arrays are completed in bulk.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializers: T.Dict[T.Hashable, T.Optional[T.Callable]] = {}
+
+    def _serialize(self, return_type, field_nodes, result) -> T.Optional[RawJSON]:
+        if self.middleware_manager is not None:
+            return None
+        # Only looked up once per execution for each set of field nodes (see
+        # `collect_subfields()`)
+        ids = (return_type, *map(id, field_nodes))
+        try:
+            serializer = self._serializers[ids]
+        except KeyError:
+            serializer = self._serializers[ids] = get_serializer(
+                self.schema, return_type, field_nodes, self.fragments
+            )
+        if serializer is None:
+            return None
+        try:
+            return RawJSON(serializer.to_json(result, by_alias=True, warnings="error"))
+        except Exception:
+            # Let graphql-core complete it (and report any errors)
+            return None
+
+    def complete_list_value(self, return_type, field_nodes, info, path, result):
+        # Other iterables may not be iterable again if serializing them fails
+        if isinstance(result, list):
+            serialized = self._serialize(return_type, field_nodes, result)
+            if serialized is not None:
+                return serialized
+        return super().complete_list_value(return_type, field_nodes, info, path, result)
+
+    def complete_object_value(self, return_type, field_nodes, info, path, result):
+        serialized = self._serialize(return_type, field_nodes, result)
+        if serialized is not None:
+            return serialized
+        return super().complete_object_value(
+            return_type, field_nodes, info, path, result
+        )
+
+
+def _encode(value: T.Any, parts: T.List[bytes]):
+    if isinstance(value, RawJSON):
+        parts.append(value.json)
+    elif isinstance(value, dict):
+        parts.append(b"{")
+        for i, (k, v) in enumerate(value.items()):
+            if i:
+                parts.append(b",")
+            parts.append(pydantic_core.to_json(k))
+            parts.append(b":")
+            _encode(v, parts)
+        parts.append(b"}")
+    elif isinstance(value, list):
+        parts.append(b"[")
+        for i, v in enumerate(value):
+            if i:
+                parts.append(b",")
+            _encode(v, parts)
+        parts.append(b"]")
+    else:
+        parts.append(pydantic_core.to_json(value))
+
+
+def dumps_result(result: ExecutionResult) -> bytes:
+    """Serialize an execution result to JSON, splicing in any `RawJSON` in it."""
+    parts: T.List[bytes] = []
+    _encode(result.formatted, parts)
+    return b"".join(parts)
+
+
+def execute_to_json(schema, request_string: str, **execute_options) -> bytes:
+    """
+    Execute a query against a `graphene.Schema` with `JSONExecutionContext`,
+    returning the JSON of its (formatted) result.
+    """
+    result = schema.execute(
+        request_string, execution_context_class=JSONExecutionContext, **execute_options
+    )
+    return dumps_result(result)
@@ -0,0 +1,231 @@
+"""
+Tracing spans for the work graphene_pydantic does: converting models into
+Graphene types, resolving placeholders, and resolving fields.
+
+Spans are only recorded once an exporter has been set with `set_exporter()`;
+until then the hooks cost a global lookup. Exporters are anything with an
+`export(span)` method, so spans can be handed on to OpenTelemetry (or anything
+else) without this library depending on it. `InMemoryExporter` and
+`FileExporter` are provided for tests and local debugging.
+"""
+import contextlib
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import threading
+import time
+import typing as T
+
+from .converters import is_default_resolver
+
+
+class Span(T.NamedTuple):
+    """
+    A finished span. Times are in nanoseconds since the epoch, as OpenTelemetry
+    expects them; `parent_id` is the id of the span this one was started in.
+    """
+
+    name: str
+    span_id: int
+    parent_id: T.Optional[int]
+    start_ns: int
+    end_ns: int
+    attributes: T.Dict[str, T.Any]
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+
+class SpanExporter:
+    """The interface of span exporters."""
+
+    def export(self, span: Span):
+        raise NotImplementedError
+
+    def shutdown(self):
+        """Flush and release anything the exporter holds on to."""
+
+
+class InMemoryExporter(SpanExporter):
+    """Keep the spans in a list (e.g. for tests)."""
+
+    def __init__(self):
+        self.spans: T.List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+
+
+class FileExporter(SpanExporter):
+    """Append the spans to a file, as one JSON object per line."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "a")
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(span._asdict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def shutdown(self):
+        with self._lock:
+            self._file.close()
+
+
+_exporter: T.Optional[SpanExporter] = None
+_span_ids = itertools.count(1)
+_current_span: contextvars.ContextVar[T.Optional[int]] = contextvars.ContextVar(
+    "graphene_pydantic_span", default=None
+)
+
+
+def set_exporter(exporter: T.Optional[SpanExporter]) -> T.Optional[SpanExporter]:
+    """
+    Export spans to `exporter` from now on (or stop recording them, if it's
+    None). Returns the exporter that was set before.
+    """
+    global _exporter
+    previous, _exporter = _exporter, exporter
+    return previous
+
+
+def get_exporter() -> T.Optional[SpanExporter]:
+    return _exporter
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes) -> T.Iterator[T.Optional[int]]:
+    """
+    Record a span around the body of the `with` block, yielding its id (or
+    None if no exporter is set). Spans started inside it are its children.
+    """
+    exporter = _exporter
+    if exporter is None:
+        yield None
+        return
+    span_id = next(_span_ids)
+    parent_id = _current_span.get()
+    token = _current_span.set(span_id)
+    start_ns = time.time_ns()
+    start = time.perf_counter_ns()
+    try:
+        yield span_id
+    finally:
+        end_ns = start_ns + time.perf_counter_ns() - start
+        _current_span.reset(token)
+        exporter.export(Span(name, span_id, parent_id, start_ns, end_ns, attributes))
+
+
+def _describe(value: T.Any) -> T.Any:
+    return getattr(value, "__name__", value)
+
+
+def traced(name: str, **attribute_params: str) -> T.Callable:
+    """
+    Decorate a function to record a span named `name` around each call, with
+    attributes taken from its arguments: `attribute_params` maps each
+    attribute to the parameter it's taken from (classes are recorded by name).
+    """
+
+    def decorate(func: T.Callable) -> T.Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def traced_func(*args, **kwargs):
+            if _exporter is None:
+                return func(*args, **kwargs)
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+            attributes = {
+                attribute: _describe(arguments.get(param))
+                for attribute, param in attribute_params.items()
+            }
+            with span(name, **attributes):
+                return func(*args, **kwargs)
+
+        return traced_func
+
+    return decorate
+
+
+def _get_depth(path) -> int:
+    depth = 0
+    while path is not None:
+        if not isinstance(path.key, int):
+            depth += 1
+        path = path.prev
+    return depth
+
+
+class TracingMiddleware:
+    """
+    A Graphene middleware recording a span for the resolution of each field at
+    most `max_depth` levels deep (the root fields being at depth 1), and for
+    each deeper one that takes at least `min_duration_ns`, so that traces show
+    the expensive fields without a span for every leaf. Spans get the field,
+    its path, its depth, and whether it used a generic (attribute or mapping)
+    resolver. Resolvers that return awaitables are timed until they're done.
+
+    Spans go to `exporter`, or to the exporter set with `set_exporter()`.
+    """
+
+    def __init__(
+        self,
+        max_depth: int = 1,
+        min_duration_ns: T.Optional[int] = None,
+        exporter: T.Optional[SpanExporter] = None,
+    ):
+        self.max_depth = max_depth
+        self.min_duration_ns = min_duration_ns
+        self.exporter = exporter
+
+    def resolve(self, next_, root, info, **args):
+        exporter = self.exporter or _exporter
+        if exporter is None:
+            return next_(root, info, **args)
+        depth = _get_depth(info.path)
+        if depth > self.max_depth and self.min_duration_ns is None:
+            return next_(root, info, **args)
+        start_ns = time.time_ns()
+        start = time.perf_counter_ns()
+        result = next_(root, info, **args)
+        if inspect.isawaitable(result):
+            return self._finish_async(result, exporter, info, depth, start_ns, start)
+        self._finish(exporter, info, depth, start_ns, start)
+        return result
+
+    async def _finish_async(self, result, exporter, info, depth, start_ns, start):
+        try:
+            return await result
+        finally:
+            self._finish(exporter, info, depth, start_ns, start)
+
+    def _finish(self, exporter, info, depth: int, start_ns: int, start: int):
+        duration = time.perf_counter_ns() - start
+        if depth > self.max_depth and duration < self.min_duration_ns:
+            return
+        field = info.parent_type.fields[info.field_name]
+        exporter.export(
+            Span(
+                "graphene_pydantic.resolve",
+                next(_span_ids),
+                _current_span.get(),
+                start_ns,
+                start_ns + duration,
+                {
+                    "field": f"{info.parent_type.name}.{info.field_name}",
+                    "path": ".".join(str(key) for key in info.path.as_list()),
+                    "depth": depth,
+                    "default_resolver": is_default_resolver(field.resolve),
+                },
+            )
+        )
@@ -1,3 +1,5 @@
+import hashlib
+import re
 import sys
 import typing as T
 from typing import (
@@ -12,12 +14,88 @@ def construct_union_class_name(inner_types: T.Sequence[T.Type]) -> str:
     Generate a comprehensible name for a dynamically generated Union class, of
     the form "UnionOfXYZ".
     """
-    type_names = [x.__name__ for x in inner_types]
+    type_names = [_name(x) for x in inner_types]
     caps_cased_names = "".join(n[0].upper() + n[1:] for n in type_names)
 
     return f"UnionOf{caps_cased_names}"
 
 
+def _name(type_: T.Any) -> str:
+    # (`typing` generics only have a `__name__` from Python 3.9 -- special forms
+    # from 3.10 -- but they do have a `_name`)
+    return (
+        getattr(type_, "__name__", None) or getattr(type_, "_name", None) or str(type_)
+    )
+
+
+def _type_name(type_: T.Any) -> str:
+    metadata = getattr(type_, "__pydantic_generic_metadata__", None)
+    if metadata and metadata["origin"]:
+        origin, args = metadata["origin"], metadata["args"]
+    else:
+        origin, args = T.get_origin(type_) or type_, T.get_args(type_)
+    name = _name(origin)
+    name = name[0].upper() + name[1:]
+    return name + "".join(_type_name(arg) for arg in args)
+
+
+def construct_mapping_entry_class_name(key_type: T.Any, value_type: T.Any) -> str:
+    """
+    Generate a comprehensible name for the entry class generated for a mapping,
+    of the form "XToYEntry".
+    """
+    return f"{_type_name(key_type)}To{_type_name(value_type)}Entry"
+
+
+def construct_generic_class_name(origin: T.Type, args: T.Sequence[T.Any]) -> str:
+    """
+    Generate a comprehensible name for the class generated for a parametrized
+    generic Pydantic model, of the form "PageOfXYZ".
+    """
+    return f"{origin.__name__}Of{''.join(_type_name(arg) for arg in args)}"
+
+
+def model_fingerprint(model: T.Type) -> str:
+    """
+    Return a short, stable digest of a Pydantic model's name and fields (their
+    names, annotations, aliases, requiredness, defaults and constraints, and its
+    computed fields), which changes whenever the GraphQL types generated from
+    the model could.
+    """
+    digest = hashlib.sha1(f"{model.__module__}.{model.__qualname__}".encode())
+    for name, field in model.model_fields.items():
+        digest.update(
+            _stable_repr(
+                (
+                    name,
+                    field.annotation,
+                    field.alias,
+                    field.is_required(),
+                    field.description,
+                    field.default,
+                    field.default_factory,
+                    field.metadata,
+                )
+            ).encode()
+        )
+    for name, computed in model.model_computed_fields.items():
+        digest.update(
+            repr(
+                (name, computed.return_type, computed.alias, computed.description)
+            ).encode()
+        )
+    return digest.hexdigest()[:16]
+
+
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _stable_repr(value: T.Any) -> str:
+    # (leaving out the memory addresses in the default reprs of objects, which
+    # differ from one run to the next)
+    return _ADDRESS.sub("", repr(value))
+
+
 if sys.version_info < (3, 9):
 
     def evaluate_forward_ref(type_: ForwardRef, globalns: Any, localns: Any) -> Any:
@@ -0,0 +1,169 @@
+"""
+Validate input against a Pydantic model looking only at the fields that were
+actually sent, so that a PATCH-style mutation on a large model costs time in
+proportion to what the client sent rather than to the size of the model.
+
+Fields that weren't sent aren't validated at all: they get their defaults (as
+`model_construct()` would give them), and are left out of the model's
+`model_fields_set`, so "unset" stays distinguishable from "set to the default".
+"""
+import copy
+import enum
+import typing as T
+import weakref
+
+import pydantic
+from pydantic.fields import FieldInfo
+from pydantic_core import SchemaValidator, core_schema
+
+# How many partial validators to keep for each model (one per set of sent fields)
+MAX_VALIDATORS = 256
+
+# The partial validation of each model
+_validation_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _model_schema(model: T.Type[pydantic.BaseModel]):
+    """
+    Return the core schema of `model` itself and the definitions it refers to,
+    or None if it's wrapped in anything (e.g. model validators) that needs the
+    whole model to run.
+    """
+    schema = model.__pydantic_core_schema__
+    definitions: T.List[core_schema.CoreSchema] = []
+    if schema["type"] == "definitions":
+        definitions = schema["definitions"]
+        schema = schema["schema"]
+        if schema["type"] == "definition-ref":
+            ref = schema["schema_ref"]
+            schema = next(d for d in definitions if d.get("ref") == ref)
+    if schema["type"] != "model" or schema["schema"]["type"] != "model-fields":
+        return None
+    return schema, definitions
+
+
+def _is_immutable(value: T.Any) -> bool:
+    return isinstance(value, (type(None), bool, int, float, str, bytes, enum.Enum))
+
+
+class _PartialValidation:
+    """The partial validators of a model, and how to construct it quickly."""
+
+    def __init__(self, model: T.Type[pydantic.BaseModel]):
+        self.model = model
+        self.validators: T.Dict[T.FrozenSet[str], SchemaValidator] = {}
+        self.schema = _model_schema(model)
+        # Defaults that can be shared by all instances, and the fields whose
+        # defaults have to be made for each one
+        self.defaults: T.Dict[str, T.Any] = {}
+        self.default_fields: T.Dict[str, FieldInfo] = {}
+        # Set up instances ourselves, rather than with `model_construct()` (which
+        # goes through every field in Python), unless they need more than that
+        self.fast_construct = not getattr(model, "__pydantic_post_init__", None)
+        for name, field in model.model_fields.items():
+            if getattr(field, "default_factory_takes_data", False):
+                self.fast_construct = False
+            elif field.default_factory is None and _is_immutable(field.default):
+                self.defaults[name] = field.default
+            elif not field.is_required():
+                self.default_fields[name] = field
+        self.extra = {} if model.model_config.get("extra") == "allow" else None
+
+    def get_validator(self, names: T.FrozenSet[str]) -> T.Optional[SchemaValidator]:
+        if self.schema is None:
+            return None
+        try:
+            return self.validators[names]
+        except KeyError:
+            pass
+        schema, definitions = self.schema
+        fields_schema = schema["schema"]
+        # Input comes in by field name, like Graphene's fields are named
+        fields = {
+            name: {k: v for k, v in field.items() if k != "validation_alias"}
+            for name, field in fields_schema["fields"].items()
+            if name in names
+        }
+        partial: core_schema.CoreSchema = dict(fields_schema, fields=fields)
+        if definitions:
+            partial = core_schema.definitions_schema(partial, definitions)
+        validator = SchemaValidator(partial, schema.get("config"))
+        if len(self.validators) >= MAX_VALIDATORS:
+            self.validators.clear()
+        self.validators[names] = validator
+        return validator
+
+    def construct(
+        self,
+        values: T.Dict[str, T.Any],
+        extra: T.Optional[T.Dict[str, T.Any]],
+        fields_set: T.Set[str],
+    ) -> pydantic.BaseModel:
+        model = self.model
+        if not self.fast_construct:
+            return model.model_construct(fields_set, **values, **(extra or {}))
+        # Fill the instance in the order of the model's fields, as validation
+        # would, since that's the order they're dumped and printed in
+        instance_dict = {}
+        defaults = self.defaults
+        for name in self.model.model_fields:
+            if name in values:
+                instance_dict[name] = values[name]
+            elif name in defaults:
+                instance_dict[name] = defaults[name]
+            else:
+                field = self.default_fields.get(name)
+                if field is None:
+                    continue
+                if field.default_factory is None:
+                    instance_dict[name] = copy.deepcopy(field.default)
+                else:
+                    instance_dict[name] = field.default_factory()
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", instance_dict)
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(
+            instance, "__pydantic_extra__", self.extra if extra is None else extra
+        )
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
+
+def _get_partial_validation(model: T.Type[pydantic.BaseModel]) -> _PartialValidation:
+    try:
+        return _validation_cache[model]
+    except KeyError:
+        validation = _validation_cache[model] = _PartialValidation(model)
+        return validation
+
+
+def validate_sent_fields(
+    model: T.Type[pydantic.BaseModel], data: T.Mapping[str, T.Any]
+) -> pydantic.BaseModel:
+    """
+    Create an instance of `model` from `data`, which holds (by field name) only
+    the fields that were sent, validating just those. The validators for each
+    set of sent fields are built once and cached.
+
+    Raises `pydantic.ValidationError` if the data isn't valid. Models with model
+    validators are validated as a whole, as those need every field.
+    """
+    fields = model.model_fields
+    names = frozenset(name for name in data if name in fields)
+    validation = _get_partial_validation(model)
+    validator = validation.get_validator(names)
+    if validator is None:
+        aliased = {}
+        for name, value in data.items():
+            field = fields.get(name)
+            alias = None
+            if field is not None:
+                alias = (
+                    field.validation_alias
+                    if isinstance(field.validation_alias, str)
+                    else field.alias
+                )
+            aliased[alias or name] = value
+        return model.model_validate(aliased)
+    values, extra, fields_set = validator.validate_python(data)
+    return validation.construct(values, extra, fields_set)
@@ -0,0 +1,20 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        help="run the timing comparisons marked with `benchmark`",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Timings depend too much on the machine (and what else it's doing) to
+    # fail the build on by default
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="timing comparison (use --run-benchmarks)")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
@@ -0,0 +1,161 @@
+import sys
+import types
+import typing as T
+
+import graphene
+import pydantic
+import pytest
+
+import graphene_pydantic.objecttype
+from graphene_pydantic import (
+    PydanticInputObjectType,
+    PydanticObjectType,
+    register_models,
+)
+from graphene_pydantic.bulk import get_model_dependencies, sort_models
+from graphene_pydantic.registry import Placeholder, Registry
+
+
+class Tag(pydantic.BaseModel):
+    label: str
+
+
+class Comment(pydantic.BaseModel):
+    text: str
+    tags: T.Optional[T.List[Tag]] = None
+
+
+class Post(pydantic.BaseModel):
+    """A blog post."""
+
+    title: str
+    comments: T.Optional[T.List[Comment]] = None
+    pinned: T.Optional[Comment] = None
+    related: T.Optional["Post"] = None
+
+
+class Author(pydantic.BaseModel):
+    name: str
+    posts: T.Optional[T.Dict[str, Post]] = None
+    best: T.Union[Post, Comment, None] = None
+    kind: T.Literal["Tag"] = "Tag"
+
+
+class Manager(pydantic.BaseModel):
+    name: str
+    reports: T.Optional[T.List["Employee"]] = None
+
+
+class Employee(pydantic.BaseModel):
+    name: str
+    manager: T.Optional[Manager] = None
+
+
+Manager.model_rebuild()
+
+
+@pytest.fixture
+def conversions(monkeypatch):
+    calls = []
+    convert = graphene_pydantic.objecttype.convert_pydantic_field
+
+    def counting_convert(name, field, registry, parent_type=None, **kwargs):
+        calls.append((parent_type.__name__, name))
+        return convert(name, field, registry, parent_type=parent_type, **kwargs)
+
+    monkeypatch.setattr(
+        graphene_pydantic.objecttype, "convert_pydantic_field", counting_convert
+    )
+    return calls
+
+
+def test_model_dependencies():
+    assert get_model_dependencies(Post) == [Comment]
+    assert get_model_dependencies(Author) == [Post, Comment]
+    assert get_model_dependencies(Manager) == [Employee]
+
+
+def test_sort_models():
+    assert sort_models([Author]) == [Tag, Comment, Post, Author]
+    assert sort_models([Employee, Manager]) == [Manager, Employee]
+
+
+def test_register_models(conversions):
+    registry = Registry(PydanticObjectType)
+    types_ = register_models([Author, Post], registry=registry)
+    assert list(types_) == [Author, Post, Tag, Comment]
+    assert all(types_[m] is registry.get_type_for_model(m) for m in types_)
+    assert types_[Post].__name__ == "Post"
+    assert types_[Post]._meta.description == "A blog post."
+    # only the field referring to its own model needed a placeholder, so every
+    # other field was converted exactly once
+    assert conversions.count(("Post", "related")) == 2
+    assert len(conversions) == len(set(conversions)) + 1 == 12
+
+    class Query(graphene.ObjectType):
+        author = graphene.Field(types_[Author])
+
+        @staticmethod
+        def resolve_author(parent, info):
+            comment = Comment(text="Hi", tags=[Tag(label="a")])
+            return Author(name="Ann", posts={"x": Post(title="X")}, best=comment)
+
+    result = graphene.Schema(query=Query).execute(
+        "{ author { name posts { key value { title } } best { ... on Comment { tags { label } } } } }"
+    )
+    assert result.errors is None
+    assert result.data["author"] == {
+        "name": "Ann",
+        "posts": [{"key": "x", "value": {"title": "X"}}],
+        "best": {"tags": [{"label": "a"}]},
+    }
+
+
+def test_register_models_with_cycles(conversions):
+    registry = Registry(PydanticObjectType)
+    types_ = register_models([Employee, Manager], registry=registry)
+    # only the field that closes the cycle was converted twice
+    assert conversions.count(("Manager", "reports")) == 2
+    assert len(conversions) == len(set(conversions)) + 1
+    for obj_type in types_.values():
+        for field in obj_type._meta.fields.values():
+            field_type = field.type
+            while hasattr(field_type, "of_type"):
+                field_type = field_type.of_type
+            assert not isinstance(field_type, Placeholder)
+
+
+def test_register_models_from_module():
+    module = types.ModuleType("bulk_models")
+    exec(
+        "import pydantic\n"
+        "class A(pydantic.BaseModel):\n"
+        "    b: 'B'\n"
+        "class B(pydantic.BaseModel):\n"
+        "    x: int\n"
+        "A.model_rebuild(_types_namespace={'B': B})\n",
+        module.__dict__,
+    )
+    sys.modules[module.__name__] = module
+    try:
+        registry = Registry(PydanticInputObjectType)
+        types_ = register_models(
+            module, base=PydanticInputObjectType, registry=registry
+        )
+    finally:
+        del sys.modules[module.__name__]
+    assert [t._meta.name for t in types_.values()] == ["AInput", "BInput"]
+    assert types_[module.A]._meta.fields["b"].type.of_type is types_[module.B]
+
+
+def test_register_models_keeps_existing_types():
+    tag_registry = Registry(PydanticObjectType)
+
+    class CustomTag(PydanticObjectType):
+        class Meta:
+            model = Tag
+            registry = tag_registry
+
+    types_ = register_models([Tag, Comment], registry=tag_registry)
+    assert types_[Tag] is CustomTag
+    assert types_[Comment]._meta.fields["tags"].type.of_type is CustomTag
@@ -0,0 +1,144 @@
+import graphene
+import pydantic
+import pytest
+
+from graphene_pydantic import PydanticObjectType
+from graphene_pydantic.caching import (
+    CachingExecutionContext,
+    FragmentCache,
+    FragmentCacheInfo,
+)
+from graphene_pydantic.registry import Registry
+
+calls = []
+
+
+class CurrencyModel(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    code: str
+    name: str
+
+
+class PriceModel(pydantic.BaseModel):
+    amount: float
+    currency: CurrencyModel
+
+
+registry = Registry(PydanticObjectType)
+cache = FragmentCache(maxsize=2)
+
+
+class Currency(PydanticObjectType):
+    class Meta:
+        model = CurrencyModel
+        registry = registry
+        fragment_cache = cache
+
+    symbol = graphene.String(plural=graphene.Boolean())
+
+    @staticmethod
+    def resolve_symbol(parent, info, plural=False):
+        calls.append(parent.code)
+        return {"EUR": "€", "USD": "$"}[parent.code] * (2 if plural else 1)
+
+
+class Price(PydanticObjectType):
+    class Meta:
+        model = PriceModel
+        registry = registry
+
+
+class Query(graphene.ObjectType):
+    prices = graphene.List(Price, codes=graphene.List(graphene.String))
+
+    @staticmethod
+    def resolve_prices(parent, info, codes=("EUR",)):
+        return [
+            PriceModel(amount=i, currency=CurrencyModel(code=code, name=code))
+            for i, code in enumerate(codes)
+        ]
+
+
+schema = graphene.Schema(query=Query)
+
+
+def _execute(query, **kwargs):
+    result = schema.execute(
+        query, execution_context_class=CachingExecutionContext, **kwargs
+    )
+    assert result.errors is None
+    return result.data
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    calls.clear()
+
+
+def test_fragment_cache():
+    query = """
+    query {
+        prices(codes: ["EUR", "EUR", "USD"]) { amount currency { ...C } }
+    }
+    fragment C on Currency { code symbol }
+    """
+    data = _execute(query)
+    assert [p["currency"] for p in data["prices"]] == [
+        {"code": "EUR", "symbol": "€"},
+        {"code": "EUR", "symbol": "€"},
+        {"code": "USD", "symbol": "$"},
+    ]
+    assert calls == ["EUR", "USD"]
+    assert cache.info() == FragmentCacheInfo(
+        hits=1, misses=2, evictions=0, oversized=0, maxsize=2, currsize=2
+    )
+
+    # a different selection isn't a hit, and evicts the least recently used
+    _execute("query { prices { currency { code name } } }")
+    assert cache.info().evictions == 1
+    assert calls == ["EUR", "USD"]
+
+
+def test_fragment_cache_variables():
+    query = """
+    query ($plural: Boolean) {
+        prices(codes: ["USD"]) { currency { symbol(plural: $plural) } }
+    }
+    """
+    assert _execute(query, variables={"plural": True})["prices"][0] == {
+        "currency": {"symbol": "$$"}
+    }
+    assert _execute(query, variables={"plural": False})["prices"][0] == {
+        "currency": {"symbol": "$"}
+    }
+    assert _execute(query, variables={"plural": True})["prices"][0] == {
+        "currency": {"symbol": "$$"}
+    }
+    assert calls == ["USD", "USD"]
+
+
+def test_fragment_cache_size_limit():
+    small_cache = FragmentCache(max_result_size=2)
+    small_cache.put("small", {"a": 1})
+    small_cache.put("big", {"a": 1, "b": [1, 2]})
+    assert small_cache.get("small") == {"a": 1}
+    assert small_cache.get("big") is None
+    assert small_cache.info().oversized == 1
+
+
+def test_fragment_cache_requires_frozen_model():
+    with pytest.raises(ValueError, match="frozen"):
+
+        class NotFrozen(PydanticObjectType):
+            class Meta:
+                model = PriceModel
+                registry = Registry(PydanticObjectType)
+                fragment_cache = FragmentCache()
+
+
+def test_not_cached_without_execution_context():
+    schema.execute('query { prices(codes: ["EUR", "EUR"]) { currency { symbol } } }')
+    assert calls == ["EUR", "EUR"]
+    assert len(cache) == 0
@@ -0,0 +1,442 @@
+import enum
+import importlib.util
+import typing as T
+
+import graphene
+import pydantic
+import pytest
+
+from graphene_pydantic import PydanticInputObjectType, PydanticObjectType
+from graphene_pydantic.codegen import (
+    GeneratedCodeOutOfDateError,
+    check_fingerprints,
+    generate_module,
+    main,
+)
+from graphene_pydantic.registry import Registry
+from graphene_pydantic.util import model_fingerprint
+
+
+class Color(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class PetModel(pydantic.BaseModel):
+    name: str
+    color: Color = Color.RED
+
+
+class RobotModel(pydantic.BaseModel):
+    serial: int
+
+
+class PersonModel(pydantic.BaseModel):
+    """A person."""
+
+    first_name: str = pydantic.Field(alias="givenName", description="First name")
+    age: T.Optional[int] = None
+    pets: T.List[PetModel]
+    companion: T.Union[RobotModel, PetModel]
+
+
+def resolve_age(parent, info):
+    return 42
+
+
+registry = Registry(PydanticObjectType)
+input_registry = Registry(PydanticInputObjectType)
+
+
+class Pet(PydanticObjectType):
+    class Meta:
+        model = PetModel
+        registry = registry
+
+
+class Robot(PydanticObjectType):
+    class Meta:
+        model = RobotModel
+        registry = registry
+
+
+class Person(PydanticObjectType):
+    class Meta:
+        model = PersonModel
+        registry = registry
+
+    resolve_age = staticmethod(resolve_age)
+
+
+class PetInput(PydanticInputObjectType):
+    class Meta:
+        model = PetModel
+        registry = input_registry
+
+
+PERSON = PersonModel(
+    givenName="Beth",
+    pets=[PetModel(name="Rex", color=Color.BLUE)],
+    companion=RobotModel(serial=7),
+)
+
+QUERY = """
+query {
+    person(pet: {name: "Tom"}) {
+        givenName
+        age
+        pets { name color }
+        companion {
+            ... on Robot { serial }
+            ... on Pet { name }
+        }
+    }
+}
+"""
+
+
+def _execute(person_type, pet_input_type):
+    class Query(graphene.ObjectType):
+        person = graphene.Field(person_type, pet=pet_input_type())
+
+        @staticmethod
+        def resolve_person(parent, info, pet):
+            return PERSON
+
+    return graphene.Schema(query=Query).execute(QUERY)
+
+
+def _import_source(source, tmp_path):
+    path = tmp_path / "generated_types.py"
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location("generated_types", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generated_module_matches(tmp_path):
+    generated = _import_source(generate_module(registry, input_registry), tmp_path)
+
+    assert issubclass(generated.Person, graphene.ObjectType)
+    assert not issubclass(generated.Person, PydanticObjectType)
+    assert generated.Person._meta.description == "A person."
+
+    expected = _execute(Person, PetInput)
+    result = _execute(generated.Person, generated.PetInput)
+    assert expected.errors is None
+    assert result.errors is None
+    assert result.data == expected.data
+    assert result.data["person"]["age"] == 42
+
+
+def test_generated_module_schema_matches(tmp_path):
+    generated = _import_source(generate_module(registry, input_registry), tmp_path)
+
+    def schema_for(person_type, pet_input_type):
+        class Query(graphene.ObjectType):
+            person = graphene.Field(person_type, pet=pet_input_type())
+
+        return str(graphene.Schema(query=Query))
+
+    assert schema_for(generated.Person, generated.PetInput) == schema_for(
+        Person, PetInput
+    )
+
+
+class AnimalModel(pydantic.BaseModel):
+    name: str
+
+
+class DogModel(AnimalModel):
+    good: bool = True
+
+
+class CatModel(AnimalModel):
+    lives: int = 9
+
+
+interface_registry = Registry(PydanticObjectType)
+
+
+class Dog(PydanticObjectType):
+    class Meta:
+        model = DogModel
+        registry = interface_registry
+        model_interfaces = True
+
+
+class Cat(PydanticObjectType):
+    class Meta:
+        model = CatModel
+        registry = interface_registry
+        model_interfaces = True
+
+
+ANIMALS_QUERY = """
+query {
+    animals {
+        __typename
+        name
+        ... on Dog { good }
+        ... on Cat { lives }
+    }
+}
+"""
+
+
+def _animals_schema(animal_type, dog_type, cat_type):
+    class Query(graphene.ObjectType):
+        animals = graphene.List(animal_type)
+
+        @staticmethod
+        def resolve_animals(parent, info):
+            return [DogModel(name="Rex"), CatModel(name="Tom", lives=3)]
+
+    return graphene.Schema(query=Query, types=[dog_type, cat_type])
+
+
+def test_generated_interfaces(tmp_path):
+    generated = _import_source(generate_module(interface_registry), tmp_path)
+    animal = interface_registry.get_interface_for_model(AnimalModel)
+
+    assert issubclass(generated.AnimalModelInterface, graphene.Interface)
+    assert generated.Dog._meta.interfaces == (generated.AnimalModelInterface,)
+
+    expected = _animals_schema(animal, Dog, Cat)
+    schema = _animals_schema(
+        generated.AnimalModelInterface, generated.Dog, generated.Cat
+    )
+    assert str(schema) == str(expected)
+    result = schema.execute(ANIMALS_QUERY)
+    assert result.errors is None
+    assert result.data == expected.execute(ANIMALS_QUERY).data
+    assert result.data["animals"][1] == {"__typename": "Cat", "name": "Tom", "lives": 3}
+
+
+ItemT = T.TypeVar("ItemT")
+
+
+class PageModel(pydantic.BaseModel, T.Generic[ItemT]):
+    """A page of items."""
+
+    items: T.List[ItemT]
+    total: int
+
+
+class ShelterModel(pydantic.BaseModel):
+    pets: PageModel[PetModel]
+    counts: PageModel[T.Optional[int]]
+
+
+generic_registry = Registry(PydanticObjectType)
+
+
+class GenericPet(PydanticObjectType):
+    class Meta:
+        model = PetModel
+        registry = generic_registry
+
+
+class Shelter(PydanticObjectType):
+    class Meta:
+        model = ShelterModel
+        registry = generic_registry
+
+
+SHELTER_QUERY = """
+query {
+    shelter {
+        pets { total items { __typename name color } }
+        counts { total items }
+    }
+}
+"""
+
+
+def _shelter_schema(shelter_type):
+    class Query(graphene.ObjectType):
+        shelter = graphene.Field(shelter_type)
+
+        @staticmethod
+        def resolve_shelter(parent, info):
+            return ShelterModel(
+                pets=PageModel[PetModel](items=[PetModel(name="Rex")], total=1),
+                counts=PageModel[T.Optional[int]](items=[1, None], total=2),
+            )
+
+    return graphene.Schema(query=Query)
+
+
+def test_generated_generic_types(tmp_path):
+    source = generate_module(generic_registry)
+    assert "PageModel[" not in source
+    generated = _import_source(source, tmp_path)
+
+    expected = _shelter_schema(Shelter)
+    schema = _shelter_schema(generated.Shelter)
+    assert str(schema) == str(expected)
+    result = schema.execute(SHELTER_QUERY)
+    assert result.errors is None
+    assert result.data == expected.execute(SHELTER_QUERY).data
+    assert result.data["shelter"]["counts"] == {"total": 2, "items": [1, None]}
+
+
+class KennelModel(pydantic.BaseModel):
+    scores: T.Dict[str, int]
+    pets: T.Dict[str, PetModel]
+    rooms: T.List[T.Dict[int, T.Optional[PetModel]]]
+
+
+mapping_registry = Registry(PydanticObjectType)
+
+
+class MappingPet(PydanticObjectType):
+    class Meta:
+        model = PetModel
+        registry = mapping_registry
+
+
+class Kennel(PydanticObjectType):
+    class Meta:
+        model = KennelModel
+        registry = mapping_registry
+
+
+KENNEL_QUERY = """
+query {
+    kennel {
+        scores { key value }
+        pets { key value { name color } }
+        rooms { key value { name } }
+    }
+}
+"""
+
+
+def _kennel_schema(kennel_type):
+    class Query(graphene.ObjectType):
+        kennel = graphene.Field(kennel_type)
+
+        @staticmethod
+        def resolve_kennel(parent, info):
+            return KennelModel(
+                scores={"a": 1, "b": 2},
+                pets={"rex": PetModel(name="Rex")},
+                rooms=[{1: PetModel(name="Tom"), 2: None}],
+            )
+
+    return graphene.Schema(query=Query)
+
+
+def test_generated_mapping_fields(tmp_path):
+    source = generate_module(mapping_registry)
+    # (the builtin classes can't be subscripted on Python 3.8)
+    assert "dict[" not in source and "list[" not in source
+    generated = _import_source(source, tmp_path)
+
+    expected = _kennel_schema(Kennel)
+    schema = _kennel_schema(generated.Kennel)
+    assert str(schema) == str(expected)
+    result = schema.execute(KENNEL_QUERY)
+    assert result.errors is None
+    assert result.data == expected.execute(KENNEL_QUERY).data
+    assert result.data["kennel"]["rooms"] == [
+        [{"key": 1, "value": {"name": "Tom"}}, {"key": 2, "value": None}]
+    ]
+
+
+def test_generated_memoized_fields(tmp_path):
+    from tests import test_memoize
+
+    generated = _import_source(generate_module(test_memoize.registry), tmp_path)
+
+    class Query(graphene.ObjectType):
+        books = graphene.List(generated.Book)
+        resolve_books = test_memoize.Query.resolve_books
+
+    expected = test_memoize.schema.execute(test_memoize.QUERY)
+    test_memoize.calls.clear()
+    result = graphene.Schema(query=Query).execute(test_memoize.QUERY, context_value={})
+    assert result.errors is None
+    assert result.data == expected.data
+    # the memoized fields ran once, the others once per book
+    assert sorted(test_memoize.calls) == [
+        "full_name",
+        "initials",
+        "initials",
+        "last_name",
+        "popularity",
+    ]
+
+
+def test_check_fingerprints():
+    check_fingerprints({PetModel: model_fingerprint(PetModel)})
+    with pytest.raises(GeneratedCodeOutOfDateError):
+        check_fingerprints({PetModel: "0000"})
+
+
+def test_fingerprint_changes_with_fields():
+    class Foo(pydantic.BaseModel):
+        name: str
+
+    before = model_fingerprint(Foo)
+
+    class Foo(pydantic.BaseModel):  # noqa: F811
+        name: T.Optional[str] = None
+
+    assert model_fingerprint(Foo) != before
+
+
+def test_fingerprint_changes_with_defaults_and_constraints():
+    class Foo(pydantic.BaseModel):
+        x: int = 1
+        name: str = pydantic.Field(max_length=5)
+        tags: T.List[str] = pydantic.Field(default_factory=list)
+
+    before = model_fingerprint(Foo)
+    assert model_fingerprint(Foo) == before
+
+    class Foo(pydantic.BaseModel):  # noqa: F811
+        x: int = 2
+        name: str = pydantic.Field(max_length=5)
+        tags: T.List[str] = pydantic.Field(default_factory=list)
+
+    assert model_fingerprint(Foo) != before
+
+    class Foo(pydantic.BaseModel):  # noqa: F811
+        x: int = 1
+        name: str = pydantic.Field(max_length=500)
+        tags: T.List[str] = pydantic.Field(default_factory=list)
+
+    assert model_fingerprint(Foo) != before
+
+    class Foo(pydantic.BaseModel):  # noqa: F811
+        x: int = 1
+        name: str = pydantic.Field(max_length=5)
+        tags: T.List[str] = pydantic.Field(default_factory=lambda: ["a"])
+
+    assert model_fingerprint(Foo) != before
+
+
+def test_unimportable_types():
+    class LocalModel(pydantic.BaseModel):
+        name: str
+
+    local_registry = Registry(PydanticObjectType)
+
+    class Local(PydanticObjectType):
+        class Meta:
+            model = LocalModel
+            registry = local_registry
+
+    with pytest.raises(TypeError):
+        generate_module(local_registry)
+
+
+def test_main_check(tmp_path, capsys):
+    output = str(tmp_path / "generated_types.py")
+    args = [__name__, "-r", f"{__name__}:registry", "-o", output]
+    assert main(args + ["--check"]) == 1
+    assert main(args) == 0
+    assert main(args + ["--check"]) == 0
@@ -0,0 +1,155 @@
+import array
+import time
+import tracemalloc
+import typing as T
+
+import graphene
+import pydantic
+import pytest
+
+from graphene_pydantic import ColumnarResult, PydanticObjectType
+
+
+class EmployeeModel(pydantic.BaseModel):
+    id: int
+    name: str
+    salary: float
+
+
+class Employee(PydanticObjectType):
+    class Meta:
+        model = EmployeeModel
+
+
+def _make_schema(resolver):
+    class Query(graphene.ObjectType):
+        employees = graphene.List(Employee)
+
+        @staticmethod
+        def resolve_employees(parent, info):
+            return resolver()
+
+    return graphene.Schema(query=Query)
+
+
+QUERY = "query { employees { id name salary } }"
+
+
+def _columns(n):
+    return {
+        "id": array.array("q", range(n)),
+        "name": [f"employee {i}" for i in range(n)],
+        "salary": array.array("d", (1000.0 + i for i in range(n))),
+    }
+
+
+def test_columnar_result_sequence():
+    batch = ColumnarResult(EmployeeModel, _columns(3))
+    assert len(batch) == 3
+    assert batch[1].name == "employee 1"
+    assert batch[-1].id == 2
+    assert [row.salary for row in batch[1:]] == [1001.0, 1002.0]
+    with pytest.raises(IndexError):
+        batch[3]
+    with pytest.raises(AttributeError):
+        batch[0].missing
+
+
+def test_columnar_result_mismatched_lengths():
+    with pytest.raises(ValueError):
+        ColumnarResult(EmployeeModel, {"id": [1, 2], "name": ["a"]})
+
+
+def test_columnar_result_query():
+    schema = _make_schema(lambda: ColumnarResult(EmployeeModel, _columns(2)))
+    result = schema.execute(QUERY)
+    assert result.errors is None
+    assert result.data == {
+        "employees": [
+            {"id": 0, "name": "employee 0", "salary": 1000.0},
+            {"id": 1, "name": "employee 1", "salary": 1001.0},
+        ]
+    }
+
+
+def test_columnar_result_wrong_model():
+    class OtherModel(pydantic.BaseModel):
+        id: int
+
+    schema = _make_schema(lambda: ColumnarResult(OtherModel, {"id": [1]}))
+    result = schema.execute("query { employees { id } }")
+    assert result.errors
+
+
+def test_columnar_result_column_named_model():
+    class CarModel(pydantic.BaseModel):
+        model: str
+        year: int
+
+    class Car(PydanticObjectType):
+        class Meta:
+            model = CarModel
+
+    class Query(graphene.ObjectType):
+        cars = graphene.List(Car)
+
+        @staticmethod
+        def resolve_cars(parent, info):
+            return ColumnarResult(CarModel, {"model": ["T"], "year": [1908]})
+
+    result = graphene.Schema(query=Query).execute("query { cars { model year } }")
+    assert result.errors is None
+    assert result.data == {"cars": [{"model": "T", "year": 1908}]}
+
+
+def _measure(build: T.Callable[[], T.Any]):
+    tracemalloc.start()
+    try:
+        data = build()
+        built_size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    schema = _make_schema(lambda: data)
+    start = time.perf_counter()
+    result = schema.execute(QUERY)
+    elapsed = time.perf_counter() - start
+    assert result.errors is None
+    return built_size, elapsed, result.data
+
+
+def _compare_columnar():
+    n = 20_000
+    columns = _columns(n)
+
+    def build_models():
+        return [
+            EmployeeModel(id=i, name=name, salary=salary)
+            for i, name, salary in zip(
+                columns["id"], columns["name"], columns["salary"]
+            )
+        ]
+
+    def build_columnar():
+        return ColumnarResult(EmployeeModel, columns)
+
+    return _measure(build_models), _measure(build_columnar)
+
+
+def test_columnar_result_memory():
+    (models_size, _, models_data), (
+        columnar_size,
+        _,
+        columnar_data,
+    ) = _compare_columnar()
+    assert columnar_data == models_data
+    # Building the columnar result should allocate (almost) nothing beyond the
+    # columns we already have, while the model list grows with the row count.
+    assert columnar_size * 100 < models_size
+
+
+@pytest.mark.benchmark
+def test_columnar_result_benchmark():
+    (_, models_time, _), (_, columnar_time, _) = _compare_columnar()
+    # Resolution shouldn't be meaningfully slower than reading model attributes.
+    assert columnar_time < models_time * 3
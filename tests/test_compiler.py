@@ -0,0 +1,149 @@
+import enum
+import typing as T
+
+import graphene
+import pydantic
+from graphql import parse
+
+from graphene_pydantic import PydanticObjectType
+from graphene_pydantic.compiler import CompiledExecutionContext, compile_selection
+from graphene_pydantic.registry import Registry
+
+
+class Kind(enum.Enum):
+    CAT = "cat"
+    DOG = "dog"
+
+
+class PetModel(pydantic.BaseModel):
+    name: str
+    kind: Kind
+    age: T.Optional[int] = None
+
+
+class OwnerModel(pydantic.BaseModel):
+    name: str
+    pets: T.List[PetModel]
+    nicknames: T.Optional[T.List[str]] = None
+
+
+registry = Registry(PydanticObjectType)
+
+
+class Pet(PydanticObjectType):
+    class Meta:
+        model = PetModel
+        registry = registry
+
+
+class Owner(PydanticObjectType):
+    class Meta:
+        model = OwnerModel
+        registry = registry
+
+    pet_count = graphene.Int()
+
+    @staticmethod
+    def resolve_pet_count(parent, info):
+        return len(parent.pets)
+
+
+OWNERS = [
+    OwnerModel(
+        name="Ann",
+        pets=[PetModel(name="Tom", kind=Kind.CAT, age=3)],
+        nicknames=["A"],
+    ),
+    OwnerModel(name="Bob", pets=[PetModel(name="Rex", kind=Kind.DOG)]),
+]
+
+
+class Query(graphene.ObjectType):
+    owners = graphene.List(Owner)
+    pet = graphene.Field(Pet)
+
+    @staticmethod
+    def resolve_owners(parent, info):
+        return OWNERS
+
+    @staticmethod
+    def resolve_pet(parent, info):
+        return {"name": "Not a model"}
+
+
+schema = graphene.Schema(query=Query)
+
+
+def _compare(query):
+    expected = schema.execute(query)
+    result = schema.execute(query, execution_context_class=CompiledExecutionContext)
+    assert result.data == expected.data
+    assert result.errors == expected.errors
+    return result
+
+
+def _compile(query, type_name):
+    document = parse(query)
+    fragments = {d.name.value: d for d in document.definitions[1:]}
+    (field_node,) = document.definitions[0].selection_set.selections
+    return compile_selection(
+        schema.graphql_schema,
+        schema.graphql_schema.get_type(type_name),
+        [field_node],
+        fragments,
+    )
+
+
+def test_compiled_query():
+    result = _compare(
+        """
+        query {
+            owners {
+                __typename
+                name
+                nicknames
+                pets { ...PetFields years: age }
+            }
+        }
+        fragment PetFields on Pet { name kind }
+        """
+    )
+    assert result.errors is None
+    assert result.data["owners"][0] == {
+        "__typename": "Owner",
+        "name": "Ann",
+        "nicknames": ["A"],
+        "pets": [{"name": "Tom", "kind": "CAT", "years": 3}],
+    }
+
+
+def test_compile_selection():
+    compiled = _compile("{ owners { name pets { name } } }", "Owner")
+    assert compiled(OWNERS[1]) == {"name": "Bob", "pets": [{"name": "Rex"}]}
+    # the same selection in another document reuses the same function
+    assert _compile("query Q { owners { name, pets { name } } }", "Owner") is compiled
+
+
+def test_custom_resolvers_are_not_compiled():
+    assert _compile("{ owners { name petCount } }", "Owner") is None
+    # but the objects they return can still be compiled
+    result = _compare("{ owners { petCount pets { name } } }")
+    assert result.errors is None
+    assert result.data["owners"][1] == {"petCount": 1, "pets": [{"name": "Rex"}]}
+
+
+def test_variables_are_not_compiled():
+    assert _compile("{ owners { name @include(if: $x) } }", "Owner") is None
+    result = schema.execute(
+        "query ($x: Boolean!) { owners { name @include(if: $x) } }",
+        variables={"x": False},
+        execution_context_class=CompiledExecutionContext,
+    )
+    assert result.data == {"owners": [{}, {}]}
+
+
+def test_fallback_errors():
+    # the compiled function gives up on values that aren't of the right type,
+    # and graphql-core reports the error as usual
+    result = _compare("{ pet { name } }")
+    assert result.errors
@@ -4,6 +4,7 @@ import enum
 import sys
 import typing as T
 import uuid
+from types import SimpleNamespace
 from typing import Optional
 
 import graphene
@@ -11,11 +12,12 @@ import graphene.types
 import pytest
 from pydantic import BaseModel
 from pydantic import create_model
+from pydantic.fields import FieldInfo
 
 import graphene_pydantic.converters as converters
 from graphene_pydantic.converters import ConversionError, convert_pydantic_field
 from graphene_pydantic.objecttype import PydanticObjectType
-from graphene_pydantic.registry import Placeholder, get_global_registry
+from graphene_pydantic.registry import Placeholder, Registry, get_global_registry
 
 
 def _get_field_from_spec(name, type_spec_or_default):
@@ -135,11 +137,39 @@ if sys.version_info >= (3, 10):
 
 
 def test_mapping():
+    field = _convert_field_from_spec("attr", (T.Dict[str, int], {"foo": 5}))
+    assert isinstance(field.type.of_type, graphene.List)
+    entry_type = field.type.of_type.of_type.of_type
+    assert entry_type.__name__ == "StrToIntEntry"
+    assert entry_type._meta.fields["key"].type.of_type == graphene.String
+    assert entry_type._meta.fields["value"].type.of_type == graphene.Int
+    assert list(field.resolver(SimpleNamespace(attr={"foo": 5}), None)) == [("foo", 5)]
+
+    # the entry types are shared between fields
+    other = _convert_field_from_spec("other", (T.Mapping[str, int], {}))
+    assert other.type.of_type.of_type.of_type is entry_type
+
+    field = _convert_field_from_spec("attr", (T.Dict[str, T.Optional[int]], {}))
+    assert field.type.of_type.of_type.of_type._meta.fields["value"].type == (
+        graphene.Int
+    )
+
     with pytest.raises(ConversionError) as exc:
-        _convert_field_from_spec("attr", (T.Dict[str, int], {"foo": 5}))
+        _convert_field_from_spec("attr", (T.Dict, {"foo": 5}))
     assert exc.value.args[0] == "Don't know how to handle mappings in Graphene."
 
 
+def test_mapping_entries_adapter():
+    adapter = converters.get_mapping_entries_adapter(
+        T.Optional[T.List[T.Dict[str, T.Dict[str, int]]]]
+    )
+    assert adapter(None) is None
+    assert [[(k, list(v)) for k, v in d] for d in adapter([{"a": {"b": 1}}])] == [
+        [("a", [("b", 1)])]
+    ]
+    assert converters.get_mapping_entries_adapter(T.List[int]) is None
+
+
 def test_decimal(monkeypatch):
     monkeypatch.setattr(converters, "DECIMAL_SUPPORTED", True)
     field = _convert_field_from_spec("attr", (decimal.Decimal, decimal.Decimal(1.25)))
@@ -186,6 +216,32 @@ def test_enum():
     assert field.type.of_type._meta.enum == Color
 
 
+def test_enum_serializer():
+    class Color(enum.Enum):
+        RED = "red"
+        GREEN = "GREEN"
+        BLUE = "RED"
+        CRIMSON = "red"
+
+    graphene_enum = converters.convert_enum(Color, Registry(PydanticObjectType))
+    serializer = converters.get_enum_serializer(graphene_enum)
+    assert serializer.by_value == {
+        "red": "RED",
+        "GREEN": "GREEN",
+        "RED": "BLUE",
+        "BLUE": "BLUE",
+        "CRIMSON": "RED",
+    }
+
+    schema = graphene.Schema(types=[graphene_enum])
+    enum_type = schema.graphql_schema.get_type("Color")
+    serialize = serializer.bind(enum_type.serialize)
+    for value in (*Color, "red", "GREEN", "RED", "BLUE", "CRIMSON"):
+        assert serialize(value) == enum_type.serialize(value)
+    with pytest.raises(Exception, match="cannot represent value"):
+        serialize("purple")
+
+
 def test_existing_model():
     from graphene_pydantic import PydanticObjectType
 
@@ -232,3 +288,53 @@ def test_self_referencing():
     NodeModelSchema.resolve_placeholders()
 
     assert NodeModelSchema._meta.model is NodeModel
+
+
+def test_deeply_nested_types():
+    type_ = int
+    for _ in range(200):
+        type_ = T.List[T.Optional[type_]]
+    field = FieldInfo(annotation=type_)
+    graphene_type = converters.find_graphene_type(
+        type_, field, Registry(PydanticObjectType)
+    )
+    depth = 0
+    while isinstance(graphene_type, graphene.List):
+        graphene_type = graphene_type.of_type
+        depth += 1
+    assert depth == 200
+    assert graphene_type is graphene.Int
+    assert converters.get_list_bounds(field) == (None,) * 200
+    assert converters.get_mapping_entries_adapter(type_) is None
+
+
+def test_shared_inner_types_are_converted_once():
+    class Foo(BaseModel):
+        x: int
+
+    class Bar(BaseModel):
+        y: int
+
+    type_ = T.Union[T.List[Foo], T.Dict[str, T.List[Foo]], T.List[Bar]]
+    union = converters.find_graphene_type(
+        type_, FieldInfo(annotation=type_), Registry(PydanticObjectType)
+    )
+    foos, entries, bars = union._meta.types
+    entry_type = entries.of_type.of_type
+    assert entry_type._meta.fields["value"].type.of_type is foos
+
+
+def test_self_containing_alias():
+    module = SimpleNamespace(Json=None)
+    sys.modules["json_alias"] = module
+    try:
+        module.Json = T.Union[int, T.List[T.ForwardRef("Json")]]
+        with pytest.raises(ConversionError, match="contains itself"):
+            converters.find_graphene_type(
+                module.Json,
+                FieldInfo(annotation=module.Json),
+                Registry(PydanticObjectType),
+                model=SimpleNamespace(__module__="json_alias"),
+            )
+    finally:
+        del sys.modules["json_alias"]
@@ -0,0 +1,86 @@
+import typing as T
+
+import graphene
+import pydantic
+from graphql import parse, validate
+
+from graphene_pydantic import PydanticObjectType
+from graphene_pydantic.converters import get_list_bounds
+from graphene_pydantic.cost import cost_limit_validator, estimate_query_cost
+from graphene_pydantic.registry import Registry
+
+
+class TagModel(pydantic.BaseModel):
+    name: str
+
+
+class PostModel(pydantic.BaseModel):
+    title: str
+    tags: T.List[TagModel] = pydantic.Field(max_length=5)
+    scores: T.List[pydantic.conlist(int, max_length=3)] = pydantic.Field(max_length=2)
+    related: T.List[TagModel]
+
+
+registry = Registry(PydanticObjectType)
+
+
+class Tag(PydanticObjectType):
+    class Meta:
+        model = TagModel
+        registry = registry
+
+
+class Post(PydanticObjectType):
+    class Meta:
+        model = PostModel
+        registry = registry
+
+
+class Query(graphene.ObjectType):
+    post = graphene.Field(Post)
+    posts = graphene.List(Post)
+
+
+schema = graphene.Schema(query=Query)
+
+
+def test_get_list_bounds():
+    fields = PostModel.model_fields
+    assert get_list_bounds(fields["title"]) == ()
+    assert get_list_bounds(fields["tags"]) == (5,)
+    assert get_list_bounds(fields["scores"]) == (2, 3)
+    assert get_list_bounds(fields["related"]) == (None,)
+    assert Post._meta.fields["tags"].list_bounds == (5,)
+
+
+def test_estimate_query_cost():
+    query = """
+    query One { post { title tags { name } scores } }
+    query Many { posts { ...PostFields } }
+    query Related { post { related { __typename name } } }
+    fragment PostFields on Post { title tags { name } }
+    """
+    assert estimate_query_cost(schema, query, default_list_size=10) == {
+        # 1 + 1 + 5 * (1 + 1) + 2 * 3
+        "One": 18,
+        # 10 * (1 + 1 + 5 * (1 + 1))
+        "Many": 120,
+        # 1 + 10 * (1 + 1)
+        "Related": 21,
+    }
+
+
+def test_cost_limit_validator():
+    costs = []
+    rule = cost_limit_validator(100, default_list_size=10, callback=costs.append)
+
+    errors = validate(schema.graphql_schema, parse("{ post { title } }"), (rule,))
+    assert errors == []
+    assert costs == [{"anonymous": 2}]
+
+    errors = validate(
+        schema.graphql_schema, parse("query Q { posts { tags { name } } }"), (rule,)
+    )
+    assert [e.message for e in errors] == [
+        "'Q' exceeds maximum operation cost of 100 (estimated: 110)."
+    ]
@@ -0,0 +1,162 @@
+import threading
+import typing as T
+
+import graphene
+import pydantic
+
+from graphene_pydantic import PydanticInputObjectType, PydanticObjectType
+from graphene_pydantic.converters import _generic_conversion
+from graphene_pydantic.registry import Registry
+from graphene_pydantic.util import construct_generic_class_name
+
+ItemT = T.TypeVar("ItemT")
+
+
+class Page(pydantic.BaseModel, T.Generic[ItemT]):
+    """A page of results."""
+
+    items: T.List[ItemT]
+    total: int
+
+
+class EmployeeModel(pydantic.BaseModel):
+    name: str
+
+
+class DepartmentModel(pydantic.BaseModel):
+    title: str
+
+
+registry = Registry(PydanticObjectType)
+
+
+class Employee(PydanticObjectType):
+    class Meta:
+        model = EmployeeModel
+        registry = registry
+
+
+class Department(PydanticObjectType):
+    class Meta:
+        model = DepartmentModel
+        registry = registry
+
+
+class DirectoryModel(pydantic.BaseModel):
+    employees: Page[EmployeeModel]
+    managers: Page[EmployeeModel]
+    departments: Page[DepartmentModel]
+    tags: Page[Page[str]]
+
+
+class Directory(PydanticObjectType):
+    class Meta:
+        model = DirectoryModel
+        registry = registry
+
+
+def test_construct_generic_class_name():
+    assert construct_generic_class_name(Page, (int,)) == "PageOfInt"
+    assert (
+        construct_generic_class_name(Page, (T.List[EmployeeModel],))
+        == "PageOfListEmployeeModel"
+    )
+
+
+def test_generic_types_are_cached():
+    employees = Directory._meta.fields["employees"].type.of_type
+    managers = Directory._meta.fields["managers"].type.of_type
+    departments = Directory._meta.fields["departments"].type.of_type
+
+    assert employees is managers
+    assert employees is not departments
+    assert employees._meta.name == "PageOfEmployeeModel"
+    assert departments._meta.name == "PageOfDepartmentModel"
+    assert employees._meta.description == "A page of results."
+    assert registry.get_type_for_generic_model(Page, (EmployeeModel,)) is employees
+    tags = Directory._meta.fields["tags"].type.of_type
+    assert tags._meta.name == "PageOfPageStr"
+
+
+def test_generic_query():
+    class Query(graphene.ObjectType):
+        directory = graphene.Field(Directory)
+
+        @staticmethod
+        def resolve_directory(parent, info):
+            return DirectoryModel(
+                employees=Page[EmployeeModel](
+                    items=[EmployeeModel(name="Beth")], total=1
+                ),
+                managers=Page[EmployeeModel](items=[], total=0),
+                departments=Page[DepartmentModel](
+                    items=[DepartmentModel(title="Sales")], total=1
+                ),
+                tags=Page[Page[str]](items=[Page[str](items=["a"], total=1)], total=1),
+            )
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute(
+        """
+        query {
+            directory {
+                employees { items { name } total }
+                departments { items { title } }
+                tags { items { items } }
+            }
+        }
+        """
+    )
+    assert result.errors is None
+    assert result.data == {
+        "directory": {
+            "employees": {"items": [{"name": "Beth"}], "total": 1},
+            "departments": {"items": [{"title": "Sales"}]},
+            "tags": {"items": [{"items": ["a"]}]},
+        }
+    }
+
+
+def test_generic_input_type():
+    input_registry = Registry(PydanticInputObjectType)
+
+    class FilterModel(pydantic.BaseModel):
+        terms: Page[str]
+
+    class Filter(PydanticInputObjectType):
+        class Meta:
+            model = FilterModel
+            registry = input_registry
+
+    page_input = Filter._meta.fields["terms"].type.of_type
+    assert page_input._meta.name == "PageOfStrInput"
+    assert issubclass(page_input, PydanticInputObjectType)
+
+
+def test_generic_types_created_per_thread():
+    thread_registry = Registry(PydanticObjectType)
+
+    class ThreadModel(pydantic.BaseModel):
+        page: Page[int]
+
+    created = {}
+
+    def create():
+        class Thread(PydanticObjectType):
+            class Meta:
+                model = ThreadModel
+                registry = thread_registry
+
+        created["type"] = Thread._meta.fields["page"].type.of_type
+
+    # A conversion in progress in this thread doesn't take in the other's models
+    _generic_conversion.worklist = []
+    try:
+        thread = threading.Thread(target=create)
+        thread.start()
+        thread.join()
+    finally:
+        _generic_conversion.worklist = None
+
+    assert created["type"]._meta.name == "PageOfInt"
+    assert thread_registry.get_type_for_generic_model(Page, (int,)) is created["type"]
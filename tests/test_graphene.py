@@ -129,3 +129,37 @@ def test_mutation():
     assert (
         TypeAdapter(FooBar).validate_python(result.data["createFooBar"]) == new_foo_bar
     )
+
+
+def test_query_mapping():
+    from typing import Dict
+
+    class Pet(pydantic.BaseModel):
+        name: str
+        age: int
+
+    class Owner(pydantic.BaseModel):
+        pets_by_name: Dict[str, Pet]
+
+    class PetOutput(PydanticObjectType):
+        class Meta:
+            model = Pet
+
+    class OwnerOutput(PydanticObjectType):
+        class Meta:
+            model = Owner
+
+    class MappingQuery(graphene.ObjectType):
+        owner = graphene.Field(OwnerOutput)
+
+        @staticmethod
+        def resolve_owner(parent, info):
+            return Owner(pets_by_name={"rex": Pet(name="Rex", age=3)})
+
+    schema = graphene.Schema(query=MappingQuery)
+    result = schema.execute("query { owner { petsByName { key value { age } } } }")
+
+    assert result.errors is None
+    assert result.data == {
+        "owner": {"petsByName": [{"key": "rex", "value": {"age": 3}}]}
+    }
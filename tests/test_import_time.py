@@ -0,0 +1,54 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _import_times(statement):
+    """
+    Run `statement` in a fresh interpreter with `-X importtime`, returning the
+    cumulative import time (in microseconds) of each module it imported.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_package_import_is_lazy():
+    times = _import_times("import graphene_pydantic")
+    assert "graphene_pydantic" in times
+    for module in ("graphene", "graphql", "pydantic", "typing", "bson"):
+        assert module not in times
+
+
+@pytest.mark.benchmark
+def test_package_import_time():
+    times = _import_times("import graphene_pydantic")
+    # it shouldn't take more than a few milliseconds, but leave plenty of room
+    # for slow machines
+    assert times["graphene_pydantic"] < 50_000
+
+
+def test_optional_modules_load_on_first_use():
+    times = _import_times("from graphene_pydantic import PydanticObjectType")
+    assert "graphene_pydantic.objecttype" in times
+    for module in (
+        "bson",
+        "graphene_pydantic.bulk",
+        "graphene_pydantic.caching",
+        "graphene_pydantic.codegen",
+        "graphene_pydantic.compiler",
+        "graphene_pydantic.cost",
+    ):
+        assert module not in times
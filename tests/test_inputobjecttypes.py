@@ -1,9 +1,14 @@
+import threading
 import typing as T
 
+import graphene
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
 
+from graphene_pydantic.bulk import _nested_creation
 from graphene_pydantic.inputobjecttype import PydanticInputObjectType
+from graphene_pydantic.registry import Placeholder, Registry
+from graphene_pydantic.validation import _validation_cache
 
 
 def test_object_type_onlyfields():
@@ -47,3 +52,228 @@ def test_object_type_onlyandexclude():
                 model = Foo
                 only_fields = ("name",)
                 exclude_fields = ("size",)
+
+
+class PatchModel(BaseModel):
+    name: str
+    nickname: T.Optional[str] = "nick"
+    size: int = 1
+    tags: T.List[str] = []
+    email: T.Optional[str] = Field(None, alias="emailAddress")
+
+    @field_validator("size")
+    @classmethod
+    def check_size(cls, size):
+        if size < 0:
+            raise ValueError("size must not be negative")
+        return size
+
+
+class Patch(PydanticInputObjectType):
+    class Meta:
+        model = PatchModel
+        exclude_unset = True
+
+
+def _mutate(patch_type, query):
+    received = []
+
+    class Update(graphene.Mutation):
+        class Arguments:
+            patch = patch_type(required=True)
+
+        ok = graphene.Boolean()
+
+        @staticmethod
+        def mutate(parent, info, patch):
+            received.append((dict(patch), patch_type.to_model(patch)))
+            return Update(ok=True)
+
+    class Mutation(graphene.ObjectType):
+        update = Update.Field()
+
+    schema = graphene.Schema(query=Mutation, mutation=Mutation)
+    result = schema.execute(query)
+    return result, received
+
+
+def test_exclude_unset():
+    result, received = _mutate(
+        Patch, 'mutation { update(patch: {name: "a", nickname: null}) { ok } }'
+    )
+    assert result.errors is None
+    ((data, model),) = received
+    assert data == {"name": "a", "nickname": None}
+    assert model == PatchModel(name="a", nickname=None)
+    assert model.model_fields_set == {"name", "nickname"}
+    assert model.model_dump(exclude_unset=True) == {"name": "a", "nickname": None}
+
+
+def test_exclude_unset_validates_sent_fields():
+    assert Patch.to_model({"name": "a", "email": "a@b.c"}).email == "a@b.c"
+    with pytest.raises(ValidationError, match="size must not be negative"):
+        Patch.to_model({"name": "a", "size": -1})
+
+
+def test_defaults_are_sent_without_exclude_unset():
+    class FullPatch(PydanticInputObjectType):
+        class Meta:
+            model = PatchModel
+            registry = Registry(PydanticInputObjectType)
+
+    result, received = _mutate(
+        FullPatch, 'mutation { update(patch: {name: "a"}) { ok } }'
+    )
+    assert result.errors is None
+    ((data, model),) = received
+    assert data == {
+        "name": "a",
+        "nickname": "nick",
+        "size": 1,
+        "tags": [],
+        "email": None,
+    }
+    assert model.model_fields_set == set(data)
+
+
+def test_exclude_unset_keeps_field_order():
+    data = {"size": 5, "tags": ["x"], "name": "a"}
+    model = Patch.to_model(data)
+    expected = PatchModel.model_validate(data)
+    assert list(model.__dict__) == list(expected.__dict__)
+    assert model.model_dump_json() == expected.model_dump_json()
+    assert repr(model) == repr(expected)
+
+
+def test_to_model_with_model_validator():
+    class Range(BaseModel):
+        low: int = 0
+        high: int = 10
+
+        @model_validator(mode="after")
+        def check_range(self):
+            if self.low > self.high:
+                raise ValueError("low is above high")
+            return self
+
+    class RangeInput(PydanticInputObjectType):
+        class Meta:
+            model = Range
+            exclude_unset = True
+
+    assert RangeInput.to_model({"low": 5}).model_fields_set == {"low"}
+    # the model validator sees the defaults of the fields that weren't sent
+    with pytest.raises(ValidationError, match="low is above high"):
+        RangeInput.to_model({"low": 11})
+
+
+def test_to_model_reuses_validators():
+    first = Patch.to_model({"name": "a", "size": 2})
+    validators = _validation_cache[PatchModel].validators
+    validator = validators[frozenset({"name", "size"})]
+    second = Patch.to_model({"name": "b", "size": 3})
+    assert validators[frozenset({"name", "size"})] is validator
+    # mutable defaults aren't shared between instances
+    assert first.tags == second.tags == []
+    assert first.tags is not second.tags
+
+
+class AdjustmentModel(BaseModel):
+    reason: str
+    amount: int = 0
+
+
+class LineModel(BaseModel):
+    sku: str
+    adjustments: T.List[AdjustmentModel] = []
+
+
+class OrderModel(BaseModel):
+    lines: T.List[LineModel]
+    parent: T.Optional["OrderModel"] = None
+    note: T.Optional[str] = None
+
+
+def test_create_nested():
+    nested_registry = Registry(PydanticInputObjectType)
+
+    class OrderInput(PydanticInputObjectType):
+        class Meta:
+            model = OrderModel
+            registry = nested_registry
+            create_nested = True
+            exclude_unset = True
+
+    line_input = nested_registry.get_type_for_model(LineModel)
+    adjustment_input = nested_registry.get_type_for_model(AdjustmentModel)
+    assert line_input._meta.name == "LineModelInput"
+    assert line_input._meta.create_nested and line_input._meta.exclude_unset
+    assert OrderInput._meta.fields["lines"].type.of_type.of_type is line_input
+    assert line_input._meta.fields["adjustments"].type.of_type is adjustment_input
+    # the reference back to the model being declared is resolved too
+    assert OrderInput._meta.fields["parent"].type is OrderInput
+
+    class AnotherOrderInput(PydanticInputObjectType):
+        class Meta:
+            model = OrderModel
+            registry = nested_registry
+            skip_registry = True
+            create_nested = True
+
+    # the nested types are only created once
+    assert AnotherOrderInput._meta.fields["lines"].type.of_type.of_type is (line_input)
+
+    result, received = _mutate(
+        OrderInput,
+        'mutation { update(patch: {lines: [{sku: "a", adjustments: [{reason: "b"}]}]}) { ok } }',
+    )
+    assert result.errors is None
+    ((_, order),) = received
+    assert order.model_fields_set == {"lines"}
+    assert order.lines[0].adjustments == [AdjustmentModel(reason="b")]
+
+
+def test_create_nested_per_thread():
+    thread_registry = Registry(PydanticInputObjectType)
+    created = {}
+
+    def create():
+        class LineInput(PydanticInputObjectType):
+            class Meta:
+                model = LineModel
+                registry = thread_registry
+                create_nested = True
+
+        created["type"] = LineInput._meta.fields["adjustments"].type.of_type
+
+    # Nested types being created in this thread don't keep the other from
+    # creating types for the same models
+    _nested_creation.models = {AdjustmentModel}
+    try:
+        thread = threading.Thread(target=create)
+        thread.start()
+        thread.join()
+    finally:
+        _nested_creation.models = None
+
+    assert created["type"] is thread_registry.get_type_for_model(AdjustmentModel)
+    assert created["type"]._meta.name == "AdjustmentModelInput"
+
+
+def test_resolve_placeholders():
+    placeholder_registry = Registry(PydanticInputObjectType)
+
+    class LineInput(PydanticInputObjectType):
+        class Meta:
+            model = LineModel
+            registry = placeholder_registry
+
+    assert isinstance(LineInput._meta.fields["adjustments"].type.of_type, Placeholder)
+
+    class AdjustmentInput(PydanticInputObjectType):
+        class Meta:
+            model = AdjustmentModel
+            registry = placeholder_registry
+
+    LineInput.resolve_placeholders()
+    assert LineInput._meta.fields["adjustments"].type.of_type is (AdjustmentInput)
@@ -0,0 +1,181 @@
+import typing as T
+
+import graphene
+import pydantic
+
+from graphene_pydantic import PydanticInterface, PydanticObjectType
+from graphene_pydantic.registry import Registry
+
+
+class PersonModel(pydantic.BaseModel):
+    name: str
+    nickname: T.Optional[str] = None
+
+
+class EmployeeModel(PersonModel):
+    salary: float
+
+
+class ManagerModel(EmployeeModel):
+    team_size: int
+
+
+class DirectorModel(ManagerModel):
+    pass
+
+
+registry = Registry(PydanticObjectType)
+
+
+class Person(PydanticInterface):
+    class Meta:
+        model = PersonModel
+        registry = registry
+
+
+class Employee(PydanticObjectType):
+    class Meta:
+        model = EmployeeModel
+        registry = registry
+        model_interfaces = True
+
+    @staticmethod
+    def resolve_nickname(parent, info):
+        return parent.name.lower()
+
+
+class Manager(PydanticObjectType):
+    class Meta:
+        model = ManagerModel
+        registry = registry
+        model_interfaces = True
+
+
+class Query(graphene.ObjectType):
+    people = graphene.List(Person)
+
+    @staticmethod
+    def resolve_people(parent, info):
+        return [
+            EmployeeModel(name="Carmen", salary=1.0),
+            ManagerModel(name="Jason", salary=2.0, team_size=2),
+            DirectorModel(name="Derek", salary=3.0, team_size=20),
+        ]
+
+
+def test_model_interfaces():
+    assert Employee._meta.interfaces == (Person,)
+    assert [i._meta.name for i in Manager._meta.interfaces] == [
+        "EmployeeModelInterface",
+        "Person",
+    ]
+
+
+def test_interface_query():
+    schema = graphene.Schema(query=Query, types=[Employee, Manager])
+    result = schema.execute(
+        """
+        query {
+            people {
+                __typename
+                name
+                nickname
+                ... on Manager { teamSize }
+            }
+        }
+        """
+    )
+    assert result.errors is None
+    assert result.data == {
+        "people": [
+            {"__typename": "Employee", "name": "Carmen", "nickname": "carmen"},
+            {"__typename": "Manager", "name": "Jason", "nickname": None, "teamSize": 2},
+            {
+                "__typename": "Manager",
+                "name": "Derek",
+                "nickname": None,
+                "teamSize": 20,
+            },
+        ]
+    }
+
+
+def test_resolve_type():
+    assert Person.resolve_type(EmployeeModel(name="a", salary=1.0), None) is Employee
+    assert (
+        Person.resolve_type(DirectorModel(name="a", salary=1.0, team_size=1), None)
+        is Manager
+    )
+    assert Person.resolve_type(PersonModel(name="a"), None) is None
+
+
+def test_inherited_fields_are_shared():
+    (employee_interface, _) = Manager._meta.interfaces
+    assert Employee._meta.fields["name"] is Person._meta.fields["name"]
+    assert Manager._meta.fields["salary"] is employee_interface._meta.fields["salary"]
+    # fields with a custom resolver can't be shared
+    assert Employee._meta.fields["nickname"] is not Person._meta.fields["nickname"]
+    # nor can fields the subclass changed
+    assert "team_size" not in employee_interface._meta.fields
+
+
+def test_same_named_field_models_are_not_shared():
+    SettingsA = pydantic.create_model("Settings", flag=(bool, False))
+    SettingsB = pydantic.create_model("Settings", level=(int, 0))
+
+    class ParentModel(pydantic.BaseModel):
+        settings: SettingsA
+
+    class ChildModel(ParentModel):
+        settings: SettingsB
+
+    registry = Registry(PydanticObjectType)
+
+    class SettingsAT(PydanticObjectType):
+        class Meta:
+            model = SettingsA
+            registry = registry
+
+    class SettingsBT(PydanticObjectType):
+        class Meta:
+            model = SettingsB
+            registry = registry
+
+    class ParentT(PydanticObjectType):
+        class Meta:
+            model = ParentModel
+            registry = registry
+
+    class ChildT(PydanticObjectType):
+        class Meta:
+            model = ChildModel
+            registry = registry
+            model_interfaces = True
+
+    assert ParentT._meta.fields["settings"].type.of_type is SettingsAT
+    assert ChildT._meta.fields["settings"].type.of_type is SettingsBT
+
+
+def test_plain_interface_fields_are_kept():
+    class UserModel(pydantic.BaseModel):
+        id: int
+        name: str
+
+    class User(PydanticObjectType):
+        class Meta:
+            model = UserModel
+            registry = Registry(PydanticObjectType)
+            interfaces = (graphene.relay.Node,)
+
+    assert str(User._meta.fields["id"].type) == "ID!"
+
+    class Query(graphene.ObjectType):
+        user = graphene.Field(User)
+
+        @staticmethod
+        def resolve_user(parent, info):
+            return UserModel(id=1, name="Ann")
+
+    result = graphene.Schema(query=Query).execute("{ user { id name } }")
+    assert result.errors is None
+    assert result.data == {"user": {"id": "VXNlcjox", "name": "Ann"}}
@@ -0,0 +1,200 @@
+import typing as T
+
+import graphene
+import pydantic
+import pytest
+
+from graphene_pydantic import PydanticObjectType
+from graphene_pydantic.registry import Registry
+
+
+class SalaryModel(pydantic.BaseModel):
+    rating: str
+    amount: float = pydantic.Field(alias="salaryAmount")
+
+
+class DogModel(pydantic.BaseModel):
+    kind: T.Literal["dog"]
+    name: str
+    barks: bool
+
+
+class CatModel(pydantic.BaseModel):
+    kind: T.Literal["cat"]
+    name: str
+    lives: int
+
+
+class OwnerModel(pydantic.BaseModel):
+    salary: SalaryModel
+    pets: T.List[T.Union[DogModel, CatModel]]
+
+
+class Salary(PydanticObjectType):
+    class Meta:
+        model = SalaryModel
+        mapping_roots = True
+
+
+class Dog(PydanticObjectType):
+    class Meta:
+        model = DogModel
+        mapping_roots = True
+        discriminator = "kind"
+
+
+class Cat(PydanticObjectType):
+    class Meta:
+        model = CatModel
+        mapping_roots = True
+        discriminator = "kind"
+
+
+class Owner(PydanticObjectType):
+    class Meta:
+        model = OwnerModel
+        mapping_roots = True
+
+
+def _execute(owner, query):
+    class Query(graphene.ObjectType):
+        owner = graphene.Field(Owner)
+
+        @staticmethod
+        def resolve_owner(parent, info):
+            return owner
+
+    return graphene.Schema(query=Query).execute(query)
+
+
+def test_mapping_root_fields_and_aliases():
+    result = _execute(
+        {"salary": {"rating": "GS-11", "salaryAmount": 95000.0}, "pets": []},
+        "query { owner { salary { rating salaryAmount } } }",
+    )
+    assert result.errors is None
+    assert result.data == {
+        "owner": {"salary": {"rating": "GS-11", "salaryAmount": 95000.0}}
+    }
+
+
+def test_mapping_root_union_discriminator():
+    result = _execute(
+        {
+            "salary": {"rating": "GS-9", "amount": 1.0},
+            "pets": [
+                {"kind": "dog", "name": "Rex", "barks": True},
+                {"kind": "cat", "name": "Tom", "lives": 9},
+            ],
+        },
+        """
+        query {
+            owner {
+                pets {
+                    ... on Dog { name barks }
+                    ... on Cat { name lives }
+                }
+            }
+        }
+        """,
+    )
+    assert result.errors is None
+    assert result.data == {
+        "owner": {"pets": [{"name": "Rex", "barks": True}, {"name": "Tom", "lives": 9}]}
+    }
+
+
+def test_mapping_root_typename_tag():
+    assert Cat.is_type_of({"__typename": "Cat"}, None)
+    assert not Dog.is_type_of({"__typename": "Cat", "kind": "dog"}, None)
+
+
+def test_mapping_root_union_without_tag():
+    class BirdModel(pydantic.BaseModel):
+        name: str
+        sings: bool = pydantic.Field(alias="doesSing")
+
+    class FishModel(pydantic.BaseModel):
+        name: str
+        fins: int
+        depth: T.Optional[int] = None
+
+    class Bird(PydanticObjectType):
+        class Meta:
+            model = BirdModel
+            mapping_roots = True
+
+    class Fish(PydanticObjectType):
+        class Meta:
+            model = FishModel
+            mapping_roots = True
+
+    class Animal(graphene.Union):
+        class Meta:
+            types = (Bird, Fish)
+
+    class Query(graphene.ObjectType):
+        animals = graphene.List(Animal)
+
+        @staticmethod
+        def resolve_animals(parent, info):
+            return [{"name": "Nemo", "fins": 3}, {"name": "Tweety", "doesSing": True}]
+
+    result = graphene.Schema(query=Query).execute(
+        "{ animals { __typename ... on Bird { doesSing } ... on Fish { fins } } }"
+    )
+    assert result.errors is None
+    assert result.data == {
+        "animals": [
+            {"__typename": "Fish", "fins": 3},
+            {"__typename": "Bird", "doesSing": True},
+        ]
+    }
+    assert not Bird.is_type_of({"name": "Polly"}, None)
+
+
+def test_mapping_root_models_still_resolve():
+    owner = OwnerModel(
+        salary=SalaryModel(rating="GS-9", salaryAmount=1.0),
+        pets=[CatModel(kind="cat", name="Tom", lives=9)],
+    )
+    result = _execute(owner, "query { owner { salary { salaryAmount } } }")
+    assert result.errors is None
+    assert result.data == {"owner": {"salary": {"salaryAmount": 1.0}}}
+
+
+def test_mapping_roots_disabled_by_default():
+    class PlainModel(pydantic.BaseModel):
+        name: str
+
+    class Plain(PydanticObjectType):
+        class Meta:
+            model = PlainModel
+
+    assert not Plain.is_type_of({"name": "x"}, None)
+
+
+def test_mapping_roots_from_registry():
+    class PlainModel(pydantic.BaseModel):
+        name: str
+
+    class Plain(PydanticObjectType):
+        class Meta:
+            model = PlainModel
+            registry = Registry(PydanticObjectType, mapping_roots=True)
+
+    assert Plain.is_type_of({"name": "x"}, None)
+    assert Plain._meta.fields["name"].resolver({"name": "x"}, None) == "x"
+
+
+def test_invalid_discriminator():
+    class PlainModel(pydantic.BaseModel):
+        name: str
+
+    with pytest.raises(ValueError):
+
+        class Plain(PydanticObjectType):
+            class Meta:
+                model = PlainModel
+                mapping_roots = True
+                discriminator = "name"
@@ -0,0 +1,156 @@
+import typing as T
+from types import SimpleNamespace
+
+import graphene
+import pydantic
+import pytest
+
+from graphene_pydantic import PydanticObjectType
+from graphene_pydantic.memoize import REQUEST_CACHE_KEY, get_request_cache
+from graphene_pydantic.registry import Registry
+
+calls = []
+
+
+class AuthorModel(pydantic.BaseModel):
+    first_name: str
+    last_name: str
+
+    @pydantic.computed_field(description="The author's full name")
+    @property
+    def full_name(self) -> str:
+        calls.append("full_name")
+        return f"{self.first_name} {self.last_name}"
+
+    @pydantic.computed_field
+    @property
+    def initials(self) -> T.Optional[str]:
+        calls.append("initials")
+        return self.first_name[0] + self.last_name[0]
+
+
+class BookModel(pydantic.BaseModel):
+    title: str
+    author: AuthorModel
+
+
+registry = Registry(PydanticObjectType)
+
+
+class Author(PydanticObjectType):
+    class Meta:
+        model = AuthorModel
+        registry = registry
+        memoized_fields = ("full_name", "last_name", "popularity")
+        computed_fields = True
+
+    popularity = graphene.Int()
+
+    @staticmethod
+    def resolve_last_name(parent, info):
+        calls.append("last_name")
+        return parent.last_name
+
+    @staticmethod
+    def resolve_popularity(parent, info):
+        calls.append("popularity")
+        return 3
+
+
+class Book(PydanticObjectType):
+    class Meta:
+        model = BookModel
+        registry = registry
+
+
+class Query(graphene.ObjectType):
+    books = graphene.List(Book)
+
+    @staticmethod
+    def resolve_books(parent, info):
+        author = AuthorModel(first_name="Ursula", last_name="Le Guin")
+        return [BookModel(title=t, author=author) for t in ("Tehanu", "Lathe")]
+
+
+schema = graphene.Schema(query=Query)
+
+QUERY = "{ books { author { fullName lastName initials popularity } } }"
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+
+
+def test_computed_fields():
+    assert Author._meta.fields["full_name"].description == "The author's full name"
+    assert isinstance(Author._meta.fields["full_name"].type, graphene.NonNull)
+    assert Author._meta.fields["initials"].type is graphene.String
+
+
+def test_computed_fields_are_opt_in():
+    class WriterModel(pydantic.BaseModel):
+        name: str
+
+        @pydantic.computed_field
+        @property
+        def pen(self) -> T.Callable[[], None]:
+            return print
+
+    class Writer(PydanticObjectType):
+        class Meta:
+            model = WriterModel
+            registry = Registry(PydanticObjectType)
+
+    assert list(Writer._meta.fields) == ["name"]
+
+
+def test_memoized_fields():
+    result = schema.execute(QUERY, context_value={})
+    assert result.errors is None
+    assert result.data["books"][0] == {
+        "author": {
+            "fullName": "Ursula Le Guin",
+            "lastName": "Le Guin",
+            "initials": "UL",
+            "popularity": 3,
+        }
+    }
+    assert result.data["books"][1] == result.data["books"][0]
+    # only the fields that weren't memoized ran more than once
+    assert sorted(calls) == [
+        "full_name",
+        "initials",
+        "initials",
+        "last_name",
+        "popularity",
+    ]
+
+
+def test_memoized_fields_per_request():
+    schema.execute(QUERY, context_value=SimpleNamespace())
+    schema.execute(QUERY, context_value=SimpleNamespace())
+    assert calls.count("full_name") == 2
+
+
+def test_no_memoization_without_context():
+    result = schema.execute(QUERY)
+    assert result.errors is None
+    assert calls.count("full_name") == 2
+
+
+def test_get_request_cache():
+    context = {}
+    assert get_request_cache(context) is context[REQUEST_CACHE_KEY]
+    assert get_request_cache(None) is None
+    assert get_request_cache(object()) is None
+
+
+def test_memoize_unknown_field():
+    with pytest.raises(ValueError, match="Can't memoize"):
+
+        class Bad(PydanticObjectType):
+            class Meta:
+                model = AuthorModel
+                registry = Registry(PydanticObjectType)
+                memoized_fields = ("nope",)
@@ -0,0 +1,161 @@
+import typing as T
+
+import graphene
+import pydantic
+import pytest
+
+from graphene_pydantic import (
+    PydanticInputObjectType,
+    PydanticMutation,
+    PydanticObjectType,
+)
+from graphene_pydantic.registry import Registry
+
+
+class AddressModel(pydantic.BaseModel):
+    street: str
+    city: str = "Paris"
+
+
+class UserCreateModel(pydantic.BaseModel):
+    name: str
+    age: pydantic.PositiveInt = 18
+    nickname: T.Optional[str] = None
+    address: T.Optional[AddressModel] = None
+
+
+class UserModel(pydantic.BaseModel):
+    id: int
+    name: str
+    age: int
+    nickname: T.Optional[str] = None
+    set_fields: T.List[str]
+
+
+input_registry = Registry(PydanticInputObjectType)
+output_registry = Registry(PydanticObjectType)
+
+
+class CreateUser(PydanticMutation):
+    class Meta:
+        input_model = UserCreateModel
+        output_model = UserModel
+        input_registry = input_registry
+        output_registry = output_registry
+
+    @staticmethod
+    def mutate(root, info, data: UserCreateModel) -> UserModel:
+        assert isinstance(data, UserCreateModel)
+        return UserModel(
+            id=1,
+            name=data.name,
+            age=data.age,
+            nickname=data.nickname,
+            set_fields=sorted(data.model_fields_set),
+        )
+
+
+class Query(graphene.ObjectType):
+    ok = graphene.Boolean()
+
+
+class Mutation(graphene.ObjectType):
+    create_user = CreateUser.Field()
+
+
+schema = graphene.Schema(query=Query, mutation=Mutation)
+
+
+def test_mutation_types():
+    assert CreateUser._meta.output is output_registry.get_type_for_model(UserModel)
+    assert CreateUser._meta.input_model is UserCreateModel
+    assert set(CreateUser._meta.arguments) == {"name", "age", "nickname", "address"}
+    field = schema.graphql_schema.mutation_type.fields["createUser"]
+    assert str(field.args["name"].type) == "String!"
+    assert str(field.args["address"].type) == "AddressModelInput"
+    assert str(field.type) == "UserModel"
+
+
+def test_mutation_validates_sent_arguments():
+    result = schema.execute(
+        'mutation { createUser(name: "Ann", address: {street: "Main"}) '
+        "{ id name age nickname setFields } }"
+    )
+    assert result.errors is None
+    assert result.data == {
+        "createUser": {
+            "id": 1,
+            "name": "Ann",
+            "age": 18,
+            "nickname": None,
+            "setFields": ["address", "name"],
+        }
+    }
+
+
+def test_mutation_nested_input():
+    seen = []
+
+    class SaveAddress(PydanticMutation):
+        class Meta:
+            input_model = UserCreateModel
+            input_registry = input_registry
+            output = graphene.String
+
+        @staticmethod
+        def mutate(root, info, data):
+            seen.append(data)
+            return data.address.city
+
+    class Mutation(graphene.ObjectType):
+        save_address = SaveAddress.Field()
+
+    result = graphene.Schema(query=Query, mutation=Mutation).execute(
+        'mutation { saveAddress(name: "Ann", address: {street: "Main"}) }'
+    )
+    assert result.data == {"saveAddress": "Paris"}
+    (data,) = seen
+    assert data.address == AddressModel(street="Main")
+    assert data.address.model_fields_set == {"street"}
+
+
+def test_mutation_validation_errors():
+    result = schema.execute('mutation { createUser(name: "Ann", age: -1) { id } }')
+    assert result.data == {"createUser": None}
+    (error,) = result.errors
+    assert error.message == "1 validation error for UserCreateModel"
+    assert error.extensions == {
+        "validationErrors": [
+            {
+                "type": "greater_than",
+                "loc": ("age",),
+                "msg": "Input should be greater than 0",
+            }
+        ]
+    }
+
+
+def test_mutation_needs_input_model():
+    with pytest.raises(AssertionError, match="valid Pydantic model as input_model"):
+
+        class Broken(PydanticMutation):
+            class Meta:
+                output = graphene.String
+
+            @staticmethod
+            def mutate(root, info, data):
+                return None
+
+
+def test_mutation_output_options():
+    with pytest.raises(ValueError, match="'output_model' and 'output'"):
+
+        class Broken(PydanticMutation):
+            class Meta:
+                input_model = UserCreateModel
+                output_model = UserModel
+                output = graphene.String
+
+            @staticmethod
+            def mutate(root, info, data):
+                return None
@@ -1,7 +1,7 @@
 import typing as T
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, create_model
 
 from graphene_pydantic.objecttype import PydanticObjectType
 
@@ -47,3 +47,73 @@ def test_object_type_onlyandexclude():
                 model = Foo
                 only_fields = ("name",)
                 exclude_fields = ("size",)
+
+
+def test_object_type_shares_inherited_fields(monkeypatch):
+    import graphene_pydantic.objecttype as objecttype
+    from graphene_pydantic.registry import Registry
+
+    conversions = []
+    convert = objecttype.convert_pydantic_field
+
+    def counting_convert(name, *args, **kwargs):
+        conversions.append(name)
+        return convert(name, *args, **kwargs)
+
+    monkeypatch.setattr(objecttype, "convert_pydantic_field", counting_convert)
+    types_registry = Registry(PydanticObjectType)
+
+    Base = create_model("Base", **{f"field{i}": (int, ...) for i in range(40)})
+
+    class GraphBase(PydanticObjectType):
+        class Meta:
+            model = Base
+            registry = types_registry
+
+    subclasses = []
+    for i in range(10):
+        sub = create_model(f"Sub{i}", __base__=Base, extra=(str, ...))
+
+        class GraphSub(PydanticObjectType):
+            class Meta:
+                model = sub
+                registry = types_registry
+                name = f"GraphSub{i}"
+
+        subclasses.append(GraphSub)
+
+    # each unique field is converted once, no matter how many subclasses
+    assert len(conversions) == 40 + 10
+    for sub in subclasses:
+        assert sub._meta.fields["field0"] is GraphBase._meta.fields["field0"]
+        assert sub._meta.fields["extra"] is not None
+
+
+def test_object_type_does_not_share_changed_fields():
+    from graphene_pydantic.registry import Registry
+
+    types_registry = Registry(PydanticObjectType)
+
+    class Base(BaseModel):
+        name: str
+        size: int
+
+    class Sub(Base):
+        name: T.Optional[str] = None
+
+    class GraphBase(PydanticObjectType):
+        class Meta:
+            model = Base
+            registry = types_registry
+
+    class GraphSub(PydanticObjectType):
+        class Meta:
+            model = Sub
+            registry = types_registry
+
+        @staticmethod
+        def resolve_size(parent, info):
+            return 0
+
+    assert GraphSub._meta.fields["name"] is not GraphBase._meta.fields["name"]
+    assert GraphSub._meta.fields["size"] is not GraphBase._meta.fields["size"]
@@ -0,0 +1,98 @@
+import asyncio
+import typing as T
+
+import graphene
+import pydantic
+import pytest
+
+from graphene_pydantic import PydanticObjectType
+from graphene_pydantic.profiling import SamplingProfiler
+from graphene_pydantic.registry import Registry
+
+
+class PetModel(pydantic.BaseModel):
+    name: str
+
+
+class OwnerModel(pydantic.BaseModel):
+    name: str
+    pets: T.List[PetModel]
+
+
+registry = Registry(PydanticObjectType)
+
+
+class Pet(PydanticObjectType):
+    class Meta:
+        model = PetModel
+        registry = registry
+
+
+class Owner(PydanticObjectType):
+    class Meta:
+        model = OwnerModel
+        registry = registry
+
+
+class Query(graphene.ObjectType):
+    owners = graphene.List(Owner)
+    count = graphene.Int()
+
+    @staticmethod
+    def resolve_owners(parent, info):
+        return [
+            OwnerModel(name="Ann", pets=[PetModel(name="Tom"), PetModel(name="Rex")])
+        ]
+
+    @staticmethod
+    async def resolve_count(parent, info):
+        await asyncio.sleep(0)
+        return 1
+
+
+schema = graphene.Schema(query=Query)
+
+
+def test_sampling_profiler():
+    profiler = SamplingProfiler(rate=1)
+    result = schema.execute(
+        "{ owners { name pets { name } } }", middleware=profiler.sample()
+    )
+    assert result.errors is None
+    stats = profiler.stats()
+    assert set(stats) == {
+        ("Query.owners",),
+        ("Query.owners", "Owner.name"),
+        ("Query.owners", "Owner.pets"),
+        ("Query.owners", "Owner.pets", "Pet.name"),
+    }
+    assert stats[("Query.owners", "Owner.pets", "Pet.name")].count == 2
+    lines = profiler.folded(weight="count").splitlines()
+    assert lines[-1] == "Query.owners;Owner.pets;Pet.name 2"
+    assert all(
+        line.rsplit(" ", 1)[1].isdigit() for line in profiler.folded().splitlines()
+    )
+
+    profiler.reset()
+    assert profiler.stats() == {}
+
+
+def test_sampling_rate():
+    samples = iter([0.5, 0.05])
+    profiler = SamplingProfiler(rate=0.1, random_source=lambda: next(samples))
+    assert profiler.sample() is None
+    assert profiler.sample() == [profiler]
+    with pytest.raises(ValueError):
+        SamplingProfiler(rate=2)
+
+
+def test_async_resolvers(tmp_path):
+    profiler = SamplingProfiler(rate=1)
+    result = asyncio.run(
+        schema.execute_async("{ count }", middleware=profiler.sample())
+    )
+    assert result.data == {"count": 1}
+    assert profiler.stats()[("Query.count",)].count == 1
+    path = tmp_path / "profile.folded"
+    profiler.write_folded(str(path), weight="count")
+    assert path.read_text() == "Query.count 1\n"
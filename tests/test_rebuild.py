@@ -0,0 +1,194 @@
+import graphene
+import pydantic
+
+from graphene_pydantic import PydanticObjectType
+from graphene_pydantic.registry import Placeholder, Registry
+from graphene_pydantic.schema import rebuild_schema
+
+
+def _make_types(types_registry):
+    class FooModel(pydantic.BaseModel):
+        name: str
+
+    class BarModel(pydantic.BaseModel):
+        foo: FooModel
+
+    class BazModel(pydantic.BaseModel):
+        count: int
+
+    class Foo(PydanticObjectType):
+        class Meta:
+            model = FooModel
+            registry = types_registry
+
+    class Bar(PydanticObjectType):
+        class Meta:
+            model = BarModel
+            registry = types_registry
+
+        extra = graphene.String()
+
+    class Baz(PydanticObjectType):
+        class Meta:
+            model = BazModel
+            registry = types_registry
+
+    return Foo, Bar, Baz
+
+
+def _new_foo_model(**fields):
+    # Same module and qualified name as the FooModel above, as if its module
+    # had been reloaded
+    model = pydantic.create_model("FooModel", name=(str, ...), **fields)
+    model.__module__ = __name__
+    model.__qualname__ = "_make_types.<locals>.FooModel"
+    return model
+
+
+def test_rebuild_nothing_changed():
+    registry = Registry(PydanticObjectType)
+    _make_types(registry)
+    registry.rebuild()
+    assert registry.rebuild() == []
+
+
+def test_rebuild_changed_model_and_dependents():
+    registry = Registry(PydanticObjectType)
+    Foo, Bar, Baz = _make_types(registry)
+    registry.rebuild()
+    baz_field = Baz._meta.fields["count"]
+
+    NewFooModel = _new_foo_model(size=(int, 0))
+    assert set(registry.rebuild([NewFooModel])) == {Foo, Bar}
+
+    assert Foo._meta.model is NewFooModel
+    assert list(Foo._meta.fields) == ["name", "size"]
+    # fields declared on the class itself are kept
+    assert list(Bar._meta.fields) == ["foo", "extra"]
+    assert Baz._meta.fields["count"] is baz_field
+    assert registry.get_type_for_model(NewFooModel) is Foo
+    assert registry.rebuild([NewFooModel]) == []
+
+
+def test_rebuild_unchanged_reloaded_model():
+    registry = Registry(PydanticObjectType)
+    Foo, Bar, Baz = _make_types(registry)
+    registry.rebuild()
+
+    NewFooModel = _new_foo_model()
+    assert registry.rebuild([NewFooModel]) == []
+    assert Foo._meta.model is NewFooModel
+    assert Foo.is_type_of(NewFooModel(name="x"), None)
+
+
+def test_rebuild_changed_default():
+    registry = Registry(PydanticObjectType)
+    Foo, Bar, Baz = _make_types(registry)
+    registry.rebuild()
+    registry.rebuild([_new_foo_model(size=(int, 1))])
+
+    NewFooModel = _new_foo_model(size=(int, 2))
+    assert Foo in registry.rebuild([NewFooModel])
+    assert Foo._meta.model is NewFooModel
+
+
+def test_rebuild_resolves_placeholders():
+    registry = types_registry = Registry(PydanticObjectType)
+
+    class FooModel(pydantic.BaseModel):
+        name: str
+
+    class BarModel(pydantic.BaseModel):
+        foo: FooModel
+
+    class Bar(PydanticObjectType):
+        class Meta:
+            model = BarModel
+            registry = types_registry
+
+    assert isinstance(Bar._meta.fields["foo"].type.of_type, Placeholder)
+
+    class Foo(PydanticObjectType):
+        class Meta:
+            model = FooModel
+            registry = types_registry
+
+    assert registry.rebuild() == []
+    assert Bar._meta.fields["foo"].type.of_type is Foo
+
+
+def test_rebuild_schema():
+    registry = Registry(PydanticObjectType)
+    Foo, Bar, Baz = _make_types(registry)
+
+    class Query(graphene.ObjectType):
+        foo = graphene.Field(Foo)
+
+        @staticmethod
+        def resolve_foo(parent, info):
+            return Foo._meta.model(name="foo", size=3)
+
+    schema = graphene.Schema(query=Query)
+    NewFooModel = _new_foo_model(size=(int, 0))
+    schema = rebuild_schema(schema, [NewFooModel], registries=[registry])
+
+    result = schema.execute("query { foo { name size } }")
+    assert result.errors is None
+    assert result.data == {"foo": {"name": "foo", "size": 3}}
+
+
+def _person_models(name_field: str):
+    person = pydantic.create_model("PersonModel", **{name_field: (str, ...)})
+    employee = pydantic.create_model("EmployeeModel", __base__=person, salary=(int, 0))
+    for model in (person, employee):
+        model.__module__ = __name__
+        model.__qualname__ = f"test_rebuild_interfaces.<locals>.{model.__name__}"
+    return person, employee
+
+
+def test_rebuild_interfaces():
+    registry = types_registry = Registry(PydanticObjectType)
+    PersonModel, EmployeeModel = _person_models("name")
+
+    class PersonT(PydanticObjectType):
+        class Meta:
+            model = PersonModel
+            registry = types_registry
+
+    class EmployeeT(PydanticObjectType):
+        class Meta:
+            model = EmployeeModel
+            registry = types_registry
+            model_interfaces = True
+
+    (PersonInterface,) = EmployeeT._meta.interfaces
+    people = []
+
+    class Query(graphene.ObjectType):
+        people = graphene.List(PersonInterface)
+
+        @staticmethod
+        def resolve_people(parent, info):
+            return people
+
+    schema = graphene.Schema(query=Query, types=[EmployeeT, PersonT])
+    NewPersonModel, NewEmployeeModel = _person_models("full_name")
+    schema = rebuild_schema(
+        schema,
+        [NewEmployeeModel, NewPersonModel],
+        registries=[registry],
+        types=[EmployeeT, PersonT],
+    )
+
+    assert PersonInterface._meta.model is NewPersonModel
+    assert list(PersonInterface._meta.fields) == ["full_name"]
+    assert registry.get_interface_for_model(NewPersonModel) is PersonInterface
+    people.append(NewEmployeeModel(full_name="Ann", salary=3))
+    result = schema.execute(
+        "{ people { __typename fullName ... on EmployeeT { salary } } }"
+    )
+    assert result.errors is None
+    assert result.data == {
+        "people": [{"__typename": "EmployeeT", "fullName": "Ann", "salary": 3}]
+    }
+    assert registry.rebuild([NewEmployeeModel, NewPersonModel]) == []
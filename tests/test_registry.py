@@ -1,14 +1,24 @@
+import enum
+import typing as T
+
+import graphene
 import pytest
 from pydantic import BaseModel
 
 import graphene_pydantic.registry as registry
-from graphene_pydantic import PydanticInputObjectType, PydanticObjectType
+from graphene_pydantic import (
+    PydanticInputObjectType,
+    PydanticInterface,
+    PydanticObjectType,
+    register_models,
+)
 from graphene_pydantic.registry import (
     Registry,
     assert_is_correct_type,
     get_global_registry,
     reset_global_registry,
 )
+from graphene_pydantic.schema import build_schema
 
 
 def _get_dummy_classes():
@@ -58,3 +68,109 @@ def test_register_object_field_and_get_for_graphene_field():
     field = r.get_object_field_for_graphene_field(GraphFoo, "name")
     assert field is not None
     assert field.annotation == str
+
+
+def test_overlay_registry():
+    class Color(enum.Enum):
+        RED = "red"
+
+    class Cat(BaseModel):
+        lives: int = 9
+
+    class Dog(BaseModel):
+        good: bool = True
+
+    class Bar(BaseModel):
+        color: Color
+        pet: T.Union[Cat, Dog, None] = None
+
+    class Baz(BaseModel):
+        bar: Bar
+        color: T.Optional[Color] = None
+        pet: T.Union[Cat, Dog, None] = None
+
+    parent = Registry(PydanticObjectType, mapping_roots=True)
+    parent_types = register_models([Baz], registry=parent)
+
+    child = Registry(PydanticObjectType, parent=parent)
+    assert child.mapping_roots
+    assert child.get_type_for_model(Bar) is parent_types[Bar]
+
+    class ChildBaz(PydanticObjectType):
+        class Meta:
+            model = Baz
+            registry = child
+            name = "Baz"
+
+    # the child's own types take precedence, and the parent's are used for the rest
+    assert child.get_type_for_model(Baz) is ChildBaz
+    assert parent.get_type_for_model(Baz) is parent_types[Baz]
+    fields = ChildBaz._meta.fields
+    assert fields["bar"].type.of_type is parent_types[Bar]
+    # as are its enums and unions
+    bar_fields = parent_types[Bar]._meta.fields
+    assert fields["color"].type is bar_fields["color"].type.of_type
+    assert fields["pet"].type is bar_fields["pet"].type
+    assert child.get_object_field_for_graphene_field(parent_types[Bar], "color")
+
+    schema, pruned = build_schema(query=_query(ChildBaz), registries=[child])
+    assert pruned == [parent_types[Baz]]
+    assert str(schema).count("type Baz") == 1
+
+    with pytest.raises(TypeError):
+        Registry(PydanticInputObjectType, parent=parent)
+
+
+def test_overlay_registry_interface_implementations():
+    class AnimalModel(BaseModel):
+        name: str
+
+    class DogModel(AnimalModel):
+        good: bool = True
+
+    parent = Registry(PydanticObjectType)
+
+    class Animal(PydanticInterface):
+        class Meta:
+            model = AnimalModel
+            registry = parent
+
+    class Dog(PydanticObjectType):
+        class Meta:
+            model = DogModel
+            registry = parent
+            interfaces = (Animal,)
+
+    def animal_schema(*types):
+        class Query(graphene.ObjectType):
+            animal = graphene.Field(Animal)
+
+            @staticmethod
+            def resolve_animal(parent, info):
+                return DogModel(name="Rex")
+
+        return graphene.Schema(query=Query, types=list(types))
+
+    query = "{ animal { __typename name } }"
+    parent_schema = animal_schema(Dog)
+    assert parent_schema.execute(query).data["animal"]["__typename"] == "Dog"
+
+    child = Registry(PydanticObjectType, parent=parent)
+
+    class DogV2(PydanticObjectType):
+        class Meta:
+            model = DogModel
+            registry = child
+            interfaces = (Animal,)
+
+    # the child's type doesn't replace the parent's in the parent's schema
+    result = parent_schema.execute(query)
+    assert result.errors is None
+    assert result.data["animal"]["__typename"] == "Dog"
+    result = animal_schema(DogV2).execute(query)
+    assert result.errors is None
+    assert result.data["animal"]["__typename"] == "DogV2"
+
+
+def _query(obj_type):
+    return type("Query", (graphene.ObjectType,), {"baz": graphene.Field(obj_type)})
@@ -0,0 +1,169 @@
+import enum
+import json
+import typing as T
+
+import graphene
+import pydantic
+from graphql import parse
+
+from graphene_pydantic import PydanticObjectType
+from graphene_pydantic.registry import Registry
+from graphene_pydantic.serialization import (
+    RawJSON,
+    dumps_result,
+    execute_to_json,
+    get_serializer,
+)
+
+
+class Kind(enum.Enum):
+    CAT = "cat"
+    DOG = "dog"
+
+
+class PetModel(pydantic.BaseModel):
+    name: str
+    kind: Kind
+    age: T.Optional[int] = None
+    weight: float = 1.5
+
+
+class OwnerModel(pydantic.BaseModel):
+    first_name: str
+    pets: T.List[PetModel]
+    nickname: str = None
+
+
+registry = Registry(PydanticObjectType)
+
+
+class Pet(PydanticObjectType):
+    class Meta:
+        model = PetModel
+        registry = registry
+
+
+class Owner(PydanticObjectType):
+    class Meta:
+        model = OwnerModel
+        registry = registry
+
+    pet_count = graphene.Int()
+
+    @staticmethod
+    def resolve_pet_count(parent, info):
+        return len(parent.pets)
+
+
+OWNERS = [
+    OwnerModel(
+        first_name="Ann",
+        pets=[PetModel(name="Tom", kind=Kind.CAT, age=3)],
+        nickname="A",
+    ),
+    OwnerModel(first_name="Bob", pets=[PetModel(name="Rex", kind=Kind.DOG)]),
+]
+
+
+class Query(graphene.ObjectType):
+    owners = graphene.List(Owner)
+    pet = graphene.Field(Pet)
+
+    @staticmethod
+    def resolve_owners(parent, info):
+        return OWNERS
+
+    @staticmethod
+    def resolve_pet(parent, info):
+        return {"name": "Not a model"}
+
+
+schema = graphene.Schema(query=Query)
+
+
+def _compare(query):
+    expected = json.dumps(schema.execute(query).formatted, separators=(",", ":"))
+    result = execute_to_json(schema, query)
+    assert result.decode() == expected
+    return json.loads(result)
+
+
+def test_direct_serialization():
+    result = _compare(
+        """
+        query {
+            owners {
+                firstName
+                pets { ...PetFields years: age }
+            }
+        }
+        fragment PetFields on Pet { __typename kind name weight }
+        """
+    )
+    assert result["data"]["owners"][0] == {
+        "firstName": "Ann",
+        "pets": [
+            {
+                "__typename": "Pet",
+                "kind": "CAT",
+                "name": "Tom",
+                "weight": 1.5,
+                "years": 3,
+            }
+        ],
+    }
+
+
+def test_serializer_for_list():
+    document = parse("{ owners { pets { name age } } }")
+    (owners_node,) = document.definitions[0].selection_set.selections
+    (pets_node,) = owners_node.selection_set.selections
+    pets_type = schema.graphql_schema.get_type("Owner").fields["pets"].type.of_type
+    serializer = get_serializer(schema.graphql_schema, pets_type, [pets_node], {})
+    assert serializer.to_json(OWNERS[0].pets) == b'[{"name":"Tom","age":3}]'
+    # the same selection reuses the same serializer
+    assert (
+        get_serializer(schema.graphql_schema, pets_type, [pets_node], {}) is serializer
+    )
+
+
+def test_fallbacks():
+    # custom resolvers are resolved as usual, but the objects they return can
+    # still be serialized directly
+    _compare("{ owners { petCount pets { name } } }")
+    # a default of None on a non-null field isn't validated by Pydantic
+    _compare("{ owners { nickname } }")
+    # nor are objects that aren't models
+    result = _compare("{ pet { name } }")
+    assert result["errors"]
+
+
+def test_selection_order_whatever_the_dict_order():
+    pet = PetModel(name="Tom", kind=Kind.CAT, age=3)
+    # e.g. a model constructed without validation
+    object.__setattr__(pet, "__dict__", dict(reversed(pet.__dict__.items())))
+
+    class PetQuery(graphene.ObjectType):
+        pet = graphene.Field(Pet)
+
+        @staticmethod
+        def resolve_pet(parent, info):
+            return pet
+
+    pet_schema = graphene.Schema(query=PetQuery)
+    query = "{ pet { name kind age weight } }"
+    result = execute_to_json(pet_schema, query)
+    assert (
+        result == b'{"data":{"pet":{"name":"Tom","kind":"CAT","age":3,"weight":1.5}}}'
+    )
+
+
+def test_dumps_result():
+    result = schema.execute("{ owners { firstName } }")
+    result.data["extra"] = RawJSON(b'{"a":[1,2]}')
+    assert json.loads(dumps_result(result)) == {
+        "data": {
+            "owners": [{"firstName": "Ann"}, {"firstName": "Bob"}],
+            "extra": {"a": [1, 2]},
+        }
+    }
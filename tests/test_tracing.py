@@ -0,0 +1,173 @@
+import asyncio
+import json
+import typing as T
+
+import graphene
+import pydantic
+import pytest
+
+from graphene_pydantic import PydanticObjectType
+from graphene_pydantic.registry import Registry
+from graphene_pydantic.tracing import (
+    FileExporter,
+    InMemoryExporter,
+    TracingMiddleware,
+    set_exporter,
+    span,
+)
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemoryExporter()
+    previous = set_exporter(exporter)
+    yield exporter
+    set_exporter(previous)
+
+
+class PetModel(pydantic.BaseModel):
+    name: str
+
+
+class OwnerModel(pydantic.BaseModel):
+    name: str
+    pets: T.List[PetModel]
+
+
+def test_conversion_spans(exporter):
+    registry = Registry(PydanticObjectType)
+
+    with span("setup") as setup_id:
+
+        class Owner(PydanticObjectType):
+            class Meta:
+                model = OwnerModel
+                registry = registry
+
+        class Pet(PydanticObjectType):
+            class Meta:
+                model = PetModel
+                registry = registry
+
+        Owner.resolve_placeholders()
+
+    spans = {(s.name, s.attributes.get("type")): s for s in exporter.spans}
+    construct = spans["graphene_pydantic.construct_fields", "Owner"]
+    assert construct.attributes == {"type": "Owner", "model": "OwnerModel"}
+    assert construct.parent_id == setup_id
+    assert construct.end_ns >= construct.start_ns
+    assert spans["graphene_pydantic.construct_fields", "Pet"].parent_id == setup_id
+    resolve = spans["graphene_pydantic.resolve_placeholders", "Owner"]
+    assert resolve.parent_id == setup_id
+    assert spans["setup", None].parent_id is None
+
+
+def test_no_spans_without_exporter():
+    exporter = InMemoryExporter()
+    with span("outer") as span_id:
+        pass
+    assert span_id is None
+    assert exporter.spans == []
+
+
+registry = Registry(PydanticObjectType)
+
+
+class Pet(PydanticObjectType):
+    class Meta:
+        model = PetModel
+        registry = registry
+
+
+class Owner(PydanticObjectType):
+    class Meta:
+        model = OwnerModel
+        registry = registry
+
+
+class Query(graphene.ObjectType):
+    owners = graphene.List(Owner)
+    count = graphene.Int()
+
+    @staticmethod
+    def resolve_owners(parent, info):
+        return [OwnerModel(name="Ann", pets=[PetModel(name="Tom")])]
+
+    @staticmethod
+    async def resolve_count(parent, info):
+        await asyncio.sleep(0)
+        return 1
+
+
+schema = graphene.Schema(query=Query)
+
+
+def test_tracing_middleware_depth():
+    exporter = InMemoryExporter()
+    middleware = TracingMiddleware(max_depth=2, exporter=exporter)
+    result = schema.execute(
+        "{ owners { name pets { name } } }", middleware=[middleware]
+    )
+    assert result.errors is None
+    spans = {s.attributes["path"]: s.attributes for s in exporter.spans}
+    assert spans == {
+        "owners": {
+            "field": "Query.owners",
+            "path": "owners",
+            "depth": 1,
+            "default_resolver": False,
+        },
+        "owners.0.name": {
+            "field": "Owner.name",
+            "path": "owners.0.name",
+            "depth": 2,
+            "default_resolver": True,
+        },
+        "owners.0.pets": {
+            "field": "Owner.pets",
+            "path": "owners.0.pets",
+            "depth": 2,
+            "default_resolver": True,
+        },
+    }
+
+
+def test_tracing_middleware_duration():
+    exporter = InMemoryExporter()
+    middleware = TracingMiddleware(max_depth=0, min_duration_ns=0, exporter=exporter)
+    schema.execute("{ owners { pets { name } } }", middleware=[middleware])
+    assert len(exporter.spans) == 3
+
+    exporter.clear()
+    middleware.min_duration_ns = 10**12
+    schema.execute("{ owners { pets { name } } }", middleware=[middleware])
+    assert exporter.spans == []
+
+
+def test_tracing_middleware_async(exporter):
+    async def run():
+        return await schema.execute_async("{ count }", middleware=[TracingMiddleware()])
+
+    result = asyncio.run(run())
+    assert result.data == {"count": 1}
+    (traced,) = exporter.spans
+    assert traced.attributes["field"] == "Query.count"
+
+
+def test_file_exporter(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    exporter = FileExporter(str(path))
+    previous = set_exporter(exporter)
+    try:
+        with span("outer", model="OwnerModel") as outer_id:
+            with span("inner"):
+                pass
+    finally:
+        set_exporter(previous)
+        exporter.shutdown()
+
+    inner, outer = [json.loads(line) for line in path.read_text().splitlines()]
+    assert inner["name"] == "inner"
+    assert inner["parent_id"] == outer_id
+    assert outer["attributes"] == {"model": "OwnerModel"}
+    assert outer["start_ns"] <= inner["start_ns"] <= inner["end_ns"] <= outer["end_ns"]